@@ -10,12 +10,14 @@ from gui.components.ctk_components import (
     CTkIconButton,
     CTkSidebar,
     CTkStatusBar,
+    CTkToast,
     CTkTopBar,
     CTkPreviewPanel,
 )
 from gui.components.workspace_tabs import (
     WorkspaceTab,
     WorkspaceTabsContainer,
+    WorkspaceTabsTreeview,
 )
 from gui.components.split_view import (
     SplitView,
@@ -66,10 +68,12 @@ __all__ = [
     "CTkIconButton",
     "CTkSidebar",
     "CTkStatusBar",
+    "CTkToast",
     "CTkTopBar",
     "CTkPreviewPanel",
     "WorkspaceTab",
     "WorkspaceTabsContainer",
+    "WorkspaceTabsTreeview",
     "SplitView",
     "SplitViewPanel",
     "BatchPreviewPanel",
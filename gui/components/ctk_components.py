@@ -279,10 +279,14 @@ class CTkStatusBar(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self.configure(height=30)
 
+        # Labels follow these vars; set() is cheaper than configure(text=...)
+        self._status_var = ctk.StringVar(self, value="Ready")
+        self._progress_var = ctk.StringVar(self, value="")
+
         # Left side - status messages
         self.status_label = ctk.CTkLabel(
             self,
-            text="Ready",
+            textvariable=self._status_var,
             anchor="w",
         )
         self.status_label.pack(side="left", padx=10, pady=5)
@@ -293,7 +297,7 @@ class CTkStatusBar(ctk.CTkFrame):
 
         self.progress_label = ctk.CTkLabel(
             self.info_frame,
-            text="",
+            textvariable=self._progress_var,
             width=100,
         )
         self.progress_label.pack(side="left", padx=5)
@@ -305,7 +309,7 @@ class CTkStatusBar(ctk.CTkFrame):
         Args:
             text: Status text
         """
-        self.status_label.configure(text=text)
+        self._status_var.set(text)
 
     def set_progress(self, text: str) -> None:
         """
@@ -314,7 +318,41 @@ class CTkStatusBar(ctk.CTkFrame):
         Args:
             text: Progress text
         """
-        self.progress_label.configure(text=text)
+        self._progress_var.set(text)
+
+
+class CTkToast(ctk.CTkLabel):
+    """Non-blocking status message that clears itself after a delay."""
+
+    COLORS = {
+        "info": "green",
+        "warning": "orange",
+        "error": "red",
+    }
+
+    def __init__(self, master: Any, **kwargs) -> None:
+        """Initialize toast label."""
+        super().__init__(master, text="", **kwargs)
+        self._clear_after_id: Optional[str] = None
+
+    def show(self, message: str, kind: str = "info", duration_ms: int = 3000) -> None:
+        """
+        Show a message.
+        
+        Args:
+            message: Message text
+            kind: One of "info", "warning" or "error"
+            duration_ms: Time before the message is cleared
+        """
+        if self._clear_after_id is not None:
+            self.after_cancel(self._clear_after_id)
+        self.configure(text=message, text_color=self.COLORS.get(kind, self.COLORS["info"]))
+        self._clear_after_id = self.after(duration_ms, self._clear)
+
+    def _clear(self) -> None:
+        """Clear the message."""
+        self._clear_after_id = None
+        self.configure(text="")
 
 
 class CTkTopBar(ctk.CTkFrame):
@@ -189,6 +189,13 @@ class PDFViewer(ctk.CTkFrame):
         self.zoom_label.configure(text=f"{int(self.zoom_level * 100)}%")
         self._render_page()
 
+    def close(self) -> None:
+        """Close the PDF document and drop rendered pages."""
+        if self.doc:
+            self.doc.close()
+            self.doc = None
+        self.page_images = []
+
 
 class DOCXViewer(ctk.CTkFrame):
     """DOCX viewer using python-docx."""
@@ -148,6 +148,7 @@ class ExportPreviewPanel(ctk.CTkFrame):
             **kwargs: Additional CTkFrame arguments
         """
         super().__init__(master, **kwargs)
+        self._preview_key: Optional[tuple] = None
         self._create_widgets()
 
     def _create_widgets(self) -> None:
@@ -169,6 +170,17 @@ class ExportPreviewPanel(ctk.CTkFrame):
             content: Markdown content
             metadata: Metadata
         """
+        # Skip the rebuild when the same content is previewed again
+        key = (
+            hash(content),
+            metadata.get("title"),
+            metadata.get("author"),
+            tuple(metadata.get("tags", [])),
+        )
+        if key == self._preview_key:
+            return
+        self._preview_key = key
+
         self.preview_text.delete("1.0", "end")
         preview = f"Title: {metadata.get('title', 'Untitled')}\n"
         preview += f"Author: {metadata.get('author', 'Unknown')}\n"
@@ -180,6 +192,9 @@ class ExportPreviewPanel(ctk.CTkFrame):
 class ExportHistoryPanel(ctk.CTkFrame):
     """Export history panel."""
 
+    MAX_ENTRIES = 20
+    LINES_PER_ENTRY = 4
+
     def __init__(
         self,
         master: Any,
@@ -196,6 +211,7 @@ class ExportHistoryPanel(ctk.CTkFrame):
         """
         super().__init__(master, **kwargs)
         self.export_manager = export_manager
+        self._entry_count = 0
         self._create_widgets()
         self._refresh_history()
 
@@ -237,6 +253,7 @@ class ExportHistoryPanel(ctk.CTkFrame):
     def _refresh_history(self) -> None:
         """Refresh history display."""
         self.history_listbox.delete("1.0", "end")
+        self._entry_count = 0
 
         filter_platform = self.filter_var.get()
         if filter_platform == "all":
@@ -249,14 +266,38 @@ class ExportHistoryPanel(ctk.CTkFrame):
             self.history_listbox.insert("1.0", "No export history")
             return
 
-        for entry in history[-20:]:  # Last 20
-            status_icon = "✓" if entry.status.value == "completed" else "✗"
-            self.history_listbox.insert(
-                "end",
-                f"{status_icon} {entry.platform.value}: {entry.source_file}\n"
-                f"   Destination: {entry.destination}\n"
-                f"   Date: {entry.exported_at.strftime('%Y-%m-%d %H:%M')}\n\n"
-            )
+        for entry in history[-self.MAX_ENTRIES:]:
+            self.history_listbox.insert("end", self._format_entry(entry))
+        self._entry_count = len(history[-self.MAX_ENTRIES:])
+
+    def append_history(self, entry: ExportHistory) -> None:
+        """
+        Append a single entry without repainting the whole list.
+        
+        Args:
+            entry: New export history entry
+        """
+        filter_platform = self.filter_var.get()
+        if filter_platform != "all" and entry.platform.value != filter_platform:
+            return
+
+        if self._entry_count == 0:
+            self.history_listbox.delete("1.0", "end")
+        elif self._entry_count >= self.MAX_ENTRIES:
+            self.history_listbox.delete("1.0", f"{self.LINES_PER_ENTRY + 1}.0")
+            self._entry_count -= 1
+
+        self.history_listbox.insert("end", self._format_entry(entry))
+        self._entry_count += 1
+
+    def _format_entry(self, entry: ExportHistory) -> str:
+        """Format a history entry for display."""
+        status_icon = "✓" if entry.status.value == "completed" else "✗"
+        return (
+            f"{status_icon} {entry.platform.value}: {entry.source_file}\n"
+            f"   Destination: {entry.destination}\n"
+            f"   Date: {entry.exported_at.strftime('%Y-%m-%d %H:%M')}\n\n"
+        )
 
     def _filter_history(self, platform: str) -> None:
         """Filter history by platform."""
@@ -3,6 +3,7 @@ Markdown preview component with webview rendering.
 """
 
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import messagebox
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
@@ -26,6 +27,32 @@ from gui.core.markdown_renderer import MarkdownRenderer, RenderOptions, PreviewT
 
 logger = logging.getLogger(__name__)
 
+# Delay after the last keystroke before the split view re-renders
+RENDER_DEBOUNCE_MS = 150
+
+# Editor options a peer copies so it looks like the split view's editor
+_PEER_OPTIONS = (
+    "background", "foreground", "insertbackground", "selectbackground",
+    "selectforeground", "font", "wrap", "borderwidth", "relief",
+    "highlightthickness", "padx", "pady", "undo",
+)
+
+
+class _TextPeer(tk.Text):
+    """Text widget that shares another Text widget's content (``peer create``)."""
+
+    def __init__(self, master: Any, source: tk.Text, **kwargs) -> None:
+        """
+        Create a peer of a text widget.
+        
+        Args:
+            master: Parent widget
+            source: Text widget whose content is shared
+            **kwargs: Text widget options
+        """
+        self._setup(master, {})
+        source.tk.call(source._w, "peer", "create", self._w, *self._options(kwargs))
+
 
 class MarkdownPreviewPanel(ctk.CTkFrame):
     """Markdown preview panel with HTML rendering."""
@@ -256,6 +283,7 @@ class SplitPreviewView(ctk.CTkFrame):
         self.renderer = renderer or MarkdownRenderer()
         self.on_content_change = on_content_change
         self.sync_scroll = True
+        self._render_after_id: Optional[str] = None
 
         self._create_widgets()
 
@@ -281,7 +309,7 @@ class SplitPreviewView(ctk.CTkFrame):
             font=ctk.CTkFont(family="Consolas", size=11),
         )
         self.markdown_text.pack(fill="both", expand=True, padx=5, pady=5)
-        self.markdown_text.bind("<KeyRelease>", self._on_markdown_change)
+        self.markdown_text.bind("<KeyRelease>", self._schedule_markdown_change)
         self.markdown_text.bind("<Button-1>", self._on_markdown_scroll)
 
         # Right: Preview
@@ -313,8 +341,17 @@ class SplitPreviewView(ctk.CTkFrame):
         )
         sync_checkbox.pack(side="left", padx=5)
 
+    def _schedule_markdown_change(self, event: Any = None) -> None:
+        """Re-render once typing pauses instead of on every keystroke."""
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+        self._render_after_id = self.after(RENDER_DEBOUNCE_MS, self._on_markdown_change)
+
     def _on_markdown_change(self, event: Any = None) -> None:
         """Handle markdown text change."""
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
         content = self.markdown_text.get("1.0", "end-1c")
         self.preview_panel.update_preview(content)
         
@@ -343,6 +380,25 @@ class SplitPreviewView(ctk.CTkFrame):
         self.markdown_text.insert("1.0", markdown_text)
         self._on_markdown_change()
 
+    def create_peer(self, master: Any, **kwargs) -> tk.Text:
+        """
+        Create an editor that shares this view's Markdown text.
+        
+        Edits in either widget are visible in both without copying the
+        document between them.
+        
+        Args:
+            master: Parent widget
+            **kwargs: Text widget options overriding the copied ones
+            
+        Returns:
+            Peer text widget
+        """
+        editor = self.markdown_text._textbox
+        options = {name: editor.cget(name) for name in _PEER_OPTIONS}
+        options.update(kwargs)
+        return _TextPeer(master, editor, **options)
+
     def get_content(self) -> str:
         """
         Get current markdown content.
@@ -6,6 +6,7 @@ customization, and visual indicators.
 """
 
 import customtkinter as ctk
+from tkinter import ttk
 from typing import Optional, Callable, Dict, Any, List
 from pathlib import Path
 import logging
@@ -14,6 +15,15 @@ from gui.core.workspace import WorkspaceState, WorkspaceStatus, WorkspaceManager
 
 logger = logging.getLogger(__name__)
 
+# Status indicator colors as (light, dark) pairs
+_STATUS_COLORS = {
+    WorkspaceStatus.IDLE: ("gray60", "gray40"),
+    WorkspaceStatus.PROCESSING: ("#3498DB", "#3498DB"),
+    WorkspaceStatus.SUCCESS: ("#2ECC71", "#2ECC71"),
+    WorkspaceStatus.ERROR: ("#E74C3C", "#E74C3C"),
+    WorkspaceStatus.WARNING: ("#F39C12", "#F39C12"),
+}
+
 
 class WorkspaceTab(ctk.CTkFrame):
     """Individual workspace tab with indicators."""
@@ -121,14 +131,7 @@ class WorkspaceTab(ctk.CTkFrame):
             self.configure(fg_color=("gray90", "gray10"))
 
         # Update status indicator
-        status_colors = {
-            WorkspaceStatus.IDLE: ("gray60", "gray40"),
-            WorkspaceStatus.PROCESSING: ("#3498DB", "#3498DB"),
-            WorkspaceStatus.SUCCESS: ("#2ECC71", "#2ECC71"),
-            WorkspaceStatus.ERROR: ("#E74C3C", "#E74C3C"),
-            WorkspaceStatus.WARNING: ("#F39C12", "#F39C12"),
-        }
-        color = status_colors.get(self.workspace.status, ("gray60", "gray40"))
+        color = _STATUS_COLORS.get(self.workspace.status, ("gray60", "gray40"))
         self.status_indicator.configure(fg_color=color)
 
         # Update color indicator
@@ -362,3 +365,194 @@ class WorkspaceTabsContainer(ctk.CTkFrame):
         if self.active_tab_id:
             self.set_active_tab(self.active_tab_id)
 
+
+class WorkspaceTabsTreeview(ctk.CTkFrame):
+    """
+    Workspace tabs shown as rows of a single Treeview.
+    
+    Used instead of WorkspaceTabsContainer when there are many workspaces:
+    one Treeview item per workspace is far cheaper to lay out and redraw
+    than a frame with several CTk widgets per tab. Offers the same API.
+    """
+
+    def __init__(
+        self,
+        master: Any,
+        workspace_manager: WorkspaceManager,
+        on_workspace_selected: Optional[Callable[[str], None]] = None,
+        on_workspace_closed: Optional[Callable[[str], None]] = None,
+        on_new_workspace: Optional[Callable[[], None]] = None,
+        **kwargs
+    ) -> None:
+        """
+        Initialize tabs tree.
+        
+        Args:
+            master: Parent widget
+            workspace_manager: Workspace manager instance
+            on_workspace_selected: Callback when workspace is selected
+            on_workspace_closed: Callback when workspace is closed
+            on_new_workspace: Callback for new workspace
+            **kwargs: Additional CTkFrame arguments
+        """
+        super().__init__(master, **kwargs)
+        self.workspace_manager = workspace_manager
+        self.on_workspace_selected = on_workspace_selected
+        self.on_workspace_closed = on_workspace_closed
+        self.on_new_workspace = on_new_workspace
+
+        self.active_tab_id: Optional[str] = None
+
+        self._create_widgets()
+        self._load_workspaces()
+
+    def _create_widgets(self) -> None:
+        """Create container widgets."""
+        self.tree = ttk.Treeview(self, show="tree", selectmode="browse", height=4)
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
+        scrollbar.pack(side="left", fill="y", pady=5)
+
+        dark = ctk.get_appearance_mode() == "Dark"
+        for status, colors in _STATUS_COLORS.items():
+            self.tree.tag_configure(status.value, foreground=colors[dark])
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Delete>", self._on_delete_key)
+
+        # New workspace button
+        self.new_button = ctk.CTkButton(
+            self,
+            text="+",
+            width=40,
+            height=30,
+            command=self._on_new_clicked,
+            font=ctk.CTkFont(size=20, weight="bold"),
+        )
+        self.new_button.pack(side="right", padx=5, pady=5)
+
+        # Close selected workspace button
+        self.close_button = ctk.CTkButton(
+            self,
+            text="×",
+            width=40,
+            height=30,
+            command=self._on_close_clicked,
+        )
+        self.close_button.pack(side="right", padx=(5, 0), pady=5)
+
+    def _load_workspaces(self) -> None:
+        """Load and display workspaces."""
+        for workspace in self.workspace_manager.get_workspaces_in_order():
+            self._add_tab(workspace)
+
+        # Set active tab
+        active_id = self.workspace_manager.active_workspace_id
+        if active_id:
+            self.set_active_tab(active_id)
+        else:
+            first = next(iter(self.tree.get_children()), None)
+            if first:
+                self.set_active_tab(first)
+
+    def _add_tab(self, workspace: WorkspaceState) -> None:
+        """
+        Add a row for a workspace.
+        
+        Args:
+            workspace: Workspace state
+        """
+        self.tree.insert(
+            "",
+            "end",
+            iid=workspace.workspace_id,
+            text=workspace.name,
+            tags=(workspace.status.value,),
+        )
+
+    def _on_tree_select(self, event: Any) -> None:
+        """Handle row selection."""
+        selection = self.tree.selection()
+        if not selection or selection[0] == self.active_tab_id:
+            return
+        self.set_active_tab(selection[0])
+        if self.on_workspace_selected:
+            self.on_workspace_selected(selection[0])
+
+    def _on_delete_key(self, event: Any) -> None:
+        """Close the selected workspace with the Delete key."""
+        self._on_close_clicked()
+
+    def _on_close_clicked(self) -> None:
+        """Handle close button click."""
+        if self.active_tab_id and self.on_workspace_closed:
+            self.on_workspace_closed(self.active_tab_id)
+
+    def _on_new_clicked(self) -> None:
+        """Handle new workspace button click."""
+        if self.on_new_workspace:
+            self.on_new_workspace()
+
+    def set_active_tab(self, workspace_id: str) -> None:
+        """
+        Set active tab.
+        
+        Args:
+            workspace_id: Workspace ID to activate
+        """
+        if self.tree.exists(workspace_id):
+            self.active_tab_id = workspace_id
+            if self.tree.selection() != (workspace_id,):
+                self.tree.selection_set(workspace_id)
+            self.tree.see(workspace_id)
+            self.workspace_manager.set_active_workspace(workspace_id)
+
+    def add_workspace(self, workspace: WorkspaceState) -> None:
+        """
+        Add a new workspace tab.
+        
+        Args:
+            workspace: Workspace state
+        """
+        self._add_tab(workspace)
+        self.set_active_tab(workspace.workspace_id)
+
+    def remove_workspace(self, workspace_id: str) -> None:
+        """
+        Remove a workspace tab.
+        
+        Args:
+            workspace_id: Workspace ID to remove
+        """
+        if self.tree.exists(workspace_id):
+            self.tree.delete(workspace_id)
+
+        if self.active_tab_id == workspace_id:
+            # Select another tab
+            self.active_tab_id = None
+            first = next(iter(self.tree.get_children()), None)
+            if first:
+                self.set_active_tab(first)
+
+    def update_workspace_tab(self, workspace_id: str) -> None:
+        """
+        Update a workspace tab.
+        
+        Args:
+            workspace_id: Workspace ID to update
+        """
+        workspace = self.workspace_manager.get_workspace(workspace_id)
+        if workspace and self.tree.exists(workspace_id):
+            self.tree.item(workspace_id, text=workspace.name, tags=(workspace.status.value,))
+
+    def reorder_tabs(self, new_order: List[str]) -> None:
+        """
+        Reorder tabs.
+        
+        Args:
+            new_order: List of workspace IDs in new order
+        """
+        for index, workspace_id in enumerate(new_order):
+            if self.tree.exists(workspace_id):
+                self.tree.move(workspace_id, "", index)
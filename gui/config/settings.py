@@ -5,13 +5,18 @@ This module provides a robust configuration system using Pydantic
 for validation and YAML for persistence.
 """
 
+import os
+import pickle
+import sys
 import yaml
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple, Iterator
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 import json
 
 try:
@@ -26,9 +31,102 @@ except ImportError:
     model_validator = lambda *args, **kwargs: lambda f: f
     SettingsConfigDict = dict
 
+try:
+    # libyaml's C loader and dumper are much faster than the pure-Python ones
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 logger = logging.getLogger(__name__)
 
 
+class _SettingsDumper(SafeDumper):
+    """Safe YAML dumper that writes enum members as their values."""
+
+
+_SettingsDumper.add_multi_representer(
+    Enum, lambda dumper, member: dumper.represent_data(member.value)
+)
+
+# Parsed config files, pickled: path -> (st_mtime_ns, st_size, pickled data)
+_YAML_CACHE: Dict[str, Tuple[int, int, bytes]] = {}
+
+# Formats the user config can be saved in; JSON is much faster to write
+PERSISTENCE_FORMATS = ("yaml", "json")
+
+# (path, st_mtime_ns, st_size) per config file; None for missing files
+_ConfigSignature = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML (or .json) config file, reusing the last parse while it is unchanged.
+    
+    Args:
+        path: YAML file to load
+        
+    Returns:
+        A private copy of the parsed data
+    """
+    stat = os.stat(path)
+    cached = _YAML_CACHE.get(str(path))
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        # Unpickling builds a fresh copy, much faster than copy.deepcopy
+        return pickle.loads(cached[2])
+
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".json":
+            data = json.load(f) or {}
+        else:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+    _YAML_CACHE[str(path)] = (
+        stat.st_mtime_ns,
+        stat.st_size,
+        pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+    return data
+
+
+@lru_cache(maxsize=256)
+def _split_update_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a SettingsManager.update() key into its nested path.
+    
+    Args:
+        key: "ui__theme" (keyword-argument form) or "ui.theme"
+        
+    Returns:
+        Path of keys, e.g. ("ui", "theme")
+    """
+    return tuple(key.split("__" if "__" in key else "."))
+
+
+def _flatten_i18n(i18n: Dict[str, Any]) -> Dict[Tuple[str, str], str]:
+    """
+    Index translations by (language, dotted key).
+    
+    Args:
+        i18n: Nested translations per language code
+        
+    Returns:
+        Flat index, e.g. {("en", "ui.convert_button"): "Convert"}
+    """
+    flat: Dict[Tuple[str, str], str] = {}
+    for language, strings in i18n.items():
+        if not isinstance(strings, dict):
+            continue
+        stack: List[Tuple[str, Dict[str, Any]]] = [("", strings)]
+        while stack:
+            prefix, node = stack.pop()
+            for k, value in node.items():
+                key = f"{prefix}{k}"
+                if isinstance(value, dict):
+                    stack.append((f"{key}.", value))
+                elif isinstance(value, str):
+                    flat[(language, key)] = value
+    return flat
+
+
 class Profile(str, Enum):
     """Application profiles."""
 
@@ -77,7 +175,13 @@ class FileFormat(str, Enum):
     ZIP = "zip"
 
 
-@dataclass
+# Value -> member tables for the enums read from config files; unknown
+# values fall back to the enum call so they still raise ValueError
+_PROFILE_BY_VALUE: Dict[str, Profile] = {p.value: p for p in Profile}
+_FILE_FORMAT_BY_VALUE: Dict[str, FileFormat] = {f.value: f for f in FileFormat}
+
+
+@dataclass(slots=True)
 class FileFormatConfig:
     """Configuration for a specific file format."""
 
@@ -102,8 +206,9 @@ class FileFormatConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FileFormatConfig":
         """Create from dictionary."""
+        format_value = data.get("format", "pdf")
         return cls(
-            format=FileFormat(data.get("format", "pdf")),
+            format=_FILE_FORMAT_BY_VALUE.get(format_value) or FileFormat(format_value),
             enabled=data.get("enabled", True),
             options=data.get("options", {}),
             custom_converter=data.get("custom_converter"),
@@ -112,7 +217,7 @@ class FileFormatConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeConfig:
     """Theme configuration."""
 
@@ -185,6 +290,12 @@ class UISettings(BaseModel):
     font_size: int = 10
     auto_save_geometry: bool = True
 
+    @field_validator("font_family")
+    @classmethod
+    def intern_font_family(cls, v: str) -> str:
+        """Share one string per font family across settings instances."""
+        return sys.intern(v)
+
     @field_validator("window_width", "window_height")
     @classmethod
     def validate_window_size(cls, v: int) -> int:
@@ -225,7 +336,7 @@ class AdvancedSettings(BaseModel):
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if v.upper() not in valid_levels:
             raise ValueError(f"Log level must be one of {valid_levels}")
-        return v.upper()
+        return sys.intern(v.upper())
 
     @field_validator("cache_size_mb")
     @classmethod
@@ -296,7 +407,12 @@ class AppSettings(BaseModel):
 
     def to_yaml(self) -> str:
         """Convert settings to YAML string."""
-        return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=False)
+        return yaml.dump(
+            self.to_dict(),
+            Dumper=_SettingsDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppSettings":
@@ -319,8 +435,9 @@ class AppSettings(BaseModel):
                 else:
                     themes[k] = v
 
+        profile = data.get("profile", "production")
         return cls(
-            profile=Profile(data.get("profile", "production")),
+            profile=_PROFILE_BY_VALUE.get(profile) or Profile(profile),
             conversion=ConversionSettings(**data.get("conversion", {})),
             ui=UISettings(**data.get("ui", {})),
             advanced=AdvancedSettings(**data.get("advanced", {})),
@@ -332,7 +449,7 @@ class AppSettings(BaseModel):
     @classmethod
     def from_yaml(cls, yaml_content: str) -> "AppSettings":
         """Create settings from YAML string."""
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=SafeLoader)
         if not data:
             data = {}
         return cls.from_dict(data)
@@ -348,7 +465,8 @@ class SettingsManager:
     def __init__(
         self,
         config_dir: Optional[Path] = None,
-        profile: Optional[Profile] = None
+        profile: Optional[Profile] = None,
+        persistence_format: str = "yaml"
     ) -> None:
         """
         Initialize the settings manager.
@@ -356,10 +474,16 @@ class SettingsManager:
         Args:
             config_dir: Directory for configuration files (defaults to user config dir)
             profile: Active profile (defaults to PRODUCTION)
+            persistence_format: "yaml" saves config.yaml, "json" saves config.json
+            
+        Raises:
+            ValueError: If persistence_format is not supported
         """
+        if persistence_format not in PERSISTENCE_FORMATS:
+            raise ValueError(f"Unsupported persistence format: {persistence_format}")
+
         if config_dir is None:
             # Use platform-specific config directory
-            import os
             if os.name == "nt":  # Windows
                 config_dir = Path.home() / "AppData" / "Local" / "MarkItDown"
             else:  # Linux/Mac
@@ -368,14 +492,24 @@ class SettingsManager:
 
         self.config_dir = config_dir
         self.profile = profile or Profile.PRODUCTION
+        self.persistence_format = persistence_format
         self.settings: Optional[AppSettings] = None
         self._watchers: List[Any] = []
         self._callbacks: List[Callable[[AppSettings], None]] = []
         self._last_modified: Optional[float] = None
+        # Open deferred_save() blocks and whether a save is waiting for them
+        self._deferred_depth = 0
+        self._dirty = False
+        # Translations by (language, dotted key), built on first lookup from
+        # _i18n_source; None whenever settings may have changed
+        self._i18n_flat: Optional[Dict[Tuple[str, str], str]] = None
+        self._i18n_source: Optional[Dict[str, Any]] = None
+        # Config file signature at the last load
+        self._loaded_signature: Optional[_ConfigSignature] = None
 
         # File paths
         self.default_config_path = Path(__file__).parent / "config.default.yaml"
-        self.user_config_path = self.config_dir / "config.yaml"
+        self.user_config_path = self.config_dir / f"config.{persistence_format}"
         self.profile_config_path = self.config_dir / f"config.{self.profile.value}.yaml"
 
         # Load settings
@@ -390,16 +524,65 @@ class SettingsManager:
         2. User config (config.yaml)
         3. Default config (config.default.yaml)
         
+        If no config file changed since the last load, the current settings
+        are returned as they are.
+        
         Returns:
             Loaded AppSettings instance
         """
+        signature = self._config_signature()
+        if self.settings is not None and signature == self._loaded_signature:
+            logger.debug("Config files unchanged, keeping loaded settings")
+            return self.settings
+
+        # Merge the raw files and validate once; if that fails, merge them
+        # one at a time so a single bad file does not discard the others
+        try:
+            merged: Dict[str, Any] = {}
+            for path in self._config_paths():
+                if path.exists():
+                    merged = self._deep_merge(merged, _load_yaml_cached(path))
+            self.settings = AppSettings.from_dict(merged)
+        except Exception as e:
+            logger.warning(f"Merged config is invalid, loading files separately: {e}")
+            self.settings = self._load_layers()
+
+        self._loaded_signature = signature
+        self._i18n_flat = None
+        logger.info(f"Settings loaded for profile: {self.profile.value}")
+        return self.settings
+
+    def _config_paths(self) -> Tuple[Path, Path, Path]:
+        """Get the default, user and profile config files, lowest priority first."""
+        user_path = self.user_config_path
+        if not user_path.exists():
+            # Fall back to a YAML user config saved before switching to JSON
+            legacy_path = self.config_dir / "config.yaml"
+            if legacy_path.exists():
+                user_path = legacy_path
+        return (self.default_config_path, user_path, self.profile_config_path)
+
+    def _config_signature(self) -> _ConfigSignature:
+        """Get the path, mtime and size of each config file load() reads."""
+        signature = []
+        for path in self._config_paths():
+            try:
+                stat = path.stat()
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((str(path), None, None))
+        return tuple(signature)
+
+    def _load_layers(self) -> AppSettings:
+        """Load and validate each config file in turn, skipping invalid ones."""
         # Start with defaults
         default_settings = self._load_defaults()
 
         # Merge user config if exists
-        if self.user_config_path.exists():
+        user_path = self._config_paths()[1]
+        if user_path.exists():
             try:
-                user_settings = self._load_file(self.user_config_path)
+                user_settings = self._load_file(user_path)
                 default_settings = self._merge_settings(default_settings, user_settings)
             except Exception as e:
                 logger.warning(f"Failed to load user config: {e}")
@@ -412,9 +595,7 @@ class SettingsManager:
             except Exception as e:
                 logger.warning(f"Failed to load profile config: {e}")
 
-        self.settings = default_settings
-        logger.info(f"Settings loaded for profile: {self.profile.value}")
-        return self.settings
+        return default_settings
 
     def _load_defaults(self) -> AppSettings:
         """Load default settings."""
@@ -427,9 +608,7 @@ class SettingsManager:
     def _load_file(self, file_path: Path) -> AppSettings:
         """Load settings from a YAML file."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            return AppSettings.from_yaml(content)
+            return AppSettings.from_dict(_load_yaml_cached(file_path))
         except Exception as e:
             logger.error(f"Failed to load config file {file_path}: {e}")
             raise
@@ -465,24 +644,60 @@ class SettingsManager:
         if settings is None:
             raise ValueError("No settings to save")
 
+        if self._deferred_depth:
+            self.settings = settings
+            self._i18n_flat = None
+            self._dirty = True
+            return
+
         try:
             # Create backup
             if self.user_config_path.exists():
-                backup_path = self.user_config_path.with_suffix(".yaml.bak")
+                backup_path = self.user_config_path.with_name(self.user_config_path.name + ".bak")
                 import shutil
                 shutil.copy2(self.user_config_path, backup_path)
 
             # Save settings
+            if self.persistence_format == "json":
+                content = json.dumps(settings.to_dict(), indent=2, ensure_ascii=False)
+            else:
+                content = settings.to_yaml()
             with open(self.user_config_path, "w", encoding="utf-8") as f:
-                f.write(settings.to_yaml())
+                f.write(content)
 
             self.settings = settings
+            self._i18n_flat = None
             self._last_modified = self.user_config_path.stat().st_mtime
             logger.info("Settings saved successfully")
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
             raise
 
+    @contextmanager
+    def deferred_save(self) -> Iterator["SettingsManager"]:
+        """
+        Collect save() calls and write the user config once.
+        
+        Inside the block save() and update() only replace the current
+        settings; the file is written when the outermost block exits.
+        
+        Yields:
+            This settings manager
+        """
+        self._deferred_depth += 1
+        try:
+            yield self
+        finally:
+            self._deferred_depth -= 1
+            if not self._deferred_depth:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write settings saved inside deferred_save() blocks, if any."""
+        if self._dirty and not self._deferred_depth:
+            self._dirty = False
+            self.save()
+
     def get(self) -> AppSettings:
         """
         Get current settings.
@@ -499,14 +714,14 @@ class SettingsManager:
         Update settings with new values.
         
         Args:
-            **kwargs: Settings to update (nested keys supported with dots)
+            **kwargs: Settings to update (nested keys with "__" or dots)
         """
         if self.settings is None:
             self.load()
 
         settings_dict = self.settings.to_dict()
         for key, value in kwargs.items():
-            keys = key.split(".")
+            keys = _split_update_key(key)
             target = settings_dict
             for k in keys[:-1]:
                 if k not in target:
@@ -515,6 +730,8 @@ class SettingsManager:
             target[keys[-1]] = value
 
         self.settings = AppSettings.from_dict(settings_dict)
+        # Invalidated here too, in case save() fails after the swap
+        self._i18n_flat = None
         self.save()
 
     def enable_hot_reload(self, callback: Optional[Callable[[AppSettings], None]] = None) -> None:
@@ -534,7 +751,7 @@ class SettingsManager:
                     self.callback = callback
 
                 def on_modified(self, event):
-                    if event.src_path.endswith(".yaml"):
+                    if event.src_path.endswith((".yaml", ".json")):
                         logger.info("Configuration file changed, reloading...")
                         try:
                             self.manager.load()
@@ -606,6 +823,10 @@ class SettingsManager:
         """
         Get internationalized string.
         
+        Lookups use a flat index that is rebuilt after load(), save() and
+        update(), or when the settings or their i18n mapping are replaced;
+        call save() after editing ``settings.i18n`` in place.
+        
         Args:
             key: Translation key (e.g., "ui.convert_button")
             language: Language to use (defaults to current UI language)
@@ -617,14 +838,9 @@ class SettingsManager:
         if language is None:
             language = settings.ui.language
 
-        i18n_data = settings.i18n.get(language.value, {})
-        keys = key.split(".")
-        value = i18n_data
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return key
-
-        return value if isinstance(value, str) else key
+        flat = self._i18n_flat
+        if flat is None or self._i18n_source is not settings.i18n:
+            flat = self._i18n_flat = _flatten_i18n(settings.i18n)
+            self._i18n_source = settings.i18n
+        return flat.get((language.value, key), key)
 
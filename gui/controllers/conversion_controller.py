@@ -6,8 +6,10 @@ conversion model and the main window view.
 """
 
 import asyncio
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import logging
 
 from gui.core.observer import Observer
@@ -49,7 +51,17 @@ class ConversionController(Observer):
         self.view = view
         self.state_manager = state_manager
         self.event_bus = event_bus
-        self._conversion_task: Optional[asyncio.Task] = None
+        self._conversion_task: Optional[Future] = None
+
+        # Conversions run on a dedicated asyncio loop so the Tk mainloop
+        # never has to drive (or poll) asyncio itself
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="conversion-loop",
+            daemon=True,
+        )
+        self._loop_thread.start()
 
         # Attach to state manager
         self.state_manager.attach_observer(self)
@@ -125,10 +137,10 @@ class ConversionController(Observer):
         )
         self.state_manager.set_conversion_state(conversion_state)
 
-        # Start async conversion
-        loop = asyncio.get_event_loop()
-        self._conversion_task = loop.create_task(
-            self._run_conversion_async(input_file, output_file)
+        # Start async conversion on the background loop
+        self._conversion_task = asyncio.run_coroutine_threadsafe(
+            self._run_conversion_async(input_file, output_file),
+            self._loop,
         )
 
         logger.info(f"Conversion started: {input_file} -> {output_file}")
@@ -202,7 +214,8 @@ class ConversionController(Observer):
     def cancel_conversion(self) -> None:
         """Cancel the current conversion if in progress."""
         if self.model.is_converting():
-            self.model.cancel()
+            # Task cancellation must happen on the loop that owns the task
+            self._loop.call_soon_threadsafe(self.model.cancel)
             logger.info("Conversion cancellation requested")
 
             # Update state
@@ -212,6 +225,12 @@ class ConversionController(Observer):
 
             self.state_manager.update_state(updater)
 
+    def shutdown(self) -> None:
+        """Stop the background conversion loop."""
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=1.0)
+
     def update(self, subject: Any, event: Optional[Any] = None) -> None:
         """
         Update method from Observer pattern.
@@ -30,6 +30,7 @@ from gui.core.templates import (
     PostProcessingRule,
     PostProcessingPipeline,
     TemplateCategory,
+    get_template_manager,
 )
 from gui.core.markdown_renderer import (
     MarkdownRenderer,
@@ -87,6 +88,7 @@ __all__ = [
     "TaskPriority",
     "TaskStatus",
     "TemplateManager",
+    "get_template_manager",
     "MarkdownTemplate",
     "PostProcessingRule",
     "PostProcessingPipeline",
@@ -65,10 +65,7 @@ class MarkItDownApp:
             )
         except ImportError:
             logger.warning("CustomTkinter not available, falling back to standard Tkinter")
-            self.view = MainWindow(
-                event_bus=self.event_bus,
-                state_update_callback=self._on_state_update
-            )
+            self.view = MainWindow(event_bus=self.event_bus)
 
         # Initialize controller
         self.controller = ConversionController(
@@ -176,6 +173,7 @@ class MarkItDownApp:
         ))
 
         # Clean up
+        self.controller.shutdown()
         self.event_bus.clear_subscribers()
         self.state_manager.detach_observer(self.view)
         self.state_manager.detach_observer(self.controller)
@@ -78,6 +78,8 @@ class DocumentComparator:
         self.original_path: Optional[Path] = None
         self.diff_segments: List[DiffSegment] = []
         self.statistics: Optional[ConversionStatistics] = None
+        self._diff_version = 0
+        self._html_cache: Optional[Tuple[int, str]] = None
 
     def load_original(self, file_path: Path) -> bool:
         """
@@ -234,6 +236,7 @@ class DocumentComparator:
 
         # Calculate statistics
         self.statistics = self._calculate_statistics()
+        self._diff_version += 1
         return self.statistics
 
     def _calculate_statistics(self) -> ConversionStatistics:
@@ -363,7 +366,10 @@ class DocumentComparator:
             True if successful
         """
         try:
-            html = self._generate_diff_html()
+            # Reuse the rendered HTML until the next comparison
+            if self._html_cache is None or self._html_cache[0] != self._diff_version:
+                self._html_cache = (self._diff_version, self._generate_diff_html())
+            html = self._html_cache[1]
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(html)
             return True
@@ -7,9 +7,9 @@ between components using an event bus pattern.
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Callable, Optional
-from collections import defaultdict
+from typing import Any, Dict, List, Callable, Optional, Tuple
 import logging
+import threading
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -111,8 +111,19 @@ class EventBus:
 
     def __init__(self) -> None:
         """Initialize the event bus with empty subscribers."""
-        self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = defaultdict(list)
-        self._global_subscribers: List[Callable[[Event], None]] = []
+        # Subscriber tuples are replaced, never mutated, so emit iterates them as-is
+        self._subscribers: Dict[EventType, Tuple[Callable[[Event], None], ...]] = {}
+        self._global_subscribers: Tuple[Callable[[Event], None], ...] = ()
+        # Scope subscribers ("conversion" gets every "conversion.*" event),
+        # indexed by the event types each scope covers
+        self._scope_subscribers: Dict[str, Tuple[Callable[[Event], None], ...]] = {}
+        self._scope_index: Dict[EventType, Tuple[Callable[[Event], None], ...]] = {}
+        # Everything emit calls per event type, as (callback, error label);
+        # built on first emit and dropped whenever subscriptions change
+        self._dispatch_cache: Dict[EventType, Tuple[Tuple[Callable[[Event], None], str], ...]] = {}
+        # Held while subscriptions change and while a missing cache entry is
+        # built, so an emit on another thread cannot store a stale entry
+        self._lock = threading.Lock()
         self._event_history: List[Event] = []
         self._max_history: int = 1000
         self._enabled: bool = True
@@ -135,16 +146,20 @@ class EventBus:
         Raises:
             ValueError: If callback is already subscribed
         """
-        if global_subscriber:
-            if callback in self._global_subscribers:
-                raise ValueError("Callback is already a global subscriber")
-            self._global_subscribers.append(callback)
-            logger.debug(f"Global subscriber added: {callback.__name__}")
-        else:
-            if callback in self._subscribers[event_type]:
-                raise ValueError(f"Callback already subscribed to {event_type.value}")
-            self._subscribers[event_type].append(callback)
-            logger.debug(f"Subscriber added for {event_type.value}: {callback.__name__}")
+        with self._lock:
+            if global_subscriber:
+                if callback in self._global_subscribers:
+                    raise ValueError("Callback is already a global subscriber")
+                self._global_subscribers += (callback,)
+                self._dispatch_cache.clear()
+                logger.debug(f"Global subscriber added: {callback.__name__}")
+            else:
+                subscribers = self._subscribers.get(event_type, ())
+                if callback in subscribers:
+                    raise ValueError(f"Callback already subscribed to {event_type.value}")
+                self._subscribers[event_type] = subscribers + (callback,)
+                self._dispatch_cache.pop(event_type, None)
+                logger.debug(f"Subscriber added for {event_type.value}: {callback.__name__}")
 
     def unsubscribe(
         self,
@@ -158,14 +173,79 @@ class EventBus:
             event_type: The event type to unsubscribe from (None for global)
             callback: The callback to remove
         """
-        if event_type is None:
-            if callback in self._global_subscribers:
-                self._global_subscribers.remove(callback)
-                logger.debug(f"Global subscriber removed: {callback.__name__}")
-        else:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
-                logger.debug(f"Subscriber removed from {event_type.value}: {callback.__name__}")
+        with self._lock:
+            if event_type is None:
+                if callback in self._global_subscribers:
+                    self._global_subscribers = tuple(
+                        c for c in self._global_subscribers if c != callback
+                    )
+                    self._dispatch_cache.clear()
+                    logger.debug(f"Global subscriber removed: {callback.__name__}")
+            else:
+                subscribers = self._subscribers.get(event_type, ())
+                if callback in subscribers:
+                    self._subscribers[event_type] = tuple(c for c in subscribers if c != callback)
+                    self._dispatch_cache.pop(event_type, None)
+                    logger.debug(f"Subscriber removed from {event_type.value}: {callback.__name__}")
+
+    def subscribe_scope(self, scope: str, callback: Callable[[Event], None]) -> None:
+        """
+        Subscribe to every event type under a dotted scope.
+        
+        A scope of "conversion" matches "conversion.started",
+        "conversion.progress" and so on.
+        
+        Args:
+            scope: Leading segments of the event type values to match
+            callback: Function to call when a matching event is emitted
+            
+        Raises:
+            ValueError: If no event type is in the scope or callback is already subscribed
+        """
+        if not any(self._in_scope(event_type, scope) for event_type in EventType):
+            raise ValueError(f"No event types in scope: {scope}")
+        with self._lock:
+            subscribers = self._scope_subscribers.get(scope, ())
+            if callback in subscribers:
+                raise ValueError(f"Callback already subscribed to scope {scope}")
+            self._scope_subscribers[scope] = subscribers + (callback,)
+            self._rebuild_scope_index()
+            logger.debug(f"Scope subscriber added for {scope}: {callback.__name__}")
+
+    def unsubscribe_scope(self, scope: str, callback: Callable[[Event], None]) -> None:
+        """
+        Unsubscribe from a dotted scope.
+        
+        Args:
+            scope: Scope passed to subscribe_scope
+            callback: The callback to remove
+        """
+        with self._lock:
+            subscribers = self._scope_subscribers.get(scope, ())
+            if callback in subscribers:
+                remaining = tuple(c for c in subscribers if c != callback)
+                if remaining:
+                    self._scope_subscribers[scope] = remaining
+                else:
+                    del self._scope_subscribers[scope]
+                self._rebuild_scope_index()
+                logger.debug(f"Scope subscriber removed from {scope}: {callback.__name__}")
+
+    @staticmethod
+    def _in_scope(event_type: EventType, scope: str) -> bool:
+        """Check whether an event type falls under a dotted scope."""
+        value = event_type.value
+        return value == scope or value.startswith(scope + ".")
+
+    def _rebuild_scope_index(self) -> None:
+        """Precompute the scope subscribers of every event type."""
+        index: Dict[EventType, Tuple[Callable[[Event], None], ...]] = {}
+        for scope, callbacks in self._scope_subscribers.items():
+            for event_type in EventType:
+                if self._in_scope(event_type, scope):
+                    index[event_type] = index.get(event_type, ()) + callbacks
+        self._scope_index = index
+        self._dispatch_cache.clear()
 
     def emit(self, event: Event) -> None:
         """
@@ -182,25 +262,45 @@ class EventBus:
         if len(self._event_history) > self._max_history:
             self._event_history.pop(0)
 
-        # Notify specific subscribers
-        subscribers = self._subscribers.get(event.event_type, [])
-        for callback in subscribers:
+        # Notify specific, then scope, then global subscribers
+        dispatch = self._dispatch_cache.get(event.event_type)
+        if dispatch is None:
+            with self._lock:
+                dispatch = self._build_dispatch(event.event_type)
+        for callback, label in dispatch:
             try:
                 callback(event)
             except Exception as e:
-                logger.error(
-                    f"Error in event subscriber for {event.event_type.value}: {e}",
-                    exc_info=True
-                )
+                logger.error(f"Error in {label}: {e}", exc_info=True)
 
-        # Notify global subscribers
-        for callback in self._global_subscribers:
-            try:
-                callback(event)
-            except Exception as e:
-                logger.error(f"Error in global event subscriber: {e}", exc_info=True)
+        # Formatting the event is not free; skip it unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Event emitted: {event}")
 
-        logger.debug(f"Event emitted: {event}")
+    def _build_dispatch(
+        self,
+        event_type: EventType
+    ) -> Tuple[Tuple[Callable[[Event], None], str], ...]:
+        """
+        Collect and cache the callbacks emit runs for an event type.
+        
+        Must be called with ``_lock`` held.
+        
+        Args:
+            event_type: Event type being emitted
+            
+        Returns:
+            (callback, error label) pairs in notification order
+        """
+        specific = f"event subscriber for {event_type.value}"
+        scoped = f"scope subscriber for {event_type.value}"
+        dispatch = (
+            tuple((c, specific) for c in self._subscribers.get(event_type, ()))
+            + tuple((c, scoped) for c in self._scope_index.get(event_type, ()))
+            + tuple((c, "global event subscriber") for c in self._global_subscribers)
+        )
+        self._dispatch_cache[event_type] = dispatch
+        return dispatch
 
     def clear_subscribers(self, event_type: Optional[EventType] = None) -> None:
         """
@@ -209,13 +309,18 @@ class EventBus:
         Args:
             event_type: The event type to clear (None for all)
         """
-        if event_type is None:
-            self._subscribers.clear()
-            self._global_subscribers.clear()
-            logger.debug("All subscribers cleared")
-        else:
-            self._subscribers[event_type] = []
-            logger.debug(f"Subscribers cleared for {event_type.value}")
+        with self._lock:
+            if event_type is None:
+                self._subscribers.clear()
+                self._global_subscribers = ()
+                self._scope_subscribers.clear()
+                self._scope_index = {}
+                self._dispatch_cache.clear()
+                logger.debug("All subscribers cleared")
+            else:
+                self._subscribers.pop(event_type, None)
+                self._dispatch_cache.pop(event_type, None)
+                logger.debug(f"Subscribers cleared for {event_type.value}")
 
     def get_history(self, event_type: Optional[EventType] = None, limit: int = 100) -> List[Event]:
         """
@@ -256,7 +361,9 @@ class EventBus:
     @property
     def subscriber_count(self) -> int:
         """Get total number of subscribers."""
-        return sum(len(callbacks) for callbacks in self._subscribers.values()) + len(
-            self._global_subscribers
+        return (
+            sum(len(callbacks) for callbacks in self._subscribers.values())
+            + sum(len(callbacks) for callbacks in self._scope_subscribers.values())
+            + len(self._global_subscribers)
         )
 
@@ -148,6 +148,10 @@ class AbstractExporter(ABC):
         """
         self.mapping = mapping
 
+    def close(self) -> None:
+        """Release platform resources such as HTTP sessions."""
+        pass
+
     def _extract_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract metadata using mapping.
@@ -335,6 +339,14 @@ class ExportManager:
         except Exception as e:
             logger.error(f"Failed to save export history: {e}")
 
+    def shutdown(self) -> None:
+        """Release resources held by all registered exporters."""
+        for exporter in self.exporters.values():
+            try:
+                exporter.close()
+            except Exception as e:
+                logger.error(f"Failed to close exporter {exporter.platform.value}: {e}")
+
     def get_history(self, platform: Optional[ExportPlatform] = None) -> List[ExportHistory]:
         """
         Get export history.
@@ -8,7 +8,7 @@ extensions support, and theme management.
 import re
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 
@@ -75,6 +75,9 @@ class MarkdownRenderer:
         """
         self.options = options or RenderOptions()
         self.md: Optional[MarkdownIt] = None
+        # Last body render; theme/dark/zoom changes only re-wrap it
+        self._body_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
+        self._pygments_css_cache: Dict[str, str] = {}
         self._init_markdown_parser()
 
     def _init_markdown_parser(self) -> None:
@@ -126,26 +129,54 @@ class MarkdownRenderer:
         Returns:
             HTML string
         """
+        # Wrap in full HTML document
+        return self._wrap_html(self.render_body(markdown_text))
+
+    def render_body(self, markdown_text: str) -> str:
+        """
+        Render Markdown to body HTML, without theme styles.
+        
+        The last result is reused while the text and body-affecting
+        options are unchanged.
+        
+        Args:
+            markdown_text: Markdown text to render
+            
+        Returns:
+            Body HTML string
+        """
+        options = self.options
+        key = (
+            markdown_text,
+            options.syntax_highlighting,
+            options.enable_math,
+            options.enable_mermaid,
+            options.line_numbers,
+            options.wrap_code,
+        )
+        if self._body_cache is not None and self._body_cache[0] == key:
+            return self._body_cache[1]
+
+        body = self._render_body(markdown_text)
+        self._body_cache = (key, body)
+        return body
+
+    def _render_body(self, markdown_text: str) -> str:
+        """Parse and post-process Markdown into body HTML."""
         if self.md is None:
             # Fallback to simple rendering
-            return self._fallback_render(markdown_text)
+            return self._fallback_body(markdown_text)
 
         try:
-            # Parse Markdown
-            tokens = self.md.parse(markdown_text)
-            
             # Render to HTML
             html = self.md.render(markdown_text)
             
             # Post-process: syntax highlighting, math, mermaid
-            html = self._post_process(html, markdown_text)
-            
-            # Wrap in full HTML document
-            return self._wrap_html(html)
+            return self._post_process(html, markdown_text)
             
         except Exception as e:
             logger.error(f"Error rendering Markdown: {e}")
-            return self._fallback_render(markdown_text)
+            return self._fallback_body(markdown_text)
 
     def _post_process(self, html: str, markdown_text: str) -> str:
         """
@@ -475,10 +506,13 @@ class MarkdownRenderer:
         if not HtmlFormatter:
             return ""
         
-        formatter = HtmlFormatter(
-            style="github-dark" if self.options.dark_mode else "github"
-        )
-        return f"<style>{formatter.get_style_defs('.highlight')}</style>"
+        style = "github-dark" if self.options.dark_mode else "github"
+        css = self._pygments_css_cache.get(style)
+        if css is None:
+            formatter = HtmlFormatter(style=style)
+            css = f"<style>{formatter.get_style_defs('.highlight')}</style>"
+            self._pygments_css_cache[style] = css
+        return css
 
     def _get_katex_css(self) -> str:
         """Get KaTeX CSS for math rendering."""
@@ -507,6 +541,10 @@ class MarkdownRenderer:
 
     def _fallback_render(self, markdown_text: str) -> str:
         """Fallback simple rendering if markdown-it not available."""
+        return self._wrap_html(self._fallback_body(markdown_text))
+
+    def _fallback_body(self, markdown_text: str) -> str:
+        """Very basic body HTML used when markdown-it is unavailable."""
         # Very basic markdown rendering
         html = markdown_text
         html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
@@ -516,7 +554,7 @@ class MarkdownRenderer:
         html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
         html = re.sub(r'`(.+?)`', r'<code>\1</code>', html)
         html = html.replace('\n', '<br>\n')
-        return self._wrap_html(html)
+        return html
 
     def get_html(self, markdown_text: str) -> str:
         """
@@ -530,19 +568,26 @@ class MarkdownRenderer:
         """
         return self.render(markdown_text)
 
-    def export_html(self, markdown_text: str, output_path: Path) -> bool:
+    def export_html(
+        self,
+        markdown_text: str,
+        output_path: Path,
+        html: Optional[str] = None
+    ) -> bool:
         """
         Export rendered HTML to file.
         
         Args:
             markdown_text: Markdown text
             output_path: Output file path
+            html: Already rendered HTML for markdown_text (rendered if None)
             
         Returns:
             True if successful
         """
         try:
-            html = self.render(markdown_text)
+            if html is None:
+                html = self.render(markdown_text)
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(html)
             return True
@@ -550,20 +595,27 @@ class MarkdownRenderer:
             logger.error(f"Failed to export HTML: {e}")
             return False
 
-    def export_pdf(self, markdown_text: str, output_path: Path) -> bool:
+    def export_pdf(
+        self,
+        markdown_text: str,
+        output_path: Path,
+        html: Optional[str] = None
+    ) -> bool:
         """
         Export rendered HTML as PDF.
         
         Args:
             markdown_text: Markdown text
             output_path: Output PDF path
+            html: Already rendered HTML for markdown_text (rendered if None)
             
         Returns:
             True if successful
         """
         try:
             # Render to HTML first
-            html = self.render(markdown_text)
+            if html is None:
+                html = self.render(markdown_text)
             
             # Use weasyprint for PDF generation
             try:
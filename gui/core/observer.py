@@ -6,9 +6,10 @@ decoupled communication between components.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Callable, Optional
+from typing import Any, Dict, Callable, Optional
 from collections import defaultdict
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -40,23 +41,33 @@ class Observable:
     """
 
     def __init__(self) -> None:
-        """Initialize the observable with an empty list of observers."""
-        self._observers: List[Observer] = []
-        self._observer_callbacks: List[Callable[[Any, Optional[Any]], None]] = []
+        """Initialize the observable with no observers."""
+        # Insertion-ordered, so observers are notified in attach order.
+        # Observers are keyed by identity and held weakly, so a discarded
+        # observer drops out by itself. Callbacks are keyed by equality and
+        # held strongly, since each access to a bound method creates a new
+        # but equal object that nothing else keeps alive.
+        self._observers: "weakref.WeakValueDictionary[int, Observer]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._observer_callbacks: Dict[Callable[[Any, Optional[Any]], None], None] = {}
 
     def attach(self, observer: Observer) -> None:
         """
         Attach an observer to this observable.
         
+        The observable only keeps a weak reference; the caller must keep
+        the observer alive for as long as it should be notified.
+        
         Args:
             observer: The observer to attach
             
         Raises:
             ValueError: If observer is already attached
         """
-        if observer in self._observers:
+        if id(observer) in self._observers:
             raise ValueError("Observer is already attached")
-        self._observers.append(observer)
+        self._observers[id(observer)] = observer
         logger.debug(f"Observer {type(observer).__name__} attached to {type(self).__name__}")
 
     def detach(self, observer: Observer) -> None:
@@ -66,8 +77,7 @@ class Observable:
         Args:
             observer: The observer to detach
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if self._observers.pop(id(observer), None) is not None:
             logger.debug(f"Observer {type(observer).__name__} detached from {type(self).__name__}")
 
     def attach_callback(self, callback: Callable[[Any, Optional[Any]], None]) -> None:
@@ -79,7 +89,7 @@ class Observable:
                      Signature: callback(subject, event) -> None
         """
         if callback not in self._observer_callbacks:
-            self._observer_callbacks.append(callback)
+            self._observer_callbacks[callback] = None
             logger.debug(f"Callback attached to {type(self).__name__}")
 
     def detach_callback(self, callback: Callable[[Any, Optional[Any]], None]) -> None:
@@ -90,7 +100,7 @@ class Observable:
             callback: The callback function to detach
         """
         if callback in self._observer_callbacks:
-            self._observer_callbacks.remove(callback)
+            del self._observer_callbacks[callback]
             logger.debug(f"Callback detached from {type(self).__name__}")
 
     def notify(self, event: Optional[Any] = None) -> None:
@@ -100,13 +110,19 @@ class Observable:
         Args:
             event: Optional event data to pass to observers
         """
-        for observer in self._observers:
+        observers = self._observers
+        callbacks = self._observer_callbacks
+        if not observers and not callbacks:
+            return
+
+        # Iterate snapshots so observers may attach or detach while notified
+        for observer in tuple(observers.values()):
             try:
                 observer.update(self, event)
             except Exception as e:
                 logger.error(f"Error notifying observer {type(observer).__name__}: {e}", exc_info=True)
 
-        for callback in self._observer_callbacks:
+        for callback in tuple(callbacks):
             try:
                 callback(self, event)
             except Exception as e:
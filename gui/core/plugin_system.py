@@ -9,8 +9,9 @@ import importlib
 import importlib.util
 import logging
 import json
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Type, Callable
+from typing import Deque, Dict, List, Optional, Any, Type, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
@@ -25,6 +26,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Number of recent log lines kept per plugin
+PLUGIN_LOG_SIZE = 256
+
 
 class PluginType(Enum):
     """Plugin types."""
@@ -171,6 +175,37 @@ class AbstractPlugin(ABC):
         return self.config.copy()
 
 
+class _PluginLogHandler(logging.Handler):
+    """Collects records from ``plugin.<id>`` loggers into per-plugin ring buffers."""
+
+    def __init__(self, buffers: Dict[str, Deque[str]]) -> None:
+        """
+        Initialize handler.
+        
+        Args:
+            buffers: Plugin ID to log buffer mapping to append to
+        """
+        super().__init__()
+        self.buffers = buffers
+        self.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Append a record to its plugin's buffer.
+        
+        Args:
+            record: Log record from a plugin logger
+        """
+        plugin_id = record.name.partition(".")[2]
+        buffer = self.buffers.get(plugin_id)
+        if buffer is None:
+            buffer = self.buffers.setdefault(plugin_id, deque(maxlen=PLUGIN_LOG_SIZE))
+        try:
+            buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
 class PluginManager:
     """Manages plugins for MarkItDown GUI."""
 
@@ -197,6 +232,11 @@ class PluginManager:
         self.hot_reload_enabled = True
         self.sandbox_enabled = True
 
+        # Recent output of every plugin.<id> logger; the handler is removed by shutdown()
+        self._plugin_logs: Dict[str, Deque[str]] = {}
+        self._log_handler = _PluginLogHandler(self._plugin_logs)
+        logging.getLogger("plugin").addHandler(self._log_handler)
+
         # Load plugins
         self._discover_plugins()
 
@@ -468,9 +508,13 @@ class PluginManager:
             plugin_id: Plugin ID
             
         Returns:
-            List of log messages
+            List of log messages, oldest first
         """
-        # This would integrate with logging system
-        # For now, return empty list
-        return []
+        buffer = self._plugin_logs.get(plugin_id)
+        return list(buffer) if buffer is not None else []
+
+    def shutdown(self) -> None:
+        """Stop collecting plugin logs; collected logs stay readable."""
+        logging.getLogger("plugin").removeHandler(self._log_handler)
+        self._log_handler.close()
 
@@ -5,10 +5,13 @@ This module provides centralized state management for the application,
 following a unidirectional data flow pattern.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional, List, Callable
+from typing import Any, Dict, Iterator, Optional, List, Callable
 from pathlib import Path
+from types import FunctionType
+import copy
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +27,7 @@ class ConversionStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionState:
     """
     State for a single conversion operation.
@@ -75,7 +78,7 @@ class ConversionState:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """
     Central application state.
@@ -112,13 +115,14 @@ class AppState:
             file_path: Path to the file to add
         """
         # Remove if already exists
-        if file_path in self.recent_files:
+        try:
             self.recent_files.remove(file_path)
+        except ValueError:
+            pass
         # Add to front
         self.recent_files.insert(0, file_path)
-        # Limit size
-        if len(self.recent_files) > self.max_recent_files:
-            self.recent_files = self.recent_files[:self.max_recent_files]
+        # Limit size, in place
+        del self.recent_files[self.max_recent_files:]
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
@@ -144,6 +148,62 @@ class AppState:
         self.settings[key] = value
 
 
+# Field values an updater cannot change in place
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None), Enum, Path, tuple, frozenset)
+
+
+class _RecordingProxy:
+    """
+    Stand-in for AppState that records what an updater changes.
+    
+    The first time a field is assigned, its old value is kept; the first
+    time a mutable field is read, a deep copy of it is kept, since the
+    updater may change it in place. Undo restores only those fields
+    instead of a copy of the whole state.
+    """
+
+    def __init__(self, target: AppState) -> None:
+        """
+        Initialize the proxy.
+        
+        Args:
+            target: State the updater modifies
+        """
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_previous", {})
+
+    def __getattr__(self, name: str) -> Any:
+        """Read a field, remembering a copy of it if it is mutable."""
+        target = self._target
+        class_attr = getattr(type(target), name, None)
+        if isinstance(class_attr, (FunctionType, property)):
+            # Methods and properties run against the proxy so their writes are seen
+            return class_attr.__get__(self, type(target))
+
+        value = getattr(target, name)
+        if name not in self._previous and not isinstance(value, _IMMUTABLE_TYPES):
+            self._previous[name] = copy.deepcopy(value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field, remembering its old value."""
+        if name not in self._previous:
+            self._previous[name] = getattr(self._target, name)
+        setattr(self._target, name, value)
+
+    def changed(self) -> bool:
+        """Check whether any field the updater touched now differs."""
+        target = self._target
+        for name, old in self._previous.items():
+            new = getattr(target, name)
+            if new is old and not isinstance(old, _IMMUTABLE_TYPES):
+                # The same mutable object assigned back may have been edited elsewhere
+                return True
+            if new != old:
+                return True
+        return False
+
+
 class StateManager:
     """
     Manages application state with change notifications.
@@ -161,8 +221,14 @@ class StateManager:
         from gui.core.observer import Observable
         self._state = initial_state or AppState()
         self._observable = Observable()
-        self._history: List[AppState] = []
+        # Per update, the previous value of each field it touched
+        self._history: List[Dict[str, Any]] = []
         self._max_history: int = 50
+        # Nesting depth of batch() blocks, undo steps recorded in the
+        # outermost one, and whether it owes observers a notification
+        self._batch_depth = 0
+        self._batch_steps = 0
+        self._batch_pending = False
 
     @property
     def state(self) -> AppState:
@@ -174,30 +240,85 @@ class StateManager:
         """
         return self._state
 
-    def update_state(self, updater: Callable[[AppState], None]) -> None:
+    def update_state(self, updater: Callable[[AppState], None], force: bool = False) -> None:
         """
         Update state using an updater function.
         
         This is the only way to modify state, ensuring all changes
-        are tracked and observers are notified.
+        are tracked and observers are notified. An update that leaves
+        the state as it was records no undo step and notifies no one.
         
         Args:
             updater: Function that modifies the state
+            force: Notify observers even if nothing changed
         """
-        # Save to history
-        import copy
-        self._history.append(copy.deepcopy(self._state))
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
-
-        # Update state
-        updater(self._state)
-
-        # Notify observers
-        self._observable.notify(self._state)
+        # Update state, recording the fields the updater touches
+        proxy = _RecordingProxy(self._state)
+        try:
+            updater(proxy)
+        except Exception:
+            # Keep what the updater did before failing undoable
+            self._push_history(proxy._previous)
+            raise
+
+        if not force and not proxy.changed():
+            logger.debug("State unchanged")
+            return
+        self._push_history(proxy._previous)
+
+        # Notify observers, once at the end of a batch
+        if self._batch_depth:
+            self._batch_pending = True
+        else:
+            self._observable.notify(self._state)
 
         logger.debug("State updated")
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group updates into one notification and one undo step.
+        
+        Observers are notified once when the outermost batch exits, if
+        any update inside it changed the state.
+        
+        Yields:
+            None
+        """
+        if self._batch_depth == 0:
+            self._batch_steps = 0
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._merge_batch_history()
+                if self._batch_pending:
+                    self._batch_pending = False
+                    self._observable.notify(self._state)
+
+    def _merge_batch_history(self) -> None:
+        """Fold the undo steps recorded during a batch into one."""
+        steps = min(self._batch_steps, len(self._history))
+        if steps < 2:
+            return
+        merged: Dict[str, Any] = {}
+        for previous in self._history[-steps:]:
+            for name, value in previous.items():
+                # The earliest value is the one from before the batch
+                merged.setdefault(name, value)
+        del self._history[-steps:]
+        self._history.append(merged)
+
+    def _push_history(self, previous: Dict[str, Any]) -> None:
+        """Save the previous values of an update for undo."""
+        if self._batch_depth:
+            self._batch_steps += 1
+        self._history.append(previous)
+        if len(self._history) > self._max_history:
+            self._history.pop(0)
+
     def set_conversion_state(self, conversion: ConversionState) -> None:
         """
         Update the current conversion state.
@@ -268,7 +389,8 @@ class StateManager:
         if not self._history:
             return False
 
-        self._state = self._history.pop()
+        for name, value in self._history.pop().items():
+            setattr(self._state, name, value)
         self._observable.notify(self._state)
         logger.debug("State undone")
         return True
@@ -289,6 +411,5 @@ class StateManager:
         Returns:
             Deep copy of current state
         """
-        import copy
         return copy.deepcopy(self._state)
 
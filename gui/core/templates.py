@@ -324,6 +324,17 @@ class MarkdownTemplate:
         )
 
 
+def _default_storage_path() -> Path:
+    """Get the user template directory, creating it if needed."""
+    import os
+    if os.name == "nt":  # Windows
+        storage_path = Path.home() / "AppData" / "Local" / "MarkItDown" / "templates"
+    else:  # Linux/Mac
+        storage_path = Path.home() / ".config" / "markitdown" / "templates"
+    storage_path.mkdir(parents=True, exist_ok=True)
+    return storage_path
+
+
 class TemplateManager:
     """Manages markdown templates."""
 
@@ -335,12 +346,7 @@ class TemplateManager:
             storage_path: Path to store templates (defaults to user config)
         """
         if storage_path is None:
-            import os
-            if os.name == "nt":  # Windows
-                storage_path = Path.home() / "AppData" / "Local" / "MarkItDown" / "templates"
-            else:  # Linux/Mac
-                storage_path = Path.home() / ".config" / "markitdown" / "templates"
-            storage_path.mkdir(parents=True, exist_ok=True)
+            storage_path = _default_storage_path()
 
         self.storage_path = storage_path
         self.templates: Dict[str, MarkdownTemplate] = {}
@@ -669,3 +675,30 @@ tags: {{ metadata.get('tags', []) | join(', ') }}
             return self.templates.get(self.default_template_id)
         return None
 
+
+# Shared template managers by resolved storage path; never evicted, so every
+# window on a path keeps editing the same manager
+_TEMPLATE_MANAGERS: Dict[Path, TemplateManager] = {}
+
+
+def get_template_manager(storage_path: Optional[Path] = None) -> TemplateManager:
+    """
+    Get the shared template manager for a storage path.
+    
+    Windows and dialogs opened on the same path see the same templates
+    without re-reading storage. The manager is not thread-safe; use it
+    from the Tk thread.
+    
+    Args:
+        storage_path: Path to store templates (defaults to user config)
+        
+    Returns:
+        TemplateManager for the path
+    """
+    if storage_path is None:
+        storage_path = _default_storage_path()
+    key = Path(storage_path).resolve()
+    manager = _TEMPLATE_MANAGERS.get(key)
+    if manager is None:
+        manager = _TEMPLATE_MANAGERS[key] = TemplateManager(storage_path=key)
+    return manager
@@ -7,6 +7,8 @@ and multiple concurrent conversions.
 
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
@@ -18,6 +20,9 @@ from gui.core.state import ConversionState, ConversionStatus
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads writing workspace files in save_all
+SAVE_ALL_WORKERS = 8
+
 
 class WorkspaceStatus(Enum):
     """Status of a workspace."""
@@ -69,6 +74,7 @@ class WorkspaceState:
         # Convert datetime to string
         data["created_at"] = self.created_at.isoformat()
         data["last_modified"] = self.last_modified.isoformat()
+        data["status"] = self.status.value
         # Convert ConversionState
         if self.current_conversion:
             data["current_conversion"] = self._conversion_to_dict(self.current_conversion)
@@ -317,22 +323,57 @@ class WorkspaceManager:
         Returns:
             True if saved, False if not found
         """
-        workspace = self.workspaces.get(workspace_id)
-        if not workspace:
+        data = self.snapshot_workspace(workspace_id)
+        if data is None:
             return False
 
-        workspace.update_status()
-        workspace_file = self.storage_path / f"{workspace_id}.json"
-
         try:
-            with open(workspace_file, "w", encoding="utf-8") as f:
-                json.dump(workspace.to_dict(), f, indent=2)
-            logger.debug(f"Saved workspace: {workspace_id}")
+            self.write_workspace(workspace_id, data)
             return True
         except Exception as e:
             logger.error(f"Failed to save workspace {workspace_id}: {e}")
             return False
 
+    def snapshot_workspace(self, workspace_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Refresh a workspace's status and copy it for saving.
+        
+        The copy shares nothing with the live state, so it can be written
+        from another thread while the workspace keeps changing.
+        
+        Args:
+            workspace_id: Workspace ID to copy
+            
+        Returns:
+            Workspace data or None if not found
+        """
+        workspace = self.workspaces.get(workspace_id)
+        if not workspace:
+            return None
+
+        workspace.update_status()
+        return workspace.to_dict()
+
+    def write_workspace(self, workspace_id: str, data: Dict[str, Any]) -> None:
+        """
+        Write a workspace snapshot to disk.
+        
+        The file is replaced only once the new contents are fully written.
+        
+        Args:
+            workspace_id: Workspace ID
+            data: Snapshot from snapshot_workspace()
+            
+        Raises:
+            OSError: If the file cannot be written
+        """
+        workspace_file = self.storage_path / f"{workspace_id}.json"
+        temp_file = workspace_file.with_name(workspace_file.name + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_file, workspace_file)
+        logger.debug(f"Saved workspace: {workspace_id}")
+
     def load_workspace(self, workspace_id: str) -> Optional[WorkspaceState]:
         """
         Load workspace state from disk.
@@ -360,8 +401,12 @@ class WorkspaceManager:
 
     def save_all(self) -> None:
         """Save all workspaces to disk."""
-        for workspace_id in self.workspaces:
-            self.save_workspace(workspace_id)
+        # Each workspace has its own file, so the writes can overlap
+        workspace_ids = list(self.workspaces)
+        if workspace_ids:
+            workers = min(SAVE_ALL_WORKERS, len(workspace_ids))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ws-save-all") as pool:
+                list(pool.map(self.save_workspace, workspace_ids))
         
         # Save order
         order_file = self.storage_path / "order.json"
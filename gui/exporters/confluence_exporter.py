@@ -64,6 +64,13 @@ class ConfluenceExporter(AbstractExporter):
             logger.error(f"Confluence authentication error: {e}")
             return False
 
+    def close(self) -> None:
+        """Close the authenticated session."""
+        if self.session:
+            self.session.close()
+            self.session = None
+        self.authenticated = False
+
     def export(
         self,
         markdown_text: str,
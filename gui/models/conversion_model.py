@@ -126,9 +126,15 @@ class ConversionModel(Observable):
         if not input_file.exists():
             raise ValueError(f"Input file does not exist: {input_file}")
 
-        if self._current_task and not self._current_task.done():
+        task = asyncio.current_task()
+        if (
+            self._current_task
+            and self._current_task is not task
+            and not self._current_task.done()
+        ):
             raise RuntimeError("A conversion is already in progress")
 
+        self._current_task = task
         self._cancelled = False
         conversion_state = ConversionState(
             input_file=input_file,
@@ -149,7 +155,7 @@ class ConversionModel(Observable):
 
         try:
             # Run conversion in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             
             def run_conversion() -> str:
                 """Run the actual conversion in a thread."""
@@ -227,6 +233,9 @@ class ConversionModel(Observable):
                     source="ConversionModel"
                 ))
 
+        if self._current_task is task:
+            self._current_task = None
+
         self.notify(conversion_state)
         return conversion_state
 
@@ -22,6 +22,7 @@ import logging
 from gui.core.document_comparator import DocumentComparator, DiffType
 from gui.components.document_viewer import PDFViewer, DOCXViewer
 from gui.components.diff_viewer import DiffViewer, StatisticsPanel
+from gui.components.ctk_components import CTkToast
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +61,14 @@ class DocumentComparisonWindow(ctk.CTk):
         self.title("MarkItDown - Document Comparison")
         self.geometry("1600x1000")
         self.minsize(1400, 800)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        """Release viewer resources and close the window."""
+        viewer = getattr(self, "original_viewer", None)
+        if viewer is not None and hasattr(viewer, "close"):
+            viewer.close()
+        self.destroy()
 
     def _create_layout(self) -> None:
         """Create main layout."""
@@ -137,6 +146,9 @@ class DocumentComparisonWindow(ctk.CTk):
             width=120,
         ).pack(side="left", padx=5)
 
+        self._status = CTkToast(toolbar)
+        self._status.pack(side="right", padx=10)
+
         # Main content area
         self.content_frame = ctk.CTkFrame(self)
         self.content_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -230,6 +242,9 @@ class DocumentComparisonWindow(ctk.CTk):
             if tab_name == "Original":
                 # Clear and recreate
                 original_tab = self.tabs._tab_dict[tab_name]
+                previous = getattr(self, "original_viewer", None)
+                if previous is not None and hasattr(previous, "close"):
+                    previous.close()
                 for widget in original_tab.winfo_children():
                     widget.destroy()
 
@@ -250,6 +265,7 @@ class DocumentComparisonWindow(ctk.CTk):
                         viewer.insert("1.0", f.read())
 
                 viewer.pack(fill="both", expand=True, padx=5, pady=5)
+                self.original_viewer = viewer
                 break
 
     def _load_original(self) -> None:
@@ -268,7 +284,7 @@ class DocumentComparisonWindow(ctk.CTk):
             self.original_path = Path(file_path)
             if self.comparator.load_original(self.original_path):
                 self._load_original_viewer()
-                messagebox.showinfo("Success", "Original document loaded!")
+                self._status.show("Original document loaded!")
             else:
                 messagebox.showerror("Error", "Failed to load original document")
 
@@ -286,18 +302,18 @@ class DocumentComparisonWindow(ctk.CTk):
                 self.comparator.set_converted(content)
                 self.converted_viewer.delete("1.0", "end")
                 self.converted_viewer.insert("1.0", content)
-                messagebox.showinfo("Success", "Converted document loaded!")
+                self._status.show("Converted document loaded!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load converted document: {e}")
 
     def _compare_documents(self) -> None:
         """Compare documents."""
         if not self.comparator.original_text:
-            messagebox.showwarning("Warning", "Please load original document first")
+            self._status.show("Please load original document first", "warning")
             return
 
         if not self.comparator.converted_text:
-            messagebox.showwarning("Warning", "Please load converted document first")
+            self._status.show("Please load converted document first", "warning")
             return
 
         # Perform comparison
@@ -310,11 +326,10 @@ class DocumentComparisonWindow(ctk.CTk):
         # Switch to diff tab
         self.tabs.set("Diff View")
 
-        messagebox.showinfo(
-            "Comparison Complete",
-            f"Comparison complete!\n\n"
-            f"Preservation: {stats.preservation_percentage:.1f}%\n"
-            f"Total Differences: {stats.total_differences}"
+        self._status.show(
+            f"Comparison complete! Preservation: {stats.preservation_percentage:.1f}%, "
+            f"Total Differences: {stats.total_differences}",
+            duration_ms=6000,
         )
 
     def _change_view_mode(self, mode: str) -> None:
@@ -347,7 +362,7 @@ class DocumentComparisonWindow(ctk.CTk):
     def _export_diff(self) -> None:
         """Export diff as HTML."""
         if not self.comparator.diff_segments:
-            messagebox.showwarning("Warning", "Please compare documents first")
+            self._status.show("Please compare documents first", "warning")
             return
 
         file_path = filedialog.asksaveasfilename(
@@ -357,7 +372,7 @@ class DocumentComparisonWindow(ctk.CTk):
         )
         if file_path:
             if self.comparator.export_diff_html(Path(file_path)):
-                messagebox.showinfo("Success", "Diff HTML exported successfully!")
+                self._status.show("Diff HTML exported successfully!")
             else:
                 messagebox.showerror("Error", "Failed to export diff HTML")
 
@@ -13,9 +13,15 @@ Features:
 import customtkinter as ctk
 from tkinter import messagebox
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
+import atexit
 import logging
+import queue
+import sys
 import uuid
+from collections import ChainMap
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 
 from gui.core.exporters import (
     ExportManager,
@@ -30,6 +36,7 @@ from gui.exporters import (
     GitHubWikiExporter,
     ObsidianExporter,
 )
+from gui.components.ctk_components import CTkToast
 from gui.components.export_ui import (
     PlatformSelector,
     FieldMappingPanel,
@@ -39,10 +46,58 @@ from gui.components.export_ui import (
 
 logger = logging.getLogger(__name__)
 
+# Interval at which queued UI callbacks are drained on the Tk thread
+UI_QUEUE_POLL_MS = 16
+
+# Shared across export windows so exporter sessions stay warm between opens
+_EXPORT_MANAGER: Optional[ExportManager] = None
+
+
+def _get_export_manager() -> ExportManager:
+    """Get the shared ExportManager, creating it on first use."""
+    global _EXPORT_MANAGER
+    if _EXPORT_MANAGER is None:
+        _EXPORT_MANAGER = ExportManager()
+        _EXPORT_MANAGER.register_exporter(NotionExporter())
+        _EXPORT_MANAGER.register_exporter(ConfluenceExporter())
+        _EXPORT_MANAGER.register_exporter(WordPressExporter())
+        _EXPORT_MANAGER.register_exporter(MediumExporter())
+        _EXPORT_MANAGER.register_exporter(GitHubWikiExporter())
+        _EXPORT_MANAGER.register_exporter(ObsidianExporter())
+        atexit.register(_EXPORT_MANAGER.shutdown)
+    return _EXPORT_MANAGER
+
 
 class PlatformExportWindow(ctk.CTk):
     """Main window for platform exports."""
 
+    # Credential fields per platform: (label, credential key, is secret)
+    CREDENTIAL_SCHEMA: Dict[ExportPlatform, List[Tuple[str, str, bool]]] = {
+        ExportPlatform.NOTION: [
+            ("Notion Integration Token:", "notion_token", True),
+        ],
+        ExportPlatform.CONFLUENCE: [
+            ("Base URL:", "base_url", False),
+            ("Username:", "username", False),
+            ("API Token:", "api_token", True),
+        ],
+        ExportPlatform.WORDPRESS: [
+            ("WordPress URL:", "base_url", False),
+            ("Username:", "username", False),
+            ("Application Password:", "application_password", True),
+        ],
+        ExportPlatform.MEDIUM: [
+            ("Medium Access Token:", "access_token", True),
+        ],
+        ExportPlatform.GITHUB_WIKI: [
+            ("Wiki Path:", "wiki_path", False),
+            ("Wiki URL (to clone):", "wiki_url", False),
+        ],
+        ExportPlatform.OBSIDIAN: [
+            ("Vault Path:", "vault_path", False),
+        ],
+    }
+
     def __init__(
         self,
         markdown_text: str = "",
@@ -59,30 +114,55 @@ class PlatformExportWindow(ctk.CTk):
         """
         super().__init__(**kwargs)
         self.markdown_text = markdown_text
-        self.metadata = metadata or {}
-        self.export_manager = ExportManager()
+        self.metadata = self._intern_metadata(metadata)
+        self.export_manager = _get_export_manager()
         self.selected_platform: Optional[ExportPlatform] = None
+        self._export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        self._closing = False
+        # Export results, run by _drain_ui_queue on the Tk thread
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._cred_dialog: Optional[ctk.CTkToplevel] = None
+        self._cred_frames: Dict[ExportPlatform, ctk.CTkFrame] = {}
 
-        self._register_exporters()
         self._setup_window()
         self._create_layout()
 
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
         logger.info("Platform export window initialized")
 
-    def _register_exporters(self) -> None:
-        """Register all exporters."""
-        self.export_manager.register_exporter(NotionExporter())
-        self.export_manager.register_exporter(ConfluenceExporter())
-        self.export_manager.register_exporter(WordPressExporter())
-        self.export_manager.register_exporter(MediumExporter())
-        self.export_manager.register_exporter(GitHubWikiExporter())
-        self.export_manager.register_exporter(ObsidianExporter())
+    @staticmethod
+    def _intern_metadata(metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Copy metadata with interned keys so repeated exports share key strings."""
+        return {sys.intern(key): value for key, value in (metadata or {}).items()}
 
     def _setup_window(self) -> None:
         """Configure window properties."""
         self.title("MarkItDown - Platform Export")
         self.geometry("1400x900")
         self.minsize(1200, 700)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        """Stop background exports and close the window."""
+        self._closing = True
+        self._export_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _drain_ui_queue(self) -> None:
+        """Run every callback queued by the export pool, then reschedule."""
+        if self._closing:
+            return
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in UI callback: {e}", exc_info=True)
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
 
     def _create_layout(self) -> None:
         """Create main layout."""
@@ -96,6 +176,9 @@ class PlatformExportWindow(ctk.CTk):
             font=ctk.CTkFont(size=18, weight="bold"),
         ).pack(side="left", padx=10)
 
+        self._status = CTkToast(toolbar)
+        self._status.pack(side="right", padx=10)
+
         # Main content
         main_frame = ctk.CTkFrame(self)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -134,13 +217,14 @@ class PlatformExportWindow(ctk.CTk):
         export_frame = ctk.CTkFrame(right_frame)
         export_frame.pack(fill="x", padx=5, pady=5)
 
-        ctk.CTkButton(
+        self.export_button = ctk.CTkButton(
             export_frame,
             text="Export",
             command=self._export,
             width=150,
             font=ctk.CTkFont(size=14, weight="bold"),
-        ).pack(pady=10)
+        )
+        self.export_button.pack(pady=10)
 
         ctk.CTkButton(
             export_frame,
@@ -161,117 +245,81 @@ class PlatformExportWindow(ctk.CTk):
         self.selected_platform = platform
         exporter = self.export_manager.get_exporter(platform)
         if exporter and exporter.authenticated:
-            messagebox.showinfo("Platform Selected", f"{platform.value} is ready for export")
+            self._status.show(f"{platform.value} is ready for export")
         else:
-            messagebox.showwarning(
-                "Authentication Required",
-                f"Please configure {platform.value} credentials first"
-            )
+            self._status.show(f"Please configure {platform.value} credentials first", "warning")
 
     def _configure_platform(self) -> None:
         """Configure selected platform."""
         if not self.selected_platform:
-            messagebox.showwarning("No Platform", "Please select a platform first")
+            self._status.show("Please select a platform first", "warning")
             return
 
         exporter = self.export_manager.get_exporter(self.selected_platform)
         if not exporter:
             return
 
-        # Show credentials dialog
-        dialog = self._create_credentials_dialog(self.selected_platform)
-        dialog.wait_window()
+        self._show_credentials_dialog(self.selected_platform)
 
-    def _create_credentials_dialog(self, platform: ExportPlatform) -> ctk.CTkToplevel:
-        """Create credentials dialog for platform."""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title(f"Configure {platform.value}")
-        dialog.geometry("500x400")
+    def _show_credentials_dialog(self, platform: ExportPlatform) -> None:
+        """Show credentials dialog for platform, reusing previously built forms."""
+        if self._cred_dialog is None or not self._cred_dialog.winfo_exists():
+            self._cred_dialog = ctk.CTkToplevel(self)
+            self._cred_dialog.geometry("500x400")
+            self._cred_dialog.protocol("WM_DELETE_WINDOW", self._cred_dialog.withdraw)
+            self._cred_frames = {}
 
-        credentials = {}
+        for frame in self._cred_frames.values():
+            frame.pack_forget()
 
-        if platform == ExportPlatform.NOTION:
-            ctk.CTkLabel(dialog, text="Notion Integration Token:").pack(pady=10)
-            token_var = ctk.StringVar()
-            ctk.CTkEntry(
-                dialog,
-                textvariable=token_var,
-                width=400,
-                show="*",
-            ).pack(pady=5)
-            credentials["notion_token"] = token_var
-
-        elif platform == ExportPlatform.CONFLUENCE:
-            ctk.CTkLabel(dialog, text="Base URL:").pack(pady=5)
-            url_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=url_var, width=400).pack(pady=5)
-
-            ctk.CTkLabel(dialog, text="Username:").pack(pady=5)
-            user_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=user_var, width=400).pack(pady=5)
-
-            ctk.CTkLabel(dialog, text="API Token:").pack(pady=5)
-            token_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=token_var, width=400, show="*").pack(pady=5)
-            credentials = {"base_url": url_var, "username": user_var, "api_token": token_var}
-
-        elif platform == ExportPlatform.WORDPRESS:
-            ctk.CTkLabel(dialog, text="WordPress URL:").pack(pady=5)
-            url_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=url_var, width=400).pack(pady=5)
-
-            ctk.CTkLabel(dialog, text="Username:").pack(pady=5)
-            user_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=user_var, width=400).pack(pady=5)
-
-            ctk.CTkLabel(dialog, text="Application Password:").pack(pady=5)
-            pass_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=pass_var, width=400, show="*").pack(pady=5)
-            credentials = {"base_url": url_var, "username": user_var, "application_password": pass_var}
-
-        elif platform == ExportPlatform.MEDIUM:
-            ctk.CTkLabel(dialog, text="Medium Access Token:").pack(pady=10)
-            token_var = ctk.StringVar()
+        frame = self._cred_frames.get(platform)
+        if frame is None:
+            frame = self._build_credentials_frame(self._cred_dialog, platform)
+            self._cred_frames[platform] = frame
+
+        frame.pack(fill="both", expand=True)
+        self._cred_dialog.title(f"Configure {platform.value}")
+        self._cred_dialog.deiconify()
+        self._cred_dialog.lift()
+        self._cred_dialog.focus()
+
+    def _build_credentials_frame(
+        self,
+        dialog: ctk.CTkToplevel,
+        platform: ExportPlatform
+    ) -> ctk.CTkFrame:
+        """Build the credentials form for platform inside the shared dialog."""
+        frame = ctk.CTkFrame(dialog, fg_color="transparent")
+
+        credentials: Dict[str, ctk.StringVar] = {}
+        secrets = []
+        for label, key, is_secret in self.CREDENTIAL_SCHEMA.get(platform, []):
+            ctk.CTkLabel(frame, text=label).pack(pady=5)
+            var = ctk.StringVar()
             ctk.CTkEntry(
-                dialog,
-                textvariable=token_var,
+                frame,
+                textvariable=var,
                 width=400,
-                show="*",
+                show="*" if is_secret else "",
             ).pack(pady=5)
-            credentials["access_token"] = token_var
-
-        elif platform == ExportPlatform.GITHUB_WIKI:
-            ctk.CTkLabel(dialog, text="Wiki Path:").pack(pady=5)
-            path_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=path_var, width=400).pack(pady=5)
-
-            ctk.CTkLabel(dialog, text="Wiki URL (to clone):").pack(pady=5)
-            url_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=url_var, width=400).pack(pady=5)
-            credentials = {"wiki_path": path_var, "wiki_url": url_var}
-
-        elif platform == ExportPlatform.OBSIDIAN:
-            ctk.CTkLabel(dialog, text="Vault Path:").pack(pady=10)
-            path_var = ctk.StringVar()
-            ctk.CTkEntry(dialog, textvariable=path_var, width=400).pack(pady=5)
-            credentials["vault_path"] = path_var
+            credentials[key] = var
+            if is_secret:
+                secrets.append(var)
 
         # Buttons
-        button_frame = ctk.CTkFrame(dialog)
+        button_frame = ctk.CTkFrame(frame)
         button_frame.pack(fill="x", padx=20, pady=10)
 
         def save_credentials():
             # Extract values from StringVars
-            creds = {}
-            for key, value in credentials.items():
-                if isinstance(value, ctk.StringVar):
-                    creds[key] = value.get()
-                else:
-                    creds[key] = value
+            creds = {key: var.get() for key, var in credentials.items()}
 
             if self.export_manager.authenticate_exporter(platform, creds):
-                messagebox.showinfo("Success", f"{platform.value} configured successfully!")
-                dialog.destroy()
+                self._status.show(f"{platform.value} configured successfully!")
+                # Don't keep secrets around in the hidden form
+                for var in secrets:
+                    var.set("")
+                dialog.withdraw()
             else:
                 messagebox.showerror("Error", f"Failed to authenticate with {platform.value}")
 
@@ -285,28 +333,25 @@ class PlatformExportWindow(ctk.CTk):
         ctk.CTkButton(
             button_frame,
             text="Cancel",
-            command=dialog.destroy,
+            command=dialog.withdraw,
             width=100,
         ).pack(side="right", padx=5)
 
-        return dialog
+        return frame
 
     def _export(self) -> None:
         """Export to selected platform."""
         if not self.selected_platform:
-            messagebox.showwarning("No Platform", "Please select a platform first")
+            self._status.show("Please select a platform first", "warning")
             return
 
         if not self.markdown_text:
-            messagebox.showwarning("No Content", "No content to export")
+            self._status.show("No content to export", "warning")
             return
 
         exporter = self.export_manager.get_exporter(self.selected_platform)
         if not exporter or not exporter.authenticated:
-            messagebox.showwarning(
-                "Not Authenticated",
-                f"Please configure {self.selected_platform.value} first"
-            )
+            self._status.show(f"Please configure {self.selected_platform.value} first", "warning")
             return
 
         # Get mapping
@@ -320,31 +365,48 @@ class PlatformExportWindow(ctk.CTk):
         elif self.selected_platform == ExportPlatform.CONFLUENCE:
             destination = self.metadata.get("space_key")
 
-        # Export
-        try:
-            result = self.export_manager.export_to_platform(
-                self.selected_platform,
-                self.markdown_text,
-                {**self.metadata, "source_file": self.metadata.get("source_file", "unknown")},
-                destination
-            )
+        # Export on a worker thread so network calls don't block the UI
+        # Layer the source_file default over metadata instead of copying it
+        platform = self.selected_platform
+        payload = ChainMap(
+            {"source_file": self.metadata.get("source_file", "unknown")},
+            self.metadata,
+        )
+        self.export_button.configure(state="disabled")
+        future = self._export_pool.submit(
+            self.export_manager.export_to_platform,
+            platform,
+            self.markdown_text,
+            payload,
+            destination,
+        )
+        future.add_done_callback(
+            lambda f: self._ui_queue.put(partial(self._finish_export, platform, f))
+        )
 
-            if result.status.value == "completed":
-                messagebox.showinfo(
-                    "Export Successful",
-                    f"Exported to {self.selected_platform.value}!\n\n"
-                    f"URL: {result.exported_url or 'N/A'}"
-                )
-                self.history_panel._refresh_history()
-            else:
-                messagebox.showerror(
-                    "Export Failed",
-                    f"Failed to export: {result.error}"
-                )
+    def _finish_export(self, platform: ExportPlatform, future: Future) -> None:
+        """Report the result of a background export on the UI thread."""
+        self.export_button.configure(state="normal")
 
+        try:
+            result = future.result()
         except Exception as e:
             logger.error(f"Export error: {e}")
             messagebox.showerror("Error", f"Export failed: {e}")
+            return
+
+        if result.status.value == "completed":
+            self._status.show(
+                f"Exported to {platform.value}! URL: {result.exported_url or 'N/A'}",
+                duration_ms=6000,
+            )
+            if self.export_manager.export_history:
+                self.history_panel.append_history(self.export_manager.export_history[-1])
+        else:
+            messagebox.showerror(
+                "Export Failed",
+                f"Failed to export: {result.error}"
+            )
 
     def set_content(self, markdown_text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -355,7 +417,7 @@ class PlatformExportWindow(ctk.CTk):
             metadata: Content metadata
         """
         self.markdown_text = markdown_text
-        self.metadata = metadata or {}
+        self.metadata = self._intern_metadata(metadata)
         if hasattr(self, 'preview_panel'):
             self.preview_panel.set_preview(markdown_text, self.metadata)
 
@@ -4,10 +4,14 @@ Main window view for MarkItDown GUI.
 This module contains the main user interface window.
 """
 
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+from functools import partial
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Any, Dict, Optional, Callable, List, Tuple
 import logging
 
 from gui.core.observer import Observer
@@ -16,6 +20,32 @@ from gui.core.state import AppState, ConversionState, ConversionStatus
 
 logger = logging.getLogger(__name__)
 
+# Results longer than this are shown through a sliding window of lines
+RESULT_WINDOW_LINES = 1000
+# Lines left before the window edge that trigger re-centering
+RESULT_OVERSCAN_LINES = 200
+# Minimum delay between progress repaints (~30 fps)
+PROGRESS_THROTTLE_MS = 33
+# Interval at which queued UI callbacks are drained on the Tk thread
+UI_QUEUE_POLL_MS = 16
+# Large inserts are split into chunks of this many characters
+RESULT_INSERT_CHUNK = 64 * 1024
+
+_PROGRESS_LABELS = tuple(f"Converting... {i}%" for i in range(101))
+
+_INPUT_FILETYPES = (
+    ("All Supported", "*.pdf;*.docx;*.pptx;*.xlsx;*.html;*.csv;*.json;*.xml;*.jpg;*.png;*.mp3;*.wav"),
+    ("PDF", "*.pdf"),
+    ("Word", "*.docx"),
+    ("PowerPoint", "*.pptx"),
+    ("Excel", "*.xlsx"),
+    ("HTML", "*.html"),
+    ("Images", "*.jpg;*.png;*.jpeg;*.gif"),
+    ("Audio", "*.mp3;*.wav;*.m4a"),
+    ("All Files", "*.*"),
+)
+_OUTPUT_FILETYPES = (("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*"))
+
 
 class MainWindow(Observer, tk.Tk):
     """
@@ -25,27 +55,39 @@ class MainWindow(Observer, tk.Tk):
     responsible for displaying the UI and handling user input.
     """
 
-    def __init__(
-        self,
-        event_bus: EventBus,
-        state_update_callback: Optional[Callable[[AppState], None]] = None
-    ) -> None:
+    def __init__(self, event_bus: EventBus) -> None:
         """
         Initialize the main window.
         
         Args:
             event_bus: Event bus for communication
-            state_update_callback: Optional callback for state updates
         """
         super().__init__()
         self.event_bus = event_bus
-        self.state_update_callback = state_update_callback
         self._current_state: Optional[AppState] = None
+        self._result_lines: List[str] = []
+        self._result_source = ""
+        self._rendered_text: Optional[str] = ""
+        self._result_window: Tuple[int, int] = (0, 0)
+        self._recentering = False
+        self._insert_gen = 0
+        self._pending_progress: Optional[float] = None
+        self._progress_scheduled = False
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._last_pct = -1
+        self._last_state_key: Optional[Tuple[Any, ...]] = None
+        self._ui_cache: Dict[str, Any] = {}
 
         self._setup_window()
         self._create_widgets()
         self._setup_event_listeners()
 
+        # Built on first use, then reused; they also remember the last directory
+        self._open_dialog: Optional[filedialog.Open] = None
+        self._save_dialog: Optional[filedialog.SaveAs] = None
+
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
         logger.info("Main window initialized")
 
     def _setup_window(self) -> None:
@@ -54,9 +96,10 @@ class MainWindow(Observer, tk.Tk):
         self.geometry("800x600")
         self.minsize(600, 400)
 
-        # Configure style
-        style = ttk.Style()
-        style.theme_use("clam")
+        # Configure style; switching themes restyles every widget, so skip no-ops
+        style = ttk.Style(self)
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
 
     def _create_widgets(self) -> None:
         """Create and layout all UI widgets."""
@@ -69,7 +112,6 @@ class MainWindow(Observer, tk.Tk):
         # File selection frame
         file_frame = ttk.LabelFrame(main_frame, text="File Selection", padding="10")
         file_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        main_frame.columnconfigure(0, weight=1)
 
         self.input_file_var = tk.StringVar()
         ttk.Label(file_frame, text="Input File:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
@@ -93,7 +135,6 @@ class MainWindow(Observer, tk.Tk):
         # Control buttons frame
         control_frame = ttk.Frame(main_frame)
         control_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        main_frame.columnconfigure(0, weight=1)
 
         self.convert_button = ttk.Button(
             control_frame,
@@ -101,7 +142,6 @@ class MainWindow(Observer, tk.Tk):
             command=self._on_convert_clicked,
             state="normal"
         )
-        self.convert_button.grid(row=0, column=0, padx=(0, 5))
 
         self.cancel_button = ttk.Button(
             control_frame,
@@ -109,18 +149,18 @@ class MainWindow(Observer, tk.Tk):
             command=self._on_cancel_clicked,
             state="disabled"
         )
+        self.convert_button.grid(row=0, column=0, padx=(0, 5))
         self.cancel_button.grid(row=0, column=1, padx=(0, 5))
 
         # Progress frame
         progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding="10")
         progress_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        main_frame.columnconfigure(0, weight=1)
 
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(
             progress_frame,
             variable=self.progress_var,
-            maximum=100,
+            maximum=1.0,
             length=400,
             mode='determinate'
         )
@@ -133,17 +173,18 @@ class MainWindow(Observer, tk.Tk):
         # Result frame
         result_frame = ttk.LabelFrame(main_frame, text="Result", padding="10")
         result_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 0))
-        main_frame.rowconfigure(3, weight=1)
-        main_frame.columnconfigure(0, weight=1)
 
         self.result_text = scrolledtext.ScrolledText(
             result_frame,
             wrap=tk.WORD,
+            undo=False,
             width=80,
             height=20,
             state="disabled"
         )
         self.result_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.result_text.configure(yscrollcommand=self._on_result_yview)
+        self.result_text.vbar.configure(command=self._on_result_scroll)
         result_frame.columnconfigure(0, weight=1)
         result_frame.rowconfigure(0, weight=1)
 
@@ -153,46 +194,46 @@ class MainWindow(Observer, tk.Tk):
 
     def _setup_event_listeners(self) -> None:
         """Set up event bus listeners."""
-        self.event_bus.subscribe(EventType.CONVERSION_STARTED, self._on_conversion_started)
-        self.event_bus.subscribe(EventType.CONVERSION_PROGRESS, self._on_conversion_progress)
-        self.event_bus.subscribe(EventType.CONVERSION_COMPLETED, self._on_conversion_completed)
-        self.event_bus.subscribe(EventType.CONVERSION_FAILED, self._on_conversion_failed)
-        self.event_bus.subscribe(EventType.CONVERSION_CANCELLED, self._on_conversion_cancelled)
-        self.event_bus.subscribe(EventType.UI_ERROR, self._on_ui_error)
-        self.event_bus.subscribe(EventType.UI_INFO, self._on_ui_info)
+        handlers: Dict[EventType, Callable[[Event], None]] = {
+            EventType.CONVERSION_STARTED: self._on_conversion_started,
+            EventType.CONVERSION_PROGRESS: self._on_conversion_progress,
+            EventType.CONVERSION_COMPLETED: self._on_conversion_completed,
+            EventType.CONVERSION_FAILED: self._on_conversion_failed,
+            EventType.CONVERSION_CANCELLED: self._on_conversion_cancelled,
+            EventType.UI_ERROR: self._on_ui_error,
+            EventType.UI_INFO: self._on_ui_info,
+        }
+        for event_type, handler in handlers.items():
+            self.event_bus.subscribe(event_type, handler)
 
     def _browse_input_file(self) -> None:
         """Open file dialog to select input file."""
-        file_path = filedialog.askopenfilename(
-            title="Select File to Convert",
-            filetypes=[
-                ("All Supported", "*.pdf;*.docx;*.pptx;*.xlsx;*.html;*.csv;*.json;*.xml;*.jpg;*.png;*.mp3;*.wav"),
-                ("PDF", "*.pdf"),
-                ("Word", "*.docx"),
-                ("PowerPoint", "*.pptx"),
-                ("Excel", "*.xlsx"),
-                ("HTML", "*.html"),
-                ("Images", "*.jpg;*.png;*.jpeg;*.gif"),
-                ("Audio", "*.mp3;*.wav;*.m4a"),
-                ("All Files", "*.*")
-            ]
-        )
+        if self._open_dialog is None:
+            self._open_dialog = filedialog.Open(
+                self,
+                title="Select File to Convert",
+                filetypes=_INPUT_FILETYPES,
+            )
+        file_path = self._open_dialog.show()
         if file_path:
+            self._open_dialog.options["initialdir"] = str(Path(file_path).parent)
             self.input_file_var.set(file_path)
             # Auto-suggest output file
             if not self.output_file_var.get():
-                input_path = Path(file_path)
-                output_path = input_path.with_suffix('.md')
-                self.output_file_var.set(str(output_path))
+                self.output_file_var.set(os.path.splitext(file_path)[0] + ".md")
 
     def _browse_output_file(self) -> None:
         """Open file dialog to select output file."""
-        file_path = filedialog.asksaveasfilename(
-            title="Save Markdown As",
-            defaultextension=".md",
-            filetypes=[("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*")]
-        )
+        if self._save_dialog is None:
+            self._save_dialog = filedialog.SaveAs(
+                self,
+                title="Save Markdown As",
+                defaultextension=".md",
+                filetypes=_OUTPUT_FILETYPES,
+            )
+        file_path = self._save_dialog.show()
         if file_path:
+            self._save_dialog.options["initialdir"] = str(Path(file_path).parent)
             self.output_file_var.set(file_path)
 
     def _on_convert_clicked(self) -> None:
@@ -203,14 +244,29 @@ class MainWindow(Observer, tk.Tk):
             return
 
         input_path = Path(input_file)
-        if not input_path.exists():
-            messagebox.showerror("File Not Found", f"The file does not exist:\n{input_file}")
-            return
-
         output_file = self.output_file_var.get().strip()
         output_path = Path(output_file) if output_file else None
 
-        # Emit conversion request event
+        # Stat the file in the background; slow mounts must not block Tk
+        threading.Thread(
+            target=self._validate_input_file,
+            args=(input_path, output_path),
+            daemon=True,
+        ).start()
+
+    def _validate_input_file(self, input_path: Path, output_path: Optional[Path]) -> None:
+        """Check the input file exists (worker thread) and hand back to the UI."""
+        if input_path.exists():
+            self._ui_queue.put(partial(self._emit_file_selected, input_path, output_path))
+        else:
+            self._ui_queue.put(partial(
+                messagebox.showerror,
+                "File Not Found",
+                f"The file does not exist:\n{input_path}",
+            ))
+
+    def _emit_file_selected(self, input_path: Path, output_path: Optional[Path]) -> None:
+        """Emit the conversion request for a validated input file."""
         self.event_bus.emit(Event(
             EventType.FILE_SELECTED,
             {
@@ -228,79 +284,239 @@ class MainWindow(Observer, tk.Tk):
             source="MainWindow"
         ))
 
+    def _drain_ui_queue(self) -> None:
+        """Run every callback queued by event handlers, then reschedule."""
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in UI callback: {e}", exc_info=True)
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
     def _on_conversion_started(self, event: Event) -> None:
         """Handle conversion started event."""
-        self.after(0, lambda: self._update_ui_for_conversion_start())
+        self._ui_queue.put(self._update_ui_for_conversion_start)
 
     def _on_conversion_progress(self, event: Event) -> None:
         """Handle conversion progress event."""
-        progress = event.get("progress", 0.0)
-        self.after(0, lambda p=progress: self._update_progress(p))
+        # Keep only the latest value; one flush per throttle interval
+        self._pending_progress = event.get("progress", 0.0)
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self._ui_queue.put(partial(self.after, PROGRESS_THROTTLE_MS, self._flush_progress))
+
+    def _flush_progress(self) -> None:
+        """Apply the most recent pending progress value."""
+        self._progress_scheduled = False
+        progress = self._pending_progress
+        self._pending_progress = None
+        if progress is not None:
+            self._update_progress(progress)
 
     def _on_conversion_completed(self, event: Event) -> None:
         """Handle conversion completed event."""
-        self.after(0, self._update_ui_for_conversion_complete)
+        self._ui_queue.put(self._update_ui_for_conversion_complete)
 
     def _on_conversion_failed(self, event: Event) -> None:
         """Handle conversion failed event."""
         error = event.get("error", "Unknown error")
-        self.after(0, lambda e=error: self._update_ui_for_conversion_failed(e))
+        self._ui_queue.put(partial(self._update_ui_for_conversion_failed, error))
 
     def _on_conversion_cancelled(self, event: Event) -> None:
         """Handle conversion cancelled event."""
-        self.after(0, self._update_ui_for_conversion_cancelled)
+        self._ui_queue.put(self._update_ui_for_conversion_cancelled)
 
     def _on_ui_error(self, event: Event) -> None:
         """Handle UI error event."""
         message = event.get("message", "An error occurred")
-        self.after(0, lambda m=message: messagebox.showerror("Error", m))
+        self._ui_queue.put(partial(messagebox.showerror, "Error", message))
 
     def _on_ui_info(self, event: Event) -> None:
         """Handle UI info event."""
         message = event.get("message", "")
-        self.after(0, lambda m=message: messagebox.showinfo("Information", m))
+        self._ui_queue.put(partial(messagebox.showinfo, "Information", message))
+
+    def _set_cached(self, key: str, widget: tk.Widget, **options: Any) -> None:
+        """Configure a widget only when the option value actually changed."""
+        value = next(iter(options.values()))
+        if self._ui_cache.get(key) != value:
+            widget.config(**options)
+            self._ui_cache[key] = value
+
+    def _set_converting(self, active: bool) -> None:
+        """Enable/disable the Convert and Cancel buttons."""
+        self._set_cached("convert_state", self.convert_button, state="disabled" if active else "normal")
+        self._set_cached("cancel_state", self.cancel_button, state="normal" if active else "disabled")
+
+    def _set_status(self, text: str) -> None:
+        """Set the status label text."""
+        self._set_cached("status", self.status_label, text=text)
+
+    def _set_progress(self, value: float) -> None:
+        """Set the progress bar value (0.0 to 1.0)."""
+        if self._ui_cache.get("progress") != value:
+            self.progress_var.set(value)
+            self._ui_cache["progress"] = value
 
     def _update_ui_for_conversion_start(self) -> None:
         """Update UI when conversion starts."""
-        self.convert_button.config(state="disabled")
-        self.cancel_button.config(state="normal")
-        self.progress_var.set(0.0)
-        self.status_label.config(text="Converting...")
-        self.result_text.config(state="normal")
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.config(state="disabled")
+        self._set_converting(True)
+        self._set_progress(0.0)
+        self._set_status("Converting...")
+        self._last_pct = -1
+        self._set_result_text("")
 
     def _update_progress(self, progress: float) -> None:
         """Update progress bar."""
-        self.progress_var.set(progress * 100)
-        self.status_label.config(text=f"Converting... {int(progress * 100)}%")
+        pct = int(progress * 100)
+        if pct == self._last_pct:
+            return
+        self._last_pct = pct
+        self._set_progress(progress)
+        self._set_status(_PROGRESS_LABELS[pct] if 0 <= pct <= 100 else "Converting...")
 
     def _update_ui_for_conversion_complete(self) -> None:
         """Update UI when conversion completes."""
-        self.convert_button.config(state="normal")
-        self.cancel_button.config(state="disabled")
-        self.progress_var.set(100.0)
-        self.status_label.config(text="Conversion completed successfully!")
+        self._pending_progress = None
+        self._last_pct = -1
+        self._set_converting(False)
+        self._set_progress(1.0)
+        self._set_status("Conversion completed successfully!")
 
         # Update result text if state is available
         if self._current_state and self._current_state.current_conversion.result_text:
-            self.result_text.config(state="normal")
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(1.0, self._current_state.current_conversion.result_text)
+            self._set_result_text(self._current_state.current_conversion.result_text)
+
+    def _set_result_text(self, text: str) -> None:
+        """
+        Show conversion output in the result view.
+        
+        Only a window of lines around the viewport is inserted into the
+        Text widget; the full output is kept in ``_result_lines``.
+        
+        Args:
+            text: Markdown output to display
+        """
+        if text == self._result_source:
+            return
+        self._result_source = text
+        self._result_lines = text.split("\n") if text else []
+        self._render_result_window(0, stream=True)
+        self.result_text.yview_moveto(0.0)
+
+    def _render_result_window(self, start: int, stream: bool = False) -> None:
+        """
+        Insert the slice of result lines beginning at start.
+        
+        Args:
+            start: First line of the window
+            stream: Insert large text in idle-time chunks instead of at once
+        """
+        total = len(self._result_lines)
+        start = max(0, min(start, total - RESULT_WINDOW_LINES))
+        end = min(total, start + RESULT_WINDOW_LINES)
+        self._result_window = (start, end)
+
+        if start == 0 and end == total:
+            text = self._result_source
+        else:
+            text = "\n".join(self._result_lines[start:end])
+        if text == self._rendered_text:
+            return
+
+        # Invalidate any chunked insert still in flight
+        self._insert_gen += 1
+        self._rendered_text = None
+
+        # Wrapping is recomputed once when it is switched back on
+        self.result_text.config(state="normal", wrap=tk.NONE)
+        self.result_text.delete(1.0, tk.END)
+        if stream and len(text) > RESULT_INSERT_CHUNK:
+            self.result_text.config(state="disabled")
+            self._append_result_chunk(text, 0, self._insert_gen)
+            return
+        self.result_text.insert(1.0, text)
+        self.result_text.config(state="disabled", wrap=tk.WORD)
+        self._rendered_text = text
+
+    def _append_result_chunk(self, text: str, offset: int, generation: int) -> None:
+        """Insert one chunk of text and schedule the next one when idle."""
+        if generation != self._insert_gen:
+            return
+
+        next_offset = offset + RESULT_INSERT_CHUNK
+        self.result_text.config(state="normal")
+        self.result_text.insert(tk.END, text[offset:next_offset])
+
+        if next_offset < len(text):
             self.result_text.config(state="disabled")
+            self.after_idle(self._append_result_chunk, text, next_offset, generation)
+        else:
+            self.result_text.config(state="disabled", wrap=tk.WORD)
+            self._rendered_text = text
+
+    def _recenter_result_window(self, line: int) -> None:
+        """Re-render the window around a global line and keep it at the top."""
+        self._recentering = True
+        try:
+            self._render_result_window(line - RESULT_WINDOW_LINES // 2)
+            start, end = self._result_window
+            self.result_text.yview_moveto((line - start) / max(1, end - start))
+        finally:
+            self._recentering = False
+
+    def _on_result_yview(self, first: str, last: str) -> None:
+        """Map the Text widget's local scroll position onto the full result."""
+        total = len(self._result_lines)
+        start, end = self._result_window
+        if total <= RESULT_WINDOW_LINES:
+            self.result_text.vbar.set(first, last)
+            return
+
+        span = end - start
+        top = start + float(first) * span
+        bottom = start + float(last) * span
+        self.result_text.vbar.set(top / total, bottom / total)
+
+        if self._recentering:
+            return
+        near_top = start > 0 and top - start < RESULT_OVERSCAN_LINES
+        near_bottom = end < total and end - bottom < RESULT_OVERSCAN_LINES
+        if near_top or near_bottom:
+            self._recenter_result_window(int(top))
+
+    def _on_result_scroll(self, *args: str) -> None:
+        """Handle scrollbar drags against the full result length."""
+        total = len(self._result_lines)
+        if total <= RESULT_WINDOW_LINES or args[0] != "moveto":
+            self.result_text.yview(*args)
+            return
+
+        line = int(float(args[1]) * total)
+        start, end = self._result_window
+        if start <= line < end - RESULT_OVERSCAN_LINES or (end == total and line >= start):
+            self.result_text.yview_moveto((line - start) / max(1, end - start))
+        else:
+            self._recenter_result_window(line)
 
     def _update_ui_for_conversion_failed(self, error: str) -> None:
         """Update UI when conversion fails."""
-        self.convert_button.config(state="normal")
-        self.cancel_button.config(state="disabled")
-        self.status_label.config(text=f"Conversion failed: {error}")
+        self._pending_progress = None
+        self._last_pct = -1
+        self._set_converting(False)
+        self._set_status(f"Conversion failed: {error}")
         messagebox.showerror("Conversion Failed", f"The conversion failed:\n{error}")
 
     def _update_ui_for_conversion_cancelled(self) -> None:
         """Update UI when conversion is cancelled."""
-        self.convert_button.config(state="normal")
-        self.cancel_button.config(state="disabled")
-        self.status_label.config(text="Conversion cancelled")
+        self._pending_progress = None
+        self._last_pct = -1
+        self._set_converting(False)
+        self._set_status("Conversion cancelled")
 
     def update(self, subject: Any, event: Optional[Any] = None) -> None:
         """
@@ -314,7 +530,9 @@ class MainWindow(Observer, tk.Tk):
         """
         if isinstance(event, AppState):
             self._current_state = event
-            self._update_ui_from_state(event)
+            # Notifications arrive on the conversion loop thread; widgets
+            # are only touched on the Tk thread
+            self._ui_queue.put(partial(self._update_ui_from_state, event))
 
     def _update_ui_from_state(self, state: AppState) -> None:
         """
@@ -325,28 +543,32 @@ class MainWindow(Observer, tk.Tk):
         """
         conversion = state.current_conversion
 
+        # Ignore notifications that leave the conversion view unchanged
+        key = (
+            conversion.status,
+            int(conversion.progress * 100),
+            conversion.error_message,
+            conversion.result_text,
+        )
+        if key == self._last_state_key:
+            return
+        self._last_state_key = key
+
         # Update progress
         if conversion.is_active:
-            self.progress_var.set(conversion.progress * 100)
-            self.status_label.config(text=f"Converting... {int(conversion.progress * 100)}%")
+            self._update_progress(conversion.progress)
         elif conversion.is_complete:
-            self.progress_var.set(100.0)
-            self.status_label.config(text="Conversion completed")
+            self._last_pct = -1
+            self._set_progress(1.0)
+            self._set_status("Conversion completed")
             if conversion.result_text:
-                self.result_text.config(state="normal")
-                self.result_text.delete(1.0, tk.END)
-                self.result_text.insert(1.0, conversion.result_text)
-                self.result_text.config(state="disabled")
+                self._set_result_text(conversion.result_text)
         elif conversion.has_error:
-            self.status_label.config(text=f"Error: {conversion.error_message}")
+            self._last_pct = -1
+            self._set_status(f"Error: {conversion.error_message}")
 
         # Update button states
-        if conversion.is_active:
-            self.convert_button.config(state="disabled")
-            self.cancel_button.config(state="normal")
-        else:
-            self.convert_button.config(state="normal")
-            self.cancel_button.config(state="disabled")
+        self._set_converting(conversion.is_active)
 
     def run(self) -> None:
         """Start the main event loop."""
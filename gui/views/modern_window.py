@@ -7,9 +7,11 @@ This module provides a modern, responsive UI with CustomTkinter.
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from pathlib import Path
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, Tuple
 import logging
+import queue
 import threading
+from functools import partial
 
 from gui.core.observer import Observer
 from gui.core.events import Event, EventType, EventBus
@@ -26,6 +28,24 @@ from gui.components.ctk_components import (
 
 logger = logging.getLogger(__name__)
 
+# Minimum delay between progress repaints
+PROGRESS_THROTTLE_MS = 50
+# Interval at which queued UI callbacks are drained on the Tk thread
+UI_QUEUE_POLL_MS = 16
+
+_INPUT_FILETYPES = (
+    ("All Supported", "*.pdf;*.docx;*.pptx;*.xlsx;*.html;*.csv;*.json;*.xml;*.jpg;*.png;*.mp3;*.wav"),
+    ("PDF", "*.pdf"),
+    ("Word", "*.docx"),
+    ("PowerPoint", "*.pptx"),
+    ("Excel", "*.xlsx"),
+    ("HTML", "*.html"),
+    ("Images", "*.jpg;*.png;*.jpeg;*.gif"),
+    ("Audio", "*.mp3;*.wav;*.m4a"),
+    ("All Files", "*.*"),
+)
+_OUTPUT_FILETYPES = (("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*"))
+
 
 class ModernMainWindow(Observer, ctk.CTk):
     """
@@ -65,6 +85,18 @@ class ModernMainWindow(Observer, ctk.CTk):
         self.state_update_callback = state_update_callback
         self._current_state: Optional[AppState] = None
         self._current_theme = "dark"
+        self._theme_apply_pending = False
+        self._pending_progress: Optional[float] = None
+        self._progress_flush_scheduled = False
+        self._last_pct = -1
+        self._converting = False
+        self._pending_state: Optional[AppState] = None
+        self._state_flush_queued = False
+        self._last_rendered_state: Tuple[Any, ...] = (None, None, None)
+        # Result text last written to the Textbox and preview panel
+        self._shown_result: Optional[str] = None
+        self._fonts: Dict[Tuple[int, str, Optional[str]], ctk.CTkFont] = {}
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
 
         self._setup_window()
         self._create_layout()
@@ -73,6 +105,8 @@ class ModernMainWindow(Observer, ctk.CTk):
         self._setup_drag_drop()
         self._setup_accessibility()
 
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
         logger.info("Modern main window initialized")
 
     def _setup_window(self) -> None:
@@ -85,6 +119,28 @@ class ModernMainWindow(Observer, ctk.CTk):
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
+    def _font(self, size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+        """
+        Get a shared font for the given spec.
+        
+        Args:
+            size: Font size
+            weight: "normal" or "bold"
+            family: Font family (None for the theme default)
+            
+        Returns:
+            CTkFont shared by every widget using the same spec
+        """
+        key = (size, weight, family)
+        font = self._fonts.get(key)
+        if font is None:
+            if family is None:
+                font = ctk.CTkFont(size=size, weight=weight)
+            else:
+                font = ctk.CTkFont(family=family, size=size, weight=weight)
+            self._fonts[key] = font
+        return font
+
     def _create_layout(self) -> None:
         """Create the main layout."""
         # Top bar
@@ -125,8 +181,13 @@ class ModernMainWindow(Observer, ctk.CTk):
         self.settings_tab = self.workspace.add("Settings")
 
         self._create_convert_tab()
-        self._create_history_tab()
-        self._create_settings_tab()
+
+        # History and Settings are built the first time they are shown
+        self._pending_tabs: Dict[str, Callable[[], None]] = {
+            "History": self._create_history_tab,
+            "Settings": self._create_settings_tab,
+        }
+        self.workspace.configure(command=self._on_tab_change)
 
         # Preview panel (right)
         self.preview_panel = CTkPreviewPanel(self, width=400)
@@ -140,6 +201,22 @@ class ModernMainWindow(Observer, ctk.CTk):
         self.grid_columnconfigure(1, weight=1)  # Workspace expands
         self.grid_columnconfigure(2, weight=0, minsize=400)  # Preview panel
 
+    def _on_tab_change(self) -> None:
+        """Build the selected tab's widgets on its first activation."""
+        builder = self._pending_tabs.pop(self.workspace.get(), None)
+        if builder is not None:
+            builder()
+
+    def _show_tab(self, name: str) -> None:
+        """
+        Switch the workspace to a tab, building it if needed.
+        
+        Args:
+            name: Tab name
+        """
+        self.workspace.set(name)
+        self._on_tab_change()
+
     def _create_convert_tab(self) -> None:
         """Create the convert tab."""
         # File selection frame
@@ -147,7 +224,7 @@ class ModernMainWindow(Observer, ctk.CTk):
         file_frame.pack(fill="x", padx=20, pady=20)
 
         # Input file
-        input_label = ctk.CTkLabel(file_frame, text="Input File:", font=ctk.CTkFont(size=14))
+        input_label = ctk.CTkLabel(file_frame, text="Input File:", font=self._font(14))
         input_label.grid(row=0, column=0, sticky="w", padx=10, pady=10)
 
         self.input_file_var = ctk.StringVar(value="")
@@ -170,7 +247,7 @@ class ModernMainWindow(Observer, ctk.CTk):
         CTkTooltip(input_browse, "Select file to convert (Ctrl+O)")
 
         # Output file
-        output_label = ctk.CTkLabel(file_frame, text="Output File:", font=ctk.CTkFont(size=14))
+        output_label = ctk.CTkLabel(file_frame, text="Output File:", font=self._font(14))
         output_label.grid(row=1, column=0, sticky="w", padx=10, pady=10)
 
         self.output_file_var = ctk.StringVar(value="")
@@ -200,7 +277,7 @@ class ModernMainWindow(Observer, ctk.CTk):
             command=self._on_convert_clicked,
             width=150,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
         )
         self.convert_button.pack(side="left", padx=10, pady=10)
         CTkTooltip(self.convert_button, "Start conversion (Ctrl+Enter)")
@@ -223,7 +300,7 @@ class ModernMainWindow(Observer, ctk.CTk):
         self.progress_label = ctk.CTkLabel(
             progress_frame,
             text="Ready",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
         )
         self.progress_label.pack(pady=10)
 
@@ -238,14 +315,14 @@ class ModernMainWindow(Observer, ctk.CTk):
         result_label = ctk.CTkLabel(
             result_frame,
             text="Result:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
         )
         result_label.pack(anchor="w", padx=10, pady=5)
 
         self.result_text = ctk.CTkTextbox(
             result_frame,
             wrap="word",
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=self._font(11, family="Consolas"),
         )
         self.result_text.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -254,7 +331,7 @@ class ModernMainWindow(Observer, ctk.CTk):
         history_label = ctk.CTkLabel(
             self.history_tab,
             text="Conversion History",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
         )
         history_label.pack(pady=20)
 
@@ -268,7 +345,7 @@ class ModernMainWindow(Observer, ctk.CTk):
         settings_label = ctk.CTkLabel(
             self.settings_tab,
             text="Settings",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
         )
         settings_label.pack(pady=20)
 
@@ -289,25 +366,22 @@ class ModernMainWindow(Observer, ctk.CTk):
 
     def _setup_keyboard_shortcuts(self) -> None:
         """Set up keyboard shortcuts."""
-        # Ctrl+O - Open file
-        self.bind("<Control-o>", lambda e: self._browse_input_file())
-        self.bind("<Control-O>", lambda e: self._browse_input_file())
-
-        # Ctrl+S - Save
-        self.bind("<Control-s>", lambda e: self._save_result())
-        self.bind("<Control-S>", lambda e: self._save_result())
-
-        # Ctrl+Enter - Convert
-        self.bind("<Control-Return>", lambda e: self._on_convert_clicked())
-
-        # Esc - Cancel
-        self.bind("<Escape>", lambda e: self._on_cancel_clicked())
-
-        # F5 - Refresh
-        self.bind("<F5>", lambda e: self._refresh())
+        shortcuts = (
+            ("<Control-o>", self._browse_input_file),  # Open file
+            ("<Control-O>", self._browse_input_file),
+            ("<Control-s>", self._save_result),  # Save
+            ("<Control-S>", self._save_result),
+            ("<Control-Return>", self._on_convert_clicked),  # Convert
+            ("<Escape>", self._on_cancel_clicked),  # Cancel
+            ("<F5>", self._refresh),  # Refresh
+        )
+        for sequence, action in shortcuts:
+            self.bind(sequence, partial(self._invoke_shortcut, action))
 
-        # Tab navigation
-        self.bind("<Tab>", self._on_tab)
+    @staticmethod
+    def _invoke_shortcut(action: Callable[[], None], event: Any) -> None:
+        """Run a shortcut's action, discarding the Tk event."""
+        action()
 
     def _setup_drag_drop(self) -> None:
         """Set up drag and drop functionality."""
@@ -319,16 +393,6 @@ class ModernMainWindow(Observer, ctk.CTk):
                 self.tk.drop_target_register(DND_FILES)
                 self.tk.dnd_bind('<<Drop>>', self._on_file_drop)
                 logger.info("Drag & Drop enabled on main window")
-            
-            # Also enable on convert tab area
-            # Note: CTkTabview may need special handling
-            try:
-                if hasattr(self.convert_tab, 'tk'):
-                    self.convert_tab.tk.drop_target_register(DND_FILES)
-                    self.convert_tab.tk.dnd_bind('<<Drop>>', self._on_file_drop)
-                    logger.info("Drag & Drop enabled on convert tab")
-            except Exception as e:
-                logger.debug(f"Could not enable DnD on tab: {e}")
         except ImportError:
             logger.warning("tkinterdnd2 not available, drag & drop disabled")
         except Exception as e:
@@ -365,35 +429,42 @@ class ModernMainWindow(Observer, ctk.CTk):
             
             if files:
                 file_path = files[0].strip('{}').strip('"').strip("'")
-                if Path(file_path).exists():
-                    self.input_file_var.set(file_path)
-                    # Auto-suggest output
-                    if not self.output_file_var.get():
-                        input_path = Path(file_path)
-                        output_path = input_path.with_suffix('.md')
-                        self.output_file_var.set(str(output_path))
-                    self.status_bar.set_status(f"File dropped: {Path(file_path).name}")
-                    # Switch to convert tab
-                    self.workspace.set("Convert")
+                # Drops land on the window; route them to the Convert tab
+                self.workspace.set("Convert")
+                path = Path(file_path)
+                self._async_validate_path(path, partial(self._on_dropped_file_checked, path))
         except Exception as e:
             logger.error(f"Error handling file drop: {e}")
             self.status_bar.set_status(f"Error: Could not load dropped file")
 
+    def _on_dropped_file_checked(self, path: Path, exists: bool) -> None:
+        """Fill in the dropped file once it is known to exist."""
+        if not exists:
+            return
+        self.input_file_var.set(str(path))
+        # Auto-suggest output
+        if not self.output_file_var.get():
+            self.output_file_var.set(str(path.with_suffix('.md')))
+        self.status_bar.set_status(f"File dropped: {path.name}")
+
+    def _async_validate_path(self, path: Path, on_result: Callable[[bool], None]) -> None:
+        """
+        Check a path exists without blocking the Tk thread.
+        
+        Args:
+            path: Path to stat
+            on_result: Called on the Tk thread with whether the path exists
+        """
+        def check() -> None:
+            self._ui_queue.put(partial(on_result, path.exists()))
+
+        threading.Thread(target=check, daemon=True).start()
+
     def _browse_input_file(self) -> None:
         """Open file dialog to select input file."""
         file_path = filedialog.askopenfilename(
             title="Select File to Convert",
-            filetypes=[
-                ("All Supported", "*.pdf;*.docx;*.pptx;*.xlsx;*.html;*.csv;*.json;*.xml;*.jpg;*.png;*.mp3;*.wav"),
-                ("PDF", "*.pdf"),
-                ("Word", "*.docx"),
-                ("PowerPoint", "*.pptx"),
-                ("Excel", "*.xlsx"),
-                ("HTML", "*.html"),
-                ("Images", "*.jpg;*.png;*.jpeg;*.gif"),
-                ("Audio", "*.mp3;*.wav;*.m4a"),
-                ("All Files", "*.*")
-            ]
+            filetypes=_INPUT_FILETYPES,
         )
         if file_path:
             self.input_file_var.set(file_path)
@@ -407,7 +478,7 @@ class ModernMainWindow(Observer, ctk.CTk):
         file_path = filedialog.asksaveasfilename(
             title="Save Markdown As",
             defaultextension=".md",
-            filetypes=[("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*")]
+            filetypes=_OUTPUT_FILETYPES,
         )
         if file_path:
             self.output_file_var.set(file_path)
@@ -420,13 +491,26 @@ class ModernMainWindow(Observer, ctk.CTk):
             return
 
         input_path = Path(input_file)
-        if not input_path.exists():
-            messagebox.showerror("File Not Found", f"The file does not exist:\n{input_file}")
-            return
-
         output_file = self.output_file_var.get().strip()
         output_path = Path(output_file) if output_file else None
 
+        self._async_validate_path(
+            input_path, partial(self._on_input_file_checked, input_path, output_path)
+        )
+
+    def _on_input_file_checked(
+        self,
+        input_path: Path,
+        output_path: Optional[Path],
+        exists: bool
+    ) -> None:
+        """Emit the conversion request once the input file is known to exist."""
+        if not exists:
+            self.after_idle(
+                messagebox.showerror, "File Not Found", f"The file does not exist:\n{input_path}"
+            )
+            return
+
         self.event_bus.emit(Event(
             EventType.FILE_SELECTED,
             {
@@ -454,7 +538,7 @@ class ModernMainWindow(Observer, ctk.CTk):
         file_path = filedialog.asksaveasfilename(
             title="Save Result",
             defaultextension=".md",
-            filetypes=[("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*")]
+            filetypes=_OUTPUT_FILETYPES,
         )
         if file_path:
             try:
@@ -469,98 +553,168 @@ class ModernMainWindow(Observer, ctk.CTk):
 
     def _on_history_clicked(self) -> None:
         """Handle history menu click."""
-        self.workspace.set("History")
+        self._show_tab("History")
 
     def _toggle_theme(self) -> None:
         """Toggle between dark and light theme."""
-        current_mode = ctk.get_appearance_mode()
-        new_mode = "light" if current_mode == "Dark" else "dark"
-        ctk.set_appearance_mode(new_mode)
+        new_mode = "light" if self._current_theme == "dark" else "dark"
         self._current_theme = new_mode
+        # Switching walks every widget; apply only the last of rapid toggles
+        if not self._theme_apply_pending:
+            self._theme_apply_pending = True
+            self.after_idle(self._apply_theme)
         self.status_bar.set_status(f"Theme switched to {new_mode}")
 
+    def _apply_theme(self) -> None:
+        """Apply the requested appearance mode if it isn't already active."""
+        self._theme_apply_pending = False
+        if ctk.get_appearance_mode().lower() != self._current_theme:
+            ctk.set_appearance_mode(self._current_theme)
+
     def _open_settings(self) -> None:
         """Open settings dialog."""
-        self.workspace.set("Settings")
+        self._show_tab("Settings")
         self.status_bar.set_status("Settings opened")
 
     def _open_profile(self) -> None:
         """Open profile dialog."""
         messagebox.showinfo("Profile", "Profile settings - to be implemented")
 
+    def _drain_ui_queue(self) -> None:
+        """Run every callback queued by event handlers, then reschedule."""
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in UI callback: {e}", exc_info=True)
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
     def _on_conversion_started(self, event: Event) -> None:
         """Handle conversion started event."""
-        self.after(0, self._update_ui_for_conversion_start)
+        self._ui_queue.put(self._update_ui_for_conversion_start)
 
     def _on_conversion_progress(self, event: Event) -> None:
         """Handle conversion progress event."""
-        progress = event.get("progress", 0.0)
-        self.after(0, lambda p=progress: self._update_progress(p))
+        # Keep only the latest value; one repaint per throttle interval
+        self._pending_progress = event.get("progress", 0.0)
+        if not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            self._ui_queue.put(partial(self.after, PROGRESS_THROTTLE_MS, self._flush_progress))
+
+    def _flush_progress(self) -> None:
+        """Apply the most recent pending progress value."""
+        self._progress_flush_scheduled = False
+        progress = self._pending_progress
+        self._pending_progress = None
+        if progress is not None:
+            self._update_progress(progress)
 
     def _on_conversion_completed(self, event: Event) -> None:
         """Handle conversion completed event."""
-        self.after(0, self._update_ui_for_conversion_complete)
+        self._ui_queue.put(self._update_ui_for_conversion_complete)
 
     def _on_conversion_failed(self, event: Event) -> None:
         """Handle conversion failed event."""
         error = event.get("error", "Unknown error")
-        self.after(0, lambda e=error: self._update_ui_for_conversion_failed(e))
+        self._ui_queue.put(partial(self._update_ui_for_conversion_failed, error))
 
     def _on_conversion_cancelled(self, event: Event) -> None:
         """Handle conversion cancelled event."""
-        self.after(0, self._update_ui_for_conversion_cancelled)
+        self._ui_queue.put(self._update_ui_for_conversion_cancelled)
 
     def _on_ui_error(self, event: Event) -> None:
         """Handle UI error event."""
         message = event.get("message", "An error occurred")
-        self.after(0, lambda m=message: messagebox.showerror("Error", m))
+        self._ui_queue.put(partial(self.after_idle, messagebox.showerror, "Error", message))
 
     def _on_ui_info(self, event: Event) -> None:
         """Handle UI info event."""
         message = event.get("message", "")
-        self.after(0, lambda m=message: messagebox.showinfo("Information", m))
+        self._ui_queue.put(partial(self.after_idle, messagebox.showinfo, "Information", message))
+
+    def _set_converting(self, active: bool) -> None:
+        """
+        Switch the Convert/Cancel buttons between idle and converting.
+        
+        Args:
+            active: Whether a conversion is running
+        """
+        # CTkButton redraws on every configure; skip repeats
+        if active == self._converting:
+            return
+        self._converting = active
+        self.convert_button.configure(state="disabled" if active else "normal")
+        self.cancel_button.configure(state="normal" if active else "disabled")
 
     def _update_ui_for_conversion_start(self) -> None:
         """Update UI when conversion starts."""
-        self.convert_button.configure(state="disabled")
-        self.cancel_button.configure(state="normal")
+        self._set_converting(True)
         self.progress_bar.set(0.0)
+        self._last_pct = -1
         self.progress_label.configure(text="Converting...")
         self.status_bar.set_status("Conversion started")
         self.result_text.delete("1.0", "end")
+        self._shown_result = None
 
     def _update_progress(self, progress: float) -> None:
         """Update progress bar."""
         self.progress_bar.set(progress)
-        self.progress_label.configure(text=f"Converting... {int(progress * 100)}%")
-        self.status_bar.set_progress(f"{int(progress * 100)}%")
+        pct = int(progress * 100)
+        if pct == self._last_pct:
+            return
+        self._last_pct = pct
+        self.progress_label.configure(text=f"Converting... {pct}%")
+        self.status_bar.set_progress(f"{pct}%")
 
     def _update_ui_for_conversion_complete(self) -> None:
         """Update UI when conversion completes."""
-        self.convert_button.configure(state="normal")
-        self.cancel_button.configure(state="disabled")
+        self._pending_progress = None
+        self._set_converting(False)
         self.progress_bar.set(1.0)
         self.progress_label.configure(text="Conversion completed!")
         self.status_bar.set_status("Conversion completed successfully")
 
         if self._current_state and self._current_state.current_conversion.result_text:
-            result = self._current_state.current_conversion.result_text
-            self.result_text.delete("1.0", "end")
-            self.result_text.insert("1.0", result)
-            self.preview_panel.set_content(result)
+            self._set_result_content(self._current_state.current_conversion.result_text)
+
+    def _set_result_content(self, text: str) -> None:
+        """
+        Show a conversion result in the result Textbox and preview panel.
+        
+        Skipped when the text matches what is already displayed and the
+        Textbox has not been edited since.
+        
+        Args:
+            text: Markdown result
+        """
+        textbox = self.result_text._textbox
+        if text == self._shown_result and not textbox.edit_modified():
+            return
+        self.result_text.delete("1.0", "end")
+        self.result_text.insert("1.0", text)
+        textbox.edit_modified(False)
+        self.preview_panel.set_content(text)
+        self._shown_result = text
 
     def _update_ui_for_conversion_failed(self, error: str) -> None:
         """Update UI when conversion fails."""
-        self.convert_button.configure(state="normal")
-        self.cancel_button.configure(state="disabled")
+        self._pending_progress = None
+        self._set_converting(False)
         self.progress_label.configure(text=f"Conversion failed: {error}")
         self.status_bar.set_status(f"Conversion failed: {error}")
-        messagebox.showerror("Conversion Failed", f"The conversion failed:\n{error}")
+        # Modal; opened once idle so the UI queue keeps draining meanwhile
+        self.after_idle(
+            messagebox.showerror, "Conversion Failed", f"The conversion failed:\n{error}"
+        )
 
     def _update_ui_for_conversion_cancelled(self) -> None:
         """Update UI when conversion is cancelled."""
-        self.convert_button.configure(state="normal")
-        self.cancel_button.configure(state="disabled")
+        self._pending_progress = None
+        self._set_converting(False)
         self.progress_label.configure(text="Conversion cancelled")
         self.status_bar.set_status("Conversion cancelled")
 
@@ -574,7 +728,18 @@ class ModernMainWindow(Observer, ctk.CTk):
         """
         if isinstance(event, AppState):
             self._current_state = event
-            self._update_ui_from_state(event)
+            # Widgets are only touched on the Tk thread; bursts collapse to one
+            self._pending_state = event
+            if not self._state_flush_queued:
+                self._state_flush_queued = True
+                self._ui_queue.put(self._flush_state)
+
+    def _flush_state(self) -> None:
+        """Render the most recent state received by update()."""
+        self._state_flush_queued = False
+        state = self._pending_state
+        if state is not None:
+            self._update_ui_from_state(state)
 
     def _update_ui_from_state(self, state: AppState) -> None:
         """
@@ -584,23 +749,26 @@ class ModernMainWindow(Observer, ctk.CTk):
             state: Current application state
         """
         conversion = state.current_conversion
-
-        if conversion.is_active:
-            self.progress_bar.set(conversion.progress)
-            self.progress_label.configure(text=f"Converting... {int(conversion.progress * 100)}%")
-        elif conversion.is_complete:
-            self.progress_bar.set(1.0)
-            if conversion.result_text:
-                self.result_text.delete("1.0", "end")
-                self.result_text.insert("1.0", conversion.result_text)
-                self.preview_panel.set_content(conversion.result_text)
-
-        if conversion.is_active:
-            self.convert_button.configure(state="disabled")
-            self.cancel_button.configure(state="normal")
-        else:
-            self.convert_button.configure(state="normal")
-            self.cancel_button.configure(state="disabled")
+        is_active = conversion.is_active
+        is_complete = conversion.is_complete
+        pct = int(conversion.progress * 100)
+        result = conversion.result_text
+
+        # Diff against what was last rendered and touch only what changed
+        last_active, last_complete, last_pct = self._last_rendered_state
+        self._last_rendered_state = (is_active, is_complete, pct)
+
+        if is_active:
+            if pct != last_pct or not last_active:
+                self.progress_bar.set(conversion.progress)
+                self.progress_label.configure(text=f"Converting... {pct}%")
+        elif is_complete:
+            if not last_complete:
+                self.progress_bar.set(1.0)
+            if result:
+                self._set_result_content(result)
+
+        self._set_converting(is_active)
 
     def run(self) -> None:
         """Start the main event loop."""
@@ -11,10 +11,13 @@ Features:
 - Plugin logs
 """
 
+import os
+import shutil
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Callable, Dict
 import logging
 
 from gui.core.plugin_system import PluginManager
@@ -43,8 +46,11 @@ class PluginManagementWindow(ctk.CTk):
             **kwargs: Additional CTk arguments
         """
         super().__init__(**kwargs)
+        # A manager created here is shut down with the window
+        self._owns_manager = plugin_manager is None
         self.plugin_manager = plugin_manager or PluginManager()
         self.selected_plugin_id: Optional[str] = None
+        self.marketplace_panel: Optional[PluginMarketplacePanel] = None
 
         self._setup_window()
         self._create_layout()
@@ -56,6 +62,13 @@ class PluginManagementWindow(ctk.CTk):
         self.title("MarkItDown - Plugin Management")
         self.geometry("1400x900")
         self.minsize(1200, 700)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        """Release the plugin manager if this window created it, then close."""
+        if self._owns_manager:
+            self.plugin_manager.shutdown()
+        self.destroy()
 
     def _create_layout(self) -> None:
         """Create main layout."""
@@ -118,18 +131,29 @@ class PluginManagementWindow(ctk.CTk):
         )
         self.details_panel.pack(fill="both", expand=True)
 
-        # Marketplace tab
-        marketplace_tab = self.tabs.add("Marketplace")
+        # Marketplace and Logs tabs are built when first shown
+        self.marketplace_tab = self.tabs.add("Marketplace")
+        self.logs_tab = self.tabs.add("Logs")
+        self._pending_tabs: Dict[str, Callable[[], None]] = {
+            "Marketplace": self._create_marketplace_view,
+            "Logs": partial(self._create_logs_view, self.logs_tab),
+        }
+        self.tabs.configure(command=self._on_tab_change)
+
+    def _on_tab_change(self) -> None:
+        """Build the selected tab's widgets on its first activation."""
+        builder = self._pending_tabs.pop(self.tabs.get(), None)
+        if builder is not None:
+            builder()
+
+    def _create_marketplace_view(self) -> None:
+        """Create marketplace view."""
         self.marketplace_panel = PluginMarketplacePanel(
-            marketplace_tab,
+            self.marketplace_tab,
             self.plugin_manager,
         )
         self.marketplace_panel.pack(fill="both", expand=True)
 
-        # Logs tab
-        logs_tab = self.tabs.add("Logs")
-        self._create_logs_view(logs_tab)
-
     def _create_logs_view(self, parent: ctk.CTkFrame) -> None:
         """Create logs view."""
         ctk.CTkLabel(
@@ -163,11 +187,19 @@ class PluginManagementWindow(ctk.CTk):
         )
         if file_path:
             try:
-                # Copy to plugins directory
+                # Link (same device) or copy into the plugins directory
                 plugin_file = Path(file_path)
-                dest_file = self.plugin_manager.plugins_dir / plugin_file.name
-                import shutil
-                shutil.copy2(plugin_file, dest_file)
+                plugins_dir = self.plugin_manager.plugins_dir
+                dest_file = plugins_dir / plugin_file.name
+                linked = False
+                if plugin_file.stat().st_dev == plugins_dir.stat().st_dev:
+                    try:
+                        os.link(plugin_file, dest_file)
+                        linked = True
+                    except OSError:
+                        pass
+                if not linked:
+                    shutil.copy2(plugin_file, dest_file)
 
                 # Reload plugin
                 plugin = self.plugin_manager._load_plugin(dest_file)
@@ -188,19 +220,16 @@ class PluginManagementWindow(ctk.CTk):
 
     def _refresh_logs(self) -> None:
         """Refresh plugin logs."""
-        self.logs_text.delete("1.0", "end")
-
-        # Collect logs from all plugins
+        # Collect logs from all plugins, then write them in one insert
+        parts = []
         for plugin in self.plugin_manager.get_all_plugins():
             logs = self.plugin_manager.get_plugin_logs(plugin.plugin_id)
             if logs:
-                self.logs_text.insert(
-                    "end",
-                    f"=== {plugin.metadata.name} ===\n"
-                )
-                for log in logs[-10:]:  # Last 10 logs
-                    self.logs_text.insert("end", f"{log}\n")
-                self.logs_text.insert("end", "\n")
+                body = "\n".join(logs[-10:])  # Last 10 logs
+                parts.append(f"=== {plugin.metadata.name} ===\n{body}\n\n")
+
+        self.logs_text.delete("1.0", "end")
+        self.logs_text.insert("1.0", "".join(parts))
 
     def set_context(self, context: dict) -> None:
         """
@@ -15,19 +15,52 @@ Features:
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple
 import logging
+import queue
 
 from gui.core.markdown_renderer import MarkdownRenderer, RenderOptions, PreviewTheme
 from gui.components.markdown_preview import MarkdownPreviewPanel, SplitPreviewView
 
 logger = logging.getLogger(__name__)
 
+# Rendered documents kept for copy/export
+HTML_CACHE_SIZE = 8
+
+# HTML larger than this is served to the X11 clipboard on request
+CLIPBOARD_HANDLER_THRESHOLD = 1 << 20
+
+# Interval at which queued UI callbacks are drained on the Tk thread
+UI_QUEUE_POLL_MS = 16
+
+# Theme menu values to renderer themes
+_THEME_MAP = {
+    "github": PreviewTheme.GITHUB,
+    "readthedocs": PreviewTheme.READTHEDOCS,
+    "github_dark": PreviewTheme.GITHUB_DARK,
+    "minimal": PreviewTheme.MINIMAL,
+}
+
 
 class MarkdownPreviewWindow(ctk.CTk):
     """Sophisticated Markdown preview window."""
 
+    # Toolbar buttons: (text, handler method, width)
+    _FILE_BUTTONS = (
+        ("Open", "_open_file", 80),
+        ("Save", "_save_file", 80),
+    )
+    _EXPORT_BUTTONS = (
+        ("Export HTML", "_export_html", 100),
+        ("Export PDF", "_export_pdf", 100),
+        ("Copy HTML", "_copy_html", 100),
+        ("Presentation", "_toggle_presentation", 100),
+    )
+
     def __init__(
         self,
         markdown_text: str = "",
@@ -45,15 +78,25 @@ class MarkdownPreviewWindow(ctk.CTk):
         
         # Create renderer
         self.renderer = MarkdownRenderer()
+        self._html_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
         
         # Presentation mode
         self.presentation_mode = False
         self.presentation_window: Optional[ctk.CTkToplevel] = None
 
+        # File I/O runs here so large files don't block the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="preview-io")
+        self._closing = False
+        # Background I/O results, run by _drain_ui_queue on the Tk thread
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._clipboard_html: Optional[str] = None
+
         self._setup_window()
         self._create_layout()
         self._load_content(markdown_text)
 
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
         logger.info("Markdown preview window initialized")
 
     def _setup_window(self) -> None:
@@ -61,6 +104,45 @@ class MarkdownPreviewWindow(ctk.CTk):
         self.title("MarkItDown - Markdown Preview")
         self.geometry("1400x900")
         self.minsize(1200, 700)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        """Stop background I/O and close the window."""
+        self._closing = True
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _drain_ui_queue(self) -> None:
+        """Run every callback queued by the I/O pool, then reschedule."""
+        if self._closing:
+            return
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in UI callback: {e}", exc_info=True)
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+    def _run_in_background(
+        self,
+        on_done: Callable[[Future], None],
+        fn: Callable[..., Any],
+        *args: Any
+    ) -> None:
+        """
+        Run fn in the I/O pool and hand its future to on_done on the Tk thread.
+        
+        Args:
+            on_done: Called with the completed future on the Tk thread
+            fn: Function to run in the background
+            *args: Arguments for fn
+        """
+        future = self._io_pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._ui_queue.put(partial(on_done, f)))
 
     def _create_layout(self) -> None:
         """Create main layout."""
@@ -72,19 +154,7 @@ class MarkdownPreviewWindow(ctk.CTk):
         left_toolbar = ctk.CTkFrame(toolbar)
         left_toolbar.pack(side="left", padx=5)
 
-        ctk.CTkButton(
-            left_toolbar,
-            text="Open",
-            command=self._open_file,
-            width=80,
-        ).pack(side="left", padx=2)
-
-        ctk.CTkButton(
-            left_toolbar,
-            text="Save",
-            command=self._save_file,
-            width=80,
-        ).pack(side="left", padx=2)
+        self._add_toolbar_buttons(left_toolbar, self._FILE_BUTTONS)
 
         # Center - View controls
         center_toolbar = ctk.CTkFrame(toolbar)
@@ -128,33 +198,7 @@ class MarkdownPreviewWindow(ctk.CTk):
         right_toolbar = ctk.CTkFrame(toolbar)
         right_toolbar.pack(side="right", padx=5)
 
-        ctk.CTkButton(
-            right_toolbar,
-            text="Export HTML",
-            command=self._export_html,
-            width=100,
-        ).pack(side="left", padx=2)
-
-        ctk.CTkButton(
-            right_toolbar,
-            text="Export PDF",
-            command=self._export_pdf,
-            width=100,
-        ).pack(side="left", padx=2)
-
-        ctk.CTkButton(
-            right_toolbar,
-            text="Copy HTML",
-            command=self._copy_html,
-            width=100,
-        ).pack(side="left", padx=2)
-
-        ctk.CTkButton(
-            right_toolbar,
-            text="Presentation",
-            command=self._toggle_presentation,
-            width=100,
-        ).pack(side="left", padx=2)
+        self._add_toolbar_buttons(right_toolbar, self._EXPORT_BUTTONS)
 
         # Main content area
         self.content_frame = ctk.CTkFrame(self)
@@ -164,71 +208,110 @@ class MarkdownPreviewWindow(ctk.CTk):
         self.split_view = SplitPreviewView(
             self.content_frame,
             renderer=self.renderer,
-            on_content_change=self._on_content_change,
         )
         self.split_view.pack(fill="both", expand=True)
 
-        # Store references for view switching
+        # View panels are built on first use and then only packed/unpacked
         self.current_view = "split"
+        self._views: Dict[str, ctk.CTkFrame] = {"split": self.split_view}
+
+    def _add_toolbar_buttons(
+        self,
+        parent: ctk.CTkFrame,
+        spec: Tuple[Tuple[str, str, int], ...]
+    ) -> None:
+        """
+        Create a row of toolbar buttons from a spec.
+        
+        Args:
+            parent: Toolbar frame
+            spec: (text, handler method name, width) per button
+        """
+        for text, handler, width in spec:
+            ctk.CTkButton(
+                parent,
+                text=text,
+                command=getattr(self, handler),
+                width=width,
+            ).pack(side="left", padx=2)
 
     def _load_content(self, markdown_text: str) -> None:
         """Load markdown content."""
-        if hasattr(self, 'split_view'):
-            self.split_view.set_content(markdown_text)
-
-    def _change_view_mode(self, mode: str) -> None:
-        """Change view mode."""
-        # Clear current view
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        if mode == "split":
-            self.split_view = SplitPreviewView(
-                self.content_frame,
-                renderer=self.renderer,
-                on_content_change=self._on_content_change,
+        self.markdown_text = markdown_text
+        # The split and markdown views share one text store
+        self.split_view.set_content(markdown_text)
+        if self.current_view == "preview":
+            self.preview_only.update_preview(markdown_text)
+
+    def _get_content(self) -> str:
+        """Get the markdown text from the active view."""
+        if self.current_view == "preview":
+            return self.markdown_text
+        return self.split_view.get_content()
+
+    def _get_view(self, mode: str) -> ctk.CTkFrame:
+        """Get the panel for a view mode, creating it on first use."""
+        view = self._views.get(mode)
+        if view is not None:
+            return view
+
+        if mode == "markdown":
+            # Markdown only, editing the split view's text in place
+            view = ctk.CTkFrame(self.content_frame)
+            view.grid_rowconfigure(0, weight=1)
+            view.grid_columnconfigure(0, weight=1)
+            self.markdown_text_widget = self.split_view.create_peer(view)
+            y_scroll = ctk.CTkScrollbar(view, command=self.markdown_text_widget.yview)
+            x_scroll = ctk.CTkScrollbar(
+                view,
+                orientation="horizontal",
+                command=self.markdown_text_widget.xview,
             )
-            self.split_view.pack(fill="both", expand=True)
-            self.split_view.set_content(self.markdown_text)
-            self.current_view = "split"
-
-        elif mode == "markdown":
-            # Markdown only
-            markdown_frame = ctk.CTkFrame(self.content_frame)
-            markdown_frame.pack(fill="both", expand=True)
-
-            self.markdown_text_widget = ctk.CTkTextbox(
-                markdown_frame,
-                wrap="none",
-                font=ctk.CTkFont(family="Consolas", size=11),
+            self.markdown_text_widget.configure(
+                yscrollcommand=y_scroll.set,
+                xscrollcommand=x_scroll.set,
             )
-            self.markdown_text_widget.pack(fill="both", expand=True, padx=5, pady=5)
-            self.markdown_text_widget.insert("1.0", self.markdown_text)
-            self.current_view = "markdown"
-
-        elif mode == "preview":
+            self.markdown_text_widget.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=(5, 0))
+            y_scroll.grid(row=0, column=1, sticky="ns", pady=(5, 0))
+            x_scroll.grid(row=1, column=0, sticky="ew", padx=(5, 0))
+        else:
             # Preview only
-            preview_frame = ctk.CTkFrame(self.content_frame)
-            preview_frame.pack(fill="both", expand=True)
-
+            view = ctk.CTkFrame(self.content_frame)
             self.preview_only = MarkdownPreviewPanel(
-                preview_frame,
+                view,
                 renderer=self.renderer,
             )
             self.preview_only.pack(fill="both", expand=True)
+
+        self._views[mode] = view
+        return view
+
+    def _show_content(self, mode: str) -> None:
+        """Bring a view's rendering up to date with the current text."""
+        if mode == "split":
+            # Picks up edits made in the markdown-only peer
+            self.split_view._on_markdown_change()
+        elif mode == "preview":
             self.preview_only.update_preview(self.markdown_text)
-            self.current_view = "preview"
+
+    def _change_view_mode(self, mode: str) -> None:
+        """Change view mode."""
+        if mode == self.current_view:
+            return
+
+        # Only the preview-only view needs the text copied out of the editor
+        if mode == "preview":
+            self.markdown_text = self._get_content()
+        self._views[self.current_view].pack_forget()
+
+        view = self._get_view(mode)
+        view.pack(fill="both", expand=True)
+        self.current_view = mode
+        self._show_content(mode)
 
     def _change_theme(self, theme_name: str) -> None:
         """Change preview theme."""
-        theme_map = {
-            "github": PreviewTheme.GITHUB,
-            "readthedocs": PreviewTheme.READTHEDOCS,
-            "github_dark": PreviewTheme.GITHUB_DARK,
-            "minimal": PreviewTheme.MINIMAL,
-        }
-        theme = theme_map.get(theme_name, PreviewTheme.GITHUB)
-        self.renderer.options.theme = theme
+        self.renderer.options.theme = _THEME_MAP.get(theme_name, PreviewTheme.GITHUB)
         self._update_preview()
 
     def _toggle_dark_mode(self) -> None:
@@ -239,15 +322,11 @@ class MarkdownPreviewWindow(ctk.CTk):
 
     def _update_preview(self) -> None:
         """Update preview with current content."""
-        if hasattr(self, 'split_view'):
+        if self.current_view == "split":
             self.split_view._on_markdown_change()
-        elif hasattr(self, 'preview_only'):
+        elif self.current_view == "preview":
             self.preview_only.update_preview(self.markdown_text)
 
-    def _on_content_change(self, content: str) -> None:
-        """Handle content change."""
-        self.markdown_text = content
-
     def _open_file(self) -> None:
         """Open markdown file."""
         file_path = filedialog.askopenfilename(
@@ -255,14 +334,18 @@ class MarkdownPreviewWindow(ctk.CTk):
             filetypes=[("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*")]
         )
         if file_path:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.markdown_text = content
-                self._load_content(content)
-                messagebox.showinfo("Success", "File loaded successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load file: {e}")
+            self._run_in_background(self._finish_open, Path(file_path).read_text, "utf-8")
+
+    def _finish_open(self, future: Future) -> None:
+        """Load the content read by _open_file."""
+        try:
+            content = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load file: {e}")
+            return
+        self.markdown_text = content
+        self._load_content(content)
+        messagebox.showinfo("Success", "File loaded successfully!")
 
     def _save_file(self) -> None:
         """Save markdown file."""
@@ -272,13 +355,42 @@ class MarkdownPreviewWindow(ctk.CTk):
             filetypes=[("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*")]
         )
         if file_path:
-            try:
-                content = self.split_view.get_content() if hasattr(self, 'split_view') else self.markdown_text
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                messagebox.showinfo("Success", "File saved successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {e}")
+            content = self._get_content()
+            self._run_in_background(
+                self._finish_save, Path(file_path).write_text, content, "utf-8"
+            )
+
+    def _finish_save(self, future: Future) -> None:
+        """Report the result of _save_file."""
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save file: {e}")
+            return
+        messagebox.showinfo("Success", "File saved successfully!")
+
+    def _render_cached(self, content: str) -> str:
+        """
+        Render markdown to HTML, reusing recent results.
+        
+        Args:
+            content: Markdown text
+            
+        Returns:
+            Rendered HTML document
+        """
+        options = self.renderer.options
+        key = (content, options.theme, options.dark_mode, options.zoom_level)
+        html = self._html_cache.get(key)
+        if html is not None:
+            self._html_cache.move_to_end(key)
+            return html
+
+        html = self.renderer.render(content)
+        self._html_cache[key] = html
+        if len(self._html_cache) > HTML_CACHE_SIZE:
+            self._html_cache.popitem(last=False)
+        return html
 
     def _export_html(self) -> None:
         """Export preview as HTML."""
@@ -288,11 +400,16 @@ class MarkdownPreviewWindow(ctk.CTk):
             filetypes=[("HTML", "*.html"), ("All Files", "*.*")]
         )
         if file_path:
-            content = self.split_view.get_content() if hasattr(self, 'split_view') else self.markdown_text
-            if self.renderer.export_html(content, Path(file_path)):
-                messagebox.showinfo("Success", "HTML exported successfully!")
-            else:
-                messagebox.showerror("Error", "Failed to export HTML")
+            content = self._get_content()
+            html = self._render_cached(content)
+            self._run_in_background(
+                partial(
+                    self._finish_export,
+                    "HTML exported successfully!",
+                    "Failed to export HTML",
+                ),
+                self.renderer.export_html, content, Path(file_path), html,
+            )
 
     def _export_pdf(self) -> None:
         """Export preview as PDF."""
@@ -302,20 +419,61 @@ class MarkdownPreviewWindow(ctk.CTk):
             filetypes=[("PDF", "*.pdf"), ("All Files", "*.*")]
         )
         if file_path:
-            content = self.split_view.get_content() if hasattr(self, 'split_view') else self.markdown_text
-            if self.renderer.export_pdf(content, Path(file_path)):
-                messagebox.showinfo("Success", "PDF exported successfully!")
-            else:
-                messagebox.showerror("Error", "Failed to export PDF. Make sure weasyprint is installed.")
+            content = self._get_content()
+            html = self._render_cached(content)
+            self._run_in_background(
+                partial(
+                    self._finish_export,
+                    "PDF exported successfully!",
+                    "Failed to export PDF. Make sure weasyprint is installed.",
+                ),
+                self.renderer.export_pdf, content, Path(file_path), html,
+            )
+
+    def _finish_export(self, success_message: str, error_message: str, future: Future) -> None:
+        """
+        Report the result of a background export.
+        
+        Args:
+            success_message: Shown when the export succeeded
+            error_message: Shown when it failed
+            future: Completed export future
+        """
+        try:
+            exported = future.result()
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
+            exported = False
+        if exported:
+            messagebox.showinfo("Success", success_message)
+        else:
+            messagebox.showerror("Error", error_message)
 
     def _copy_html(self) -> None:
         """Copy rendered HTML to clipboard."""
-        content = self.split_view.get_content() if hasattr(self, 'split_view') else self.markdown_text
-        html = self.renderer.render(content)
-        self.clipboard_clear()
-        self.clipboard_append(html)
+        content = self._get_content()
+        html = self._render_cached(content)
+        if len(html) > CLIPBOARD_HANDLER_THRESHOLD and self._windowingsystem == "x11":
+            # Hand out slices on request instead of copying it into Tk
+            self._clipboard_html = html
+            self.selection_handle(self._serve_clipboard, selection="CLIPBOARD")
+            self.selection_own(selection="CLIPBOARD", command=self._release_clipboard)
+        else:
+            self.clipboard_clear()
+            self.clipboard_append(html)
         messagebox.showinfo("Success", "HTML copied to clipboard!")
 
+    def _serve_clipboard(self, offset: str, length: str) -> str:
+        """Return one chunk of the copied HTML for an X11 selection request."""
+        if self._clipboard_html is None:
+            return ""
+        start = int(offset)
+        return self._clipboard_html[start:start + int(length)]
+
+    def _release_clipboard(self) -> None:
+        """Drop the copied HTML once another client owns the clipboard."""
+        self._clipboard_html = None
+
     def _toggle_presentation(self) -> None:
         """Toggle presentation mode (fullscreen)."""
         if not self.presentation_mode:
@@ -342,7 +500,7 @@ class MarkdownPreviewWindow(ctk.CTk):
         )
         presentation_preview.pack(fill="both", expand=True)
         
-        content = self.split_view.get_content() if hasattr(self, 'split_view') else self.markdown_text
+        content = self._get_content()
         presentation_preview.update_preview(content)
 
         # Close button
@@ -6,16 +6,134 @@ editing templates, and previewing results.
 """
 
 import customtkinter as ctk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
+from collections import OrderedDict, defaultdict
+from copy import deepcopy
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import logging
-
-from gui.core.templates import TemplateManager, MarkdownTemplate, TemplateCategory
+import queue
+import re
+import threading
+
+from gui.core.templates import (
+    TemplateManager,
+    MarkdownTemplate,
+    TemplateCategory,
+    get_template_manager,
+)
 from gui.components.template_editor import TemplateEditor, TemplateManagerUI
 
 logger = logging.getLogger(__name__)
 
+# Rendered template previews kept for reselection
+PREVIEW_CACHE_SIZE = 128
+
+# Interval for picking up finished preview renders
+PREVIEW_POLL_MS = 50
+
+# Jinja expressions using the render-time {{ date }} / {{ time }} variables;
+# previews of templates containing them are never cached
+_CLOCK_VARIABLE = re.compile(r"\{[{%][^}]*\b(?:date|time)\b")
+
+# Document and metadata rendered by template previews
+_SAMPLE_PREVIEW_CONTENT = """# Sample Content
+
+This is a sample markdown content for preview.
+
+## Section 1
+
+Some text here with **bold** and *italic* formatting.
+
+### Subsection
+
+- List item 1
+- List item 2
+- List item 3
+
+## Section 2
+
+More content with `code` and [links](https://example.com).
+"""
+_SAMPLE_METADATA = {
+    "title": "Preview Document",
+    "author": "Preview Author",
+    "date": "2024-01-01",
+}
+
+
+def _bulk_set(widget: ctk.CTkTextbox, text: str) -> None:
+    """
+    Replace a read-only textbox's content in a single write.
+    
+    Args:
+        widget: Textbox to fill (left disabled)
+        text: New content
+    """
+    tk_text = widget._textbox
+    tk_text.configure(autoseparators=False)
+    widget.configure(state="normal")
+    widget.delete("1.0", "end")
+    widget.insert("end", text)
+    widget.configure(state="disabled")
+    tk_text.configure(autoseparators=True)
+    tk_text.edit_reset()
+
+
+# Template list columns: (column id, heading, width)
+_TEMPLATE_COLUMNS = (
+    ("name", "Name", 220),
+    ("category", "Category", 110),
+    ("description", "Description", 360),
+)
+
+
+def _create_template_tree(parent: ctk.CTkFrame) -> ttk.Treeview:
+    """
+    Create a scrollable, single-selection template list.
+    
+    Args:
+        parent: Frame to pack the list into
+        
+    Returns:
+        Treeview whose item ids are template ids
+    """
+    tree = ttk.Treeview(
+        parent,
+        columns=[column for column, _, _ in _TEMPLATE_COLUMNS],
+        show="headings",
+        selectmode="browse",
+    )
+    for column, heading, width in _TEMPLATE_COLUMNS:
+        tree.heading(column, text=heading)
+        tree.column(column, width=width, stretch=column == "description")
+
+    scrollbar = ctk.CTkScrollbar(parent, command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+    return tree
+
+
+def _fill_template_tree(tree: ttk.Treeview, templates: List[MarkdownTemplate]) -> None:
+    """
+    Replace a template list's rows.
+    
+    Args:
+        tree: List created by _create_template_tree
+        templates: Templates to show, in order
+    """
+    tree.delete(*tree.get_children())
+    for template in templates:
+        tree.insert("", "end", iid=template.template_id, values=_template_row(template))
+
+
+def _template_row(template: MarkdownTemplate) -> Tuple[str, str, str]:
+    """Get a template's column values for a template list."""
+    return (template.name, template.category.value, template.description)
+
 
 class TemplateManagementWindow(ctk.CTk):
     """Main window for template management."""
@@ -29,11 +147,24 @@ class TemplateManagementWindow(ctk.CTk):
             **kwargs: Additional CTk arguments
         """
         super().__init__(**kwargs)
-        self.template_manager = TemplateManager(storage_path=storage_path)
+        self.template_manager = get_template_manager(storage_path)
         self.current_template: Optional[MarkdownTemplate] = None
+        self._preview_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        self._templates_cache: Optional[List[MarkdownTemplate]] = None
+        self._by_category: Dict[TemplateCategory, List[MarkdownTemplate]] = {}
+        self._cache_dirty = True
+        self._library_built = False
+        self._library_category: Optional[TemplateCategory] = None
+        self._preview_stale = False
+        self._pending_preview_text: Optional[str] = None
+
+        # Renders finished by worker threads: (generation, cache key, text)
+        self._preview_queue: "queue.SimpleQueue[Tuple[int, Optional[Tuple[Any, ...]], str]]" = queue.SimpleQueue()
+        self._preview_generation = 0
 
         self._setup_window()
         self._create_layout()
+        self.after(PREVIEW_POLL_MS, self._drain_preview_queue)
 
         logger.info("Template management window initialized")
 
@@ -106,9 +237,22 @@ class TemplateManagementWindow(ctk.CTk):
         )
         self.preview_output.pack(fill="both", expand=True)
 
-        # Library tab
+        # Library tab is built when first shown
         library_tab = self.tabs.add("Library")
-        self._create_library_view(library_tab)
+        self._pending_tabs: Dict[str, Callable[[], None]] = {
+            "Library": partial(self._create_library_view, library_tab),
+        }
+        self.tabs.configure(command=self._on_tab_change)
+
+    def _on_tab_change(self) -> None:
+        """Build tabs on first activation and refresh a stale preview."""
+        name = self.tabs.get()
+        builder = self._pending_tabs.pop(name, None)
+        if builder is not None:
+            self.after_idle(builder)
+        if name == "Preview" and self._preview_stale:
+            self._preview_stale = False
+            self.after_idle(self._show_preview, self._pending_preview_text)
 
     def _create_library_view(self, parent: ctk.CTkFrame) -> None:
         """Create library view with predefined templates."""
@@ -137,7 +281,7 @@ class TemplateManagementWindow(ctk.CTk):
             btn = ctk.CTkButton(
                 button_frame,
                 text=name,
-                command=lambda c=category: self._load_category_templates(c),
+                command=partial(self._load_category_templates, category),
                 width=120,
             )
             btn.pack(side="left", padx=5)
@@ -146,45 +290,78 @@ class TemplateManagementWindow(ctk.CTk):
         list_frame = ctk.CTkFrame(parent)
         list_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-        self.library_listbox = ctk.CTkTextbox(list_frame)
-        self.library_listbox.pack(fill="both", expand=True)
+        self.library_listbox = _create_template_tree(list_frame)
+        self.library_listbox.bind("<<TreeviewSelect>>", self._on_library_select)
+
+        self._library_built = True
 
         # Load all templates
         self._load_all_templates()
 
+    def _get_templates_cached(self) -> List[MarkdownTemplate]:
+        """Get all templates, querying the manager only after a change."""
+        if self._cache_dirty or self._templates_cache is None:
+            self._templates_cache = self.template_manager.get_all_templates()
+            self._rebuild_indexes()
+            self._cache_dirty = False
+        return self._templates_cache
+
+    def _rebuild_indexes(self) -> None:
+        """Group the cached templates by category."""
+        by_category: Dict[TemplateCategory, List[MarkdownTemplate]] = defaultdict(list)
+        for template in self._templates_cache:
+            by_category[template.category].append(template)
+        self._by_category = dict(by_category)
+
     def _load_all_templates(self) -> None:
         """Load all templates into library view."""
-        templates = self.template_manager.get_all_templates()
-        self.library_listbox.delete("1.0", "end")
-
-        for template in templates:
-            self.library_listbox.insert(
-                "end",
-                f"📄 {template.name}\n"
-                f"   Category: {template.category.value}\n"
-                f"   {template.description}\n"
-                f"   ID: {template.template_id}\n\n"
-            )
+        self._library_category = None
+        _fill_template_tree(self.library_listbox, self._get_templates_cached())
 
     def _load_category_templates(self, category: TemplateCategory) -> None:
         """Load templates by category."""
-        templates = self.template_manager.get_templates_by_category(category)
-        self.library_listbox.delete("1.0", "end")
-
+        self._library_category = category
+        self._get_templates_cached()
+        templates = self._by_category.get(category, [])
+        _fill_template_tree(self.library_listbox, templates)
         if not templates:
-            self.library_listbox.insert("1.0", f"No templates found in category: {category.value}")
-            return
-
-        for template in templates:
             self.library_listbox.insert(
-                "end",
-                f"📄 {template.name}\n"
-                f"   {template.description}\n"
-                f"   ID: {template.template_id}\n\n"
+                "", "end", values=(f"No templates found in category: {category.value}", "", "")
             )
 
+    def _update_library_row(self, template: MarkdownTemplate) -> None:
+        """
+        Bring one template's row in the library list up to date.
+        
+        Args:
+            template: Template that was added or changed
+        """
+        tree = self.library_listbox
+        template_id = template.template_id
+        category = self._library_category
+        if category is None or template.category == category:
+            if tree.exists(template_id):
+                tree.item(template_id, values=_template_row(template))
+                return
+            if category is None:
+                tree.insert("", "end", iid=template_id, values=_template_row(template))
+                return
+        elif not tree.exists(template_id):
+            return
+
+        # Template moves into or out of the category being shown
+        self._load_category_templates(category)
+
+    def _on_library_select(self, event: Any = None) -> None:
+        """Open the template picked in the library list."""
+        selection = self.library_listbox.selection()
+        if selection:
+            self._on_template_selected(selection[0])
+
     def _on_template_selected(self, template_id: str) -> None:
         """Handle template selection."""
+        if self.current_template and self.current_template.template_id == template_id:
+            return
         template = self.template_manager.get_template(template_id)
         if template:
             self.current_template = template
@@ -196,53 +373,112 @@ class TemplateManagementWindow(ctk.CTk):
         """Save template."""
         try:
             self.template_manager.add_template(template)
+            self._preview_cache.clear()
+            self._cache_dirty = True
             messagebox.showinfo("Success", f"Template '{template.name}' saved successfully!")
-            self._load_all_templates()
+            if self._library_built:
+                self._update_library_row(template)
         except Exception as e:
             logger.error(f"Failed to save template: {e}")
             messagebox.showerror("Error", f"Failed to save template: {e}")
 
     def _update_preview(self, rendered_text: Optional[str] = None) -> None:
-        """Update preview output."""
-        if rendered_text:
-            self.preview_output.delete("1.0", "end")
-            self.preview_output.insert("1.0", rendered_text)
-        else:
-            # Generate preview from current template
-            if self.current_template:
-                sample_content = """# Sample Content
-
-This is a sample markdown content for preview.
-
-## Section 1
-
-Some text here with **bold** and *italic* formatting.
-
-### Subsection
-
-- List item 1
-- List item 2
-- List item 3
+        """
+        Update preview output, or defer it until the Preview tab is shown.
+        
+        Args:
+            rendered_text: Already rendered text (renders current template if None)
+        """
+        if self.tabs.get() != "Preview":
+            self._preview_stale = True
+            self._pending_preview_text = rendered_text
+            return
+        self._show_preview(rendered_text)
 
-## Section 2
+    def _show_preview(self, rendered_text: Optional[str] = None) -> None:
+        """Write the preview output, rendering the current template in the background."""
+        # Results of renders started before this call are no longer shown
+        self._preview_generation += 1
+        if rendered_text:
+            self._set_preview_output(rendered_text)
+            return
 
-More content with `code` and [links](https://example.com).
-"""
+        # Generate preview from current template
+        template = self.current_template
+        if not template:
+            return
 
-                try:
-                    rendered = self.current_template.render(
-                        sample_content,
-                        metadata={
-                            "title": "Preview Document",
-                            "author": "Preview Author",
-                            "date": "2024-01-01",
-                        }
-                    )
-                    self.preview_output.delete("1.0", "end")
-                    self.preview_output.insert("1.0", rendered)
-                except Exception as e:
-                    self.preview_output.delete("1.0", "end")
-                    self.preview_output.insert("1.0", f"Preview Error: {e}")
+        # The editor changes sources, metadata and rules in place without
+        # touching updated_at, so they are all part of the key
+        sources = (template.header_template, template.template_content, template.footer_template)
+        if any(source and _CLOCK_VARIABLE.search(source) for source in sources):
+            key = None
+        else:
+            key = (
+                template.template_id,
+                template.updated_at,
+                *sources,
+                repr(template.metadata),
+                repr(template.post_processing),
+            )
+            rendered = self._preview_cache.get(key)
+            if rendered is not None:
+                self._preview_cache.move_to_end(key)
+                self._set_preview_output(rendered)
+                return
+
+        # Render a snapshot so editor changes can't race the worker; the
+        # editor mutates metadata and the rules list in place, so copy those
+        snapshot = replace(
+            template,
+            metadata=deepcopy(template.metadata),
+            post_processing=deepcopy(template.post_processing),
+        )
+        threading.Thread(
+            target=self._render_worker,
+            args=(self._preview_generation, key, snapshot),
+            daemon=True,
+        ).start()
+
+    def _render_worker(
+        self,
+        generation: int,
+        key: Optional[Tuple[Any, ...]],
+        template: MarkdownTemplate
+    ) -> None:
+        """
+        Render a template preview off the Tk thread.
+        
+        Args:
+            generation: Preview request the render belongs to
+            key: Preview cache key (None to not cache the result)
+            template: Template snapshot to render
+        """
+        try:
+            rendered = template.render(_SAMPLE_PREVIEW_CONTENT, metadata=_SAMPLE_METADATA)
+        except Exception as e:
+            self._preview_queue.put((generation, None, f"Preview Error: {e}"))
+            return
+        self._preview_queue.put((generation, key, rendered))
+
+    def _drain_preview_queue(self) -> None:
+        """Show finished renders, then reschedule."""
+        while True:
+            try:
+                generation, key, text = self._preview_queue.get_nowait()
+            except queue.Empty:
+                break
+            if key is not None:
+                self._preview_cache[key] = text
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+            if generation == self._preview_generation:
+                self._set_preview_output(text)
+        self.after(PREVIEW_POLL_MS, self._drain_preview_queue)
+
+    def _set_preview_output(self, text: str) -> None:
+        """Replace the preview output text."""
+        _bulk_set(self.preview_output, text)
 
     def apply_template(self, content: str, template_id: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -275,17 +511,27 @@ More content with `code` and [links](https://example.com).
 class TemplateSelectorDialog(ctk.CTkToplevel):
     """Dialog for selecting a template."""
 
-    def __init__(self, parent: Any, template_manager: TemplateManager, **kwargs) -> None:
+    def __init__(
+        self,
+        parent: Any,
+        template_manager: TemplateManager,
+        templates: Optional[List[MarkdownTemplate]] = None,
+        **kwargs
+    ) -> None:
         """
         Initialize template selector dialog.
         
         Args:
             parent: Parent window
             template_manager: TemplateManager instance
+            templates: Templates to offer (queries template_manager if None)
             **kwargs: Additional CTkToplevel arguments
         """
         super().__init__(parent, **kwargs)
         self.template_manager = template_manager
+        if templates is None:
+            templates = template_manager.get_all_templates()
+        self.templates = templates
         self.selected_template: Optional[MarkdownTemplate] = None
 
         self.title("Select Template")
@@ -309,17 +555,12 @@ class TemplateSelectorDialog(ctk.CTkToplevel):
         list_frame = ctk.CTkFrame(self)
         list_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-        self.template_listbox = ctk.CTkTextbox(list_frame)
-        self.template_listbox.pack(fill="both", expand=True)
+        self.template_listbox = _create_template_tree(list_frame)
 
-        # Load templates
-        templates = self.template_manager.get_all_templates()
-        for template in templates:
-            self.template_listbox.insert(
-                "end",
-                f"📄 {template.name} ({template.category.value})\n"
-                f"   {template.description}\n\n"
-            )
+        # Load templates, with the first one preselected
+        _fill_template_tree(self.template_listbox, self.templates)
+        if self.templates:
+            self.template_listbox.selection_set(self.templates[0].template_id)
 
         # Buttons
         button_frame = ctk.CTkFrame(self)
@@ -341,10 +582,12 @@ class TemplateSelectorDialog(ctk.CTkToplevel):
 
     def _select(self) -> None:
         """Select template."""
-        # Simplified: select first template
-        templates = self.template_manager.get_all_templates()
-        if templates:
-            self.selected_template = templates[0]
+        selection = self.template_listbox.selection()
+        if selection:
+            self.selected_template = next(
+                (t for t in self.templates if t.template_id == selection[0]),
+                None,
+            )
         self.destroy()
 
     def _cancel(self) -> None:
@@ -11,13 +11,21 @@ This module provides a sophisticated workspace system with:
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox, simpledialog
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Callable, Any, Dict
+from typing import TYPE_CHECKING, Optional, Callable, Any, Dict, List, Set, Tuple
 import logging
+import os
+import queue
+import threading
+import time
 
 from gui.core.observer import Observer
 from gui.core.events import Event, EventType, EventBus
-from gui.core.state import AppState, ConversionState, ConversionStatus
+from gui.core.state import AppState, ConversionState, ConversionStatus, StateManager
 from gui.core.workspace import WorkspaceManager, WorkspaceState, WorkspaceStatus
 from gui.components.ctk_components import (
     CTkSidebar,
@@ -27,20 +35,66 @@ from gui.components.ctk_components import (
     CTkTooltip,
     CTkAnimatedButton,
 )
-from gui.components.workspace_tabs import WorkspaceTabsContainer
-from gui.components.split_view import SplitView
+from gui.components.workspace_tabs import WorkspaceTabsContainer, WorkspaceTabsTreeview
+
+if TYPE_CHECKING:
+    from gui.components.split_view import SplitView
 
 logger = logging.getLogger(__name__)
 
+# Workspace views kept alive; older hidden ones are rebuilt when shown
+MAX_LIVE_VIEWS = 4
+# Seconds an input file existence check is reused for
+STAT_CACHE_TTL = 0.5
+# Minimum delay between progress repaints (~30 fps)
+PROGRESS_THROTTLE_MS = 33
+# Interval at which queued UI callbacks are drained on the Tk thread
+UI_QUEUE_POLL_MS = 16
+# Results longer than this are shown through a sliding window of lines
+RESULT_WINDOW_LINES = 1000
+# Lines left before the window edge that trigger re-centering
+RESULT_OVERSCAN_LINES = 200
+# Above this many workspaces the tabs are shown as a Treeview list
+TREE_TABS_THRESHOLD = 20
+
+# File types offered by the input and output browse dialogs
+_INPUT_FILETYPES = (
+    ("All Supported", "*.pdf;*.docx;*.pptx;*.xlsx;*.html;*.csv;*.json;*.xml;*.jpg;*.png;*.mp3;*.wav"),
+    ("PDF", "*.pdf"),
+    ("Word", "*.docx"),
+    ("PowerPoint", "*.pptx"),
+    ("Excel", "*.xlsx"),
+    ("All Files", "*.*"),
+)
+_OUTPUT_FILETYPES = (("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*"))
+
+# Tk event.state bits for the shortcut modifiers
+_SHIFT_MASK = 0x0001
+_CONTROL_MASK = 0x0004
+
 
 class WorkspaceView(ctk.CTkFrame):
     """View for a single workspace."""
 
+    # Fonts shared by every workspace view, keyed by (size, weight, family)
+    _FONTS: Dict[Tuple[int, str, Optional[str]], ctk.CTkFont] = {}
+
+    # File selection rows: (label, workspace attribute, variable name, browse handler)
+    _FILE_ROWS = (
+        ("Input File:", "input_file", "input_file_var", "_browse_input_file"),
+        ("Output File:", "output_file", "output_file_var", "_browse_output_file"),
+    )
+
+    # Folder of the last file picked in any view, where browse dialogs open
+    _last_browse_dir: Optional[str] = None
+
     def __init__(
         self,
         master: Any,
         workspace: WorkspaceState,
         event_bus: EventBus,
+        io_pool: Optional[ThreadPoolExecutor] = None,
+        ui_queue: Optional["queue.SimpleQueue[Callable[[], None]]"] = None,
         **kwargs
     ) -> None:
         """
@@ -50,60 +104,60 @@ class WorkspaceView(ctk.CTkFrame):
             master: Parent widget
             workspace: Workspace state
             event_bus: Event bus
+            io_pool: Executor for file checks (checks inline if None)
+            ui_queue: Queue drained on the Tk thread, for io_pool results
             **kwargs: Additional CTkFrame arguments
         """
         super().__init__(master, **kwargs)
         self.workspace = workspace
         self.event_bus = event_bus
+        self.io_pool = io_pool
+        self.ui_queue = ui_queue
+
+        # Recent input existence checks: path -> (exists, monotonic time)
+        self._stat_cache: Dict[str, Tuple[bool, float]] = {}
+
+        # Full result; the textbox only holds _result_window of its lines
+        self._result_source = ""
+        self._result_lines: List[str] = []
+        self._result_window: Tuple[int, int] = (0, 0)
+        self._recentering = False
 
         self._create_widgets()
 
+    def _font(self, size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+        """
+        Get a shared font for the given spec.
+        
+        Args:
+            size: Font size
+            weight: "normal" or "bold"
+            family: Font family (None for the theme default)
+            
+        Returns:
+            CTkFont shared by every workspace view using the same spec
+        """
+        key = (size, weight, family)
+        font = self._FONTS.get(key)
+        # Fonts belong to one interpreter; a new root window needs new ones
+        if font is None or font._tk is not self.tk:
+            if family is None:
+                font = ctk.CTkFont(size=size, weight=weight)
+            else:
+                font = ctk.CTkFont(family=family, size=size, weight=weight)
+            self._FONTS[key] = font
+        return font
+
     def _create_widgets(self) -> None:
         """Create workspace widgets."""
         # File selection frame
         file_frame = ctk.CTkFrame(self)
         file_frame.pack(fill="x", padx=20, pady=20)
-
-        # Input file
-        input_label = ctk.CTkLabel(file_frame, text="Input File:", font=ctk.CTkFont(size=14))
-        input_label.grid(row=0, column=0, sticky="w", padx=10, pady=10)
-
-        self.input_file_var = ctk.StringVar(value=self.workspace.input_file or "")
-        input_entry = ctk.CTkEntry(
-            file_frame,
-            textvariable=self.input_file_var,
-            width=400,
-        )
-        input_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
         file_frame.grid_columnconfigure(1, weight=1)
 
-        input_browse = CTkAnimatedButton(
-            file_frame,
-            text="Browse...",
-            command=self._browse_input_file,
-            width=100,
-        )
-        input_browse.grid(row=0, column=2, padx=10, pady=10)
-
-        # Output file
-        output_label = ctk.CTkLabel(file_frame, text="Output File:", font=ctk.CTkFont(size=14))
-        output_label.grid(row=1, column=0, sticky="w", padx=10, pady=10)
-
-        self.output_file_var = ctk.StringVar(value=self.workspace.output_file or "")
-        output_entry = ctk.CTkEntry(
-            file_frame,
-            textvariable=self.output_file_var,
-            width=400,
-        )
-        output_entry.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
-
-        output_browse = CTkAnimatedButton(
-            file_frame,
-            text="Browse...",
-            command=self._browse_output_file,
-            width=100,
-        )
-        output_browse.grid(row=1, column=2, padx=10, pady=10)
+        # Input and output file
+        for row, spec in enumerate(self._FILE_ROWS):
+            self._add_file_row(file_frame, row, *spec)
 
         # Control buttons
         control_frame = ctk.CTkFrame(self)
@@ -115,7 +169,7 @@ class WorkspaceView(ctk.CTkFrame):
             command=self._on_convert_clicked,
             width=150,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
         )
         self.convert_button.pack(side="left", padx=10, pady=10)
 
@@ -136,7 +190,7 @@ class WorkspaceView(ctk.CTkFrame):
         self.progress_label = ctk.CTkLabel(
             progress_frame,
             text="Ready",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
         )
         self.progress_label.pack(pady=10)
 
@@ -151,35 +205,69 @@ class WorkspaceView(ctk.CTkFrame):
         result_label = ctk.CTkLabel(
             result_frame,
             text="Result:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
         )
         result_label.pack(anchor="w", padx=10, pady=5)
 
         self.result_text = ctk.CTkTextbox(
             result_frame,
             wrap="word",
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=self._font(11, family="Consolas"),
         )
         self.result_text.pack(fill="both", expand=True, padx=10, pady=10)
+        self.result_text._textbox.configure(yscrollcommand=self._on_result_yview)
+        self.result_text._y_scrollbar.configure(command=self._on_result_scroll)
 
         # Load existing result
         if self.workspace.result_text:
-            self.result_text.insert("1.0", self.workspace.result_text)
+            self.set_result_text(self.workspace.result_text)
+
+    def _add_file_row(
+        self,
+        parent: ctk.CTkFrame,
+        row: int,
+        text: str,
+        attribute: str,
+        var_name: str,
+        handler: str
+    ) -> None:
+        """
+        Create a label, path entry and browse button on one grid row.
+        
+        Args:
+            parent: File selection frame
+            row: Grid row
+            text: Label text
+            attribute: Workspace attribute holding the initial path
+            var_name: Attribute name for the entry's StringVar
+            handler: Name of the browse method
+        """
+        ctk.CTkLabel(parent, text=text, font=self._font(14)).grid(
+            row=row, column=0, sticky="w", padx=10, pady=10
+        )
+
+        var = ctk.StringVar(value=getattr(self.workspace, attribute) or "")
+        setattr(self, var_name, var)
+        ctk.CTkEntry(parent, textvariable=var, width=400).grid(
+            row=row, column=1, padx=10, pady=10, sticky="ew"
+        )
+
+        CTkAnimatedButton(
+            parent,
+            text="Browse...",
+            command=getattr(self, handler),
+            width=100,
+        ).grid(row=row, column=2, padx=10, pady=10)
 
     def _browse_input_file(self) -> None:
         """Browse for input file."""
         file_path = filedialog.askopenfilename(
             title="Select File to Convert",
-            filetypes=[
-                ("All Supported", "*.pdf;*.docx;*.pptx;*.xlsx;*.html;*.csv;*.json;*.xml;*.jpg;*.png;*.mp3;*.wav"),
-                ("PDF", "*.pdf"),
-                ("Word", "*.docx"),
-                ("PowerPoint", "*.pptx"),
-                ("Excel", "*.xlsx"),
-                ("All Files", "*.*")
-            ]
+            filetypes=_INPUT_FILETYPES,
+            initialdir=WorkspaceView._last_browse_dir,
         )
         if file_path:
+            WorkspaceView._last_browse_dir = os.path.dirname(file_path)
             self.input_file_var.set(file_path)
             if not self.output_file_var.get():
                 input_path = Path(file_path)
@@ -191,9 +279,11 @@ class WorkspaceView(ctk.CTkFrame):
         file_path = filedialog.asksaveasfilename(
             title="Save Markdown As",
             defaultextension=".md",
-            filetypes=[("Markdown", "*.md"), ("Text", "*.txt"), ("All Files", "*.*")]
+            filetypes=_OUTPUT_FILETYPES,
+            initialdir=WorkspaceView._last_browse_dir,
         )
         if file_path:
+            WorkspaceView._last_browse_dir = os.path.dirname(file_path)
             self.output_file_var.set(file_path)
 
     def _on_convert_clicked(self) -> None:
@@ -204,8 +294,44 @@ class WorkspaceView(ctk.CTkFrame):
             return
 
         input_path = Path(input_file)
-        if not input_path.exists():
-            messagebox.showerror("File Not Found", f"The file does not exist:\n{input_file}")
+        cached = self._stat_cache.get(str(input_path))
+        if cached is not None and time.monotonic() - cached[1] < STAT_CACHE_TTL:
+            self._post_convert(input_path, cached[0])
+        elif self.io_pool is None or self.ui_queue is None:
+            self._on_input_checked(input_path, input_path.exists())
+        else:
+            # stat can block on network drives; finish on the Tk thread
+            future = self.io_pool.submit(input_path.exists)
+            future.add_done_callback(
+                lambda f: self.ui_queue.put(partial(self._on_input_future, input_path, f))
+            )
+
+    def _on_input_future(self, input_path: Path, future: Future) -> None:
+        """Unwrap a background existence check."""
+        # The view may have been evicted while the check ran
+        if not self.winfo_exists():
+            return
+        try:
+            exists = future.result()
+        except OSError:
+            exists = False
+        self._on_input_checked(input_path, exists)
+
+    def _on_input_checked(self, input_path: Path, exists: bool) -> None:
+        """Cache an existence check and continue the conversion request."""
+        self._stat_cache[str(input_path)] = (exists, time.monotonic())
+        self._post_convert(input_path, exists)
+
+    def _post_convert(self, input_path: Path, exists: bool) -> None:
+        """
+        Request conversion of a checked input file.
+        
+        Args:
+            input_path: Input file
+            exists: Whether the input file exists
+        """
+        if not exists:
+            messagebox.showerror("File Not Found", f"The file does not exist:\n{input_path}")
             return
 
         output_file = self.output_file_var.get().strip()
@@ -238,8 +364,7 @@ class WorkspaceView(ctk.CTkFrame):
         """Update view with new workspace state."""
         self.workspace = workspace
         if workspace.result_text:
-            self.result_text.delete("1.0", "end")
-            self.result_text.insert("1.0", workspace.result_text)
+            self.set_result_text(workspace.result_text)
 
         # Update progress
         if workspace.current_conversion:
@@ -252,6 +377,134 @@ class WorkspaceView(ctk.CTkFrame):
                 self.cancel_button.configure(state="disabled")
 
 
+    def set_result_text(self, text: str) -> None:
+        """
+        Show conversion output in the result view.
+        
+        Only a window of lines around the viewport is inserted into the
+        textbox; the full output is kept in ``_result_lines``. New output
+        replaces any edits made in the textbox, as it always has.
+        
+        Args:
+            text: Markdown output to display
+        """
+        if text == self._result_source:
+            return
+        edited = self.result_text._textbox.edit_modified()
+        if self._result_source and not edited and text.startswith(self._result_source):
+            self._append_result_text(text[len(self._result_source):])
+            return
+        self._result_source = text
+        self._result_lines = text.split("\n") if text else []
+        self._render_result_window(0)
+        self.result_text._textbox.yview_moveto(0.0)
+
+    def _append_result_text(self, suffix: str) -> None:
+        """Extend the result with text appended to the current output."""
+        self._result_source += suffix
+        tail = suffix.split("\n")
+        start, end = self._result_window
+        showing_last_line = end == len(self._result_lines)
+        self._result_lines[-1] += tail[0]
+        self._result_lines.extend(tail[1:])
+        if not showing_last_line:
+            return
+
+        # Only the lines that still fit in the window are inserted
+        new_end = min(len(self._result_lines), start + RESULT_WINDOW_LINES)
+        text = tail[0] + "".join("\n" + line for line in self._result_lines[end:new_end])
+        self._result_window = (start, new_end)
+        self.result_text.insert("end-1c", text)
+        self.result_text._textbox.edit_modified(False)
+
+    def get_result_text(self) -> str:
+        """Get the full result shown by this view, including edits."""
+        self._commit_result_edits()
+        return self._result_source
+
+    def _commit_result_edits(self) -> None:
+        """Fold edits made in the textbox back into the full result."""
+        textbox = self.result_text._textbox
+        if not textbox.edit_modified():
+            return
+        textbox.edit_modified(False)
+
+        edited = textbox.get("1.0", "end-1c")
+        start, end = self._result_window
+        if start == 0 and end == len(self._result_lines):
+            self._result_source = edited
+            self._result_lines = edited.split("\n") if edited else []
+            self._result_window = (0, len(self._result_lines))
+        else:
+            lines = edited.split("\n")
+            self._result_lines[start:end] = lines
+            self._result_source = "\n".join(self._result_lines)
+            self._result_window = (start, start + len(lines))
+
+    def _render_result_window(self, start: int) -> None:
+        """Insert the slice of result lines beginning at start."""
+        total = len(self._result_lines)
+        start = max(0, min(start, total - RESULT_WINDOW_LINES))
+        end = min(total, start + RESULT_WINDOW_LINES)
+        self._result_window = (start, end)
+
+        if start == 0 and end == total:
+            text = self._result_source
+        else:
+            text = "\n".join(self._result_lines[start:end])
+        self.result_text.delete("1.0", "end")
+        self.result_text.insert("1.0", text)
+        self.result_text._textbox.edit_modified(False)
+
+    def _recenter_result_window(self, line: int) -> None:
+        """Re-render the window around a global line and keep it at the top."""
+        # Keep what the user typed in the slice that is about to be replaced
+        self._commit_result_edits()
+        self._recentering = True
+        try:
+            self._render_result_window(line - RESULT_WINDOW_LINES // 2)
+            start, end = self._result_window
+            self.result_text._textbox.yview_moveto((line - start) / max(1, end - start))
+        finally:
+            self._recentering = False
+
+    def _on_result_yview(self, first: str, last: str) -> None:
+        """Map the textbox's local scroll position onto the full result."""
+        scrollbar = self.result_text._y_scrollbar
+        total = len(self._result_lines)
+        start, end = self._result_window
+        if total <= RESULT_WINDOW_LINES:
+            scrollbar.set(first, last)
+            return
+
+        span = end - start
+        top = start + float(first) * span
+        bottom = start + float(last) * span
+        scrollbar.set(top / total, bottom / total)
+
+        if self._recentering:
+            return
+        near_top = start > 0 and top - start < RESULT_OVERSCAN_LINES
+        near_bottom = end < total and end - bottom < RESULT_OVERSCAN_LINES
+        if near_top or near_bottom:
+            self._recenter_result_window(int(top))
+
+    def _on_result_scroll(self, *args: str) -> None:
+        """Handle scrollbar drags against the full result length."""
+        text_widget = self.result_text._textbox
+        total = len(self._result_lines)
+        if total <= RESULT_WINDOW_LINES or args[0] != "moveto":
+            text_widget.yview(*args)
+            return
+
+        line = int(float(args[1]) * total)
+        start, end = self._result_window
+        if start <= line < end - RESULT_OVERSCAN_LINES or (end == total and line >= start):
+            text_widget.yview_moveto((line - start) / max(1, end - start))
+        else:
+            self._recenter_result_window(line)
+
+
 class AdvancedWorkspaceWindow(Observer, ctk.CTk):
     """
     Advanced workspace window with multiple tabs.
@@ -269,7 +522,8 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
         self,
         event_bus: EventBus,
         workspace_manager: Optional[WorkspaceManager] = None,
-        state_update_callback: Optional[Callable[[AppState], None]] = None
+        state_update_callback: Optional[Callable[[AppState], None]] = None,
+        state_manager: Optional[StateManager] = None
     ) -> None:
         """
         Initialize advanced workspace window.
@@ -278,6 +532,7 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
             event_bus: Event bus for communication
             workspace_manager: Workspace manager (creates new if None)
             state_update_callback: Optional callback for state updates
+            state_manager: State manager to follow (optional)
         """
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
@@ -287,23 +542,60 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
         self.state_update_callback = state_update_callback
         self.workspace_manager = workspace_manager or WorkspaceManager()
         self._current_state: Optional[AppState] = None
+        if state_manager is not None:
+            state_manager.attach_observer(self._on_state_changed)
 
-        # Workspace views
-        self.workspace_views: Dict[str, WorkspaceView] = {}
+        # Workspace views, least recently shown first
+        self.workspace_views: "OrderedDict[str, WorkspaceView]" = OrderedDict()
         self.active_workspace_id: Optional[str] = None
 
+        # Workspace order for tab navigation, rebuilt after add/remove
+        self._order_cache: List[str] = []
+        self._order_index: Dict[str, int] = {}
+
+        # Workspace files are written off the Tk thread from snapshots taken on it;
+        # a queued write picks up the newest snapshot (and whether to report it)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ws-save")
+        self._pending_saves: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+        self._save_lock = threading.Lock()
+
+        # Pool results, run by _drain_ui_queue on the Tk thread
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+
+        # Latest progress per workspace, repainted once per throttle interval
+        self._pending_progress: Dict[str, float] = {}
+        self._progress_flush_scheduled = False
+
+        # What each workspace tab last showed, to skip redundant refreshes
+        self._last_tab_state: Dict[str, Tuple[WorkspaceStatus, str, str, str]] = {}
+
         # Split view
         self.split_view_enabled = False
-        self.comparison_workspaces: list[str] = []
-        self.split_view: Optional[SplitView] = None
+        self.comparison_workspaces: Set[str] = set()
+        self.split_view: Optional["SplitView"] = None
 
         self._setup_window()
         self._create_layout()
         self._setup_event_listeners()
         self._setup_keyboard_shortcuts()
 
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
         logger.info("Advanced workspace window initialized")
 
+    def _drain_ui_queue(self) -> None:
+        """Run every callback queued by pool threads, then reschedule."""
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in UI callback: {e}", exc_info=True)
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
     def _setup_window(self) -> None:
         """Configure window properties."""
         self.title("MarkItDown - Advanced Workspace")
@@ -320,14 +612,11 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
         self.top_bar.grid(row=0, column=0, columnspan=3, sticky="ew", padx=0, pady=0)
 
         # Workspace tabs
-        self.tabs_container = WorkspaceTabsContainer(
-            self,
-            self.workspace_manager,
-            on_workspace_selected=self._on_workspace_selected,
-            on_workspace_closed=self._on_workspace_closed,
-            on_new_workspace=self._on_new_workspace,
+        self._build_tabs_container(
+            WorkspaceTabsTreeview
+            if len(self.workspace_manager.workspaces) > TREE_TABS_THRESHOLD
+            else WorkspaceTabsContainer
         )
-        self.tabs_container.grid(row=1, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
 
         # Main workspace area (can switch between single and split view)
         self.workspace_container = ctk.CTkFrame(self)
@@ -335,16 +624,6 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
         self.workspace_container.grid_columnconfigure(0, weight=1)
         self.workspace_container.grid_rowconfigure(0, weight=1)
 
-        # Split view toggle button (in sidebar or toolbar)
-        self.split_view_button = ctk.CTkButton(
-            self.tabs_container,
-            text="Split",
-            width=60,
-            height=30,
-            command=self._toggle_split_view,
-        )
-        self.split_view_button.pack(side="right", padx=5, pady=5)
-
         # Status bar
         self.status_bar = CTkStatusBar(self)
         self.status_bar.grid(row=3, column=0, columnspan=3, sticky="ew", padx=0, pady=0)
@@ -354,9 +633,56 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
         if active_id:
             self._show_workspace(active_id)
         elif self.workspace_manager.workspaces:
-            first_id = list(self.workspace_manager.workspaces.keys())[0]
+            first_id = next(iter(self.workspace_manager.workspaces))
             self._show_workspace(first_id)
 
+    def _build_tabs_container(self, tabs_class: type) -> None:
+        """
+        Create the workspace tabs and the split view button they hold.
+        
+        Args:
+            tabs_class: WorkspaceTabsContainer or WorkspaceTabsTreeview
+        """
+        self.tabs_container = tabs_class(
+            self,
+            self.workspace_manager,
+            on_workspace_selected=self._on_workspace_selected,
+            on_workspace_closed=self._on_workspace_closed,
+            on_new_workspace=self._on_new_workspace,
+        )
+        self.tabs_container.grid(row=1, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
+
+        # Split view toggle button (in sidebar or toolbar)
+        self.split_view_button = ctk.CTkButton(
+            self.tabs_container,
+            text="Single" if self.split_view_enabled else "Split",
+            width=60,
+            height=30,
+            command=self._toggle_split_view,
+        )
+        self.split_view_button.pack(side="right", padx=5, pady=5)
+
+    def _add_workspace_tab(self, workspace: WorkspaceState) -> None:
+        """
+        Add a tab for a new workspace.
+        
+        Past TREE_TABS_THRESHOLD workspaces the per-tab frames are replaced
+        by the Treeview, which then stays even if workspaces are closed.
+        
+        Args:
+            workspace: Workspace just added to the manager
+        """
+        if (
+            len(self.workspace_manager.workspaces) > TREE_TABS_THRESHOLD
+            and not isinstance(self.tabs_container, WorkspaceTabsTreeview)
+        ):
+            # The Treeview loads every workspace, including the new one
+            self.tabs_container.destroy()
+            self._build_tabs_container(WorkspaceTabsTreeview)
+            self._last_tab_state.clear()
+        else:
+            self.tabs_container.add_workspace(workspace)
+
     def _setup_event_listeners(self) -> None:
         """Set up event bus listeners."""
         self.event_bus.subscribe(EventType.CONVERSION_STARTED, self._on_conversion_started)
@@ -366,25 +692,26 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
 
     def _setup_keyboard_shortcuts(self) -> None:
         """Set up keyboard shortcuts."""
-        # Ctrl+T - New workspace
-        self.bind("<Control-t>", lambda e: self._on_new_workspace())
-        self.bind("<Control-T>", lambda e: self._on_new_workspace())
-
-        # Ctrl+W - Close workspace
-        self.bind("<Control-w>", lambda e: self._on_close_active_workspace())
-        self.bind("<Control-W>", lambda e: self._on_close_active_workspace())
-
-        # Ctrl+Tab - Next workspace
-        self.bind("<Control-Tab>", lambda e: self._on_next_workspace())
-        self.bind("<Control-ISO_Left_Tab>", lambda e: self._on_previous_workspace())
-
-        # Ctrl+S - Save workspace
-        self.bind("<Control-s>", lambda e: self._save_active_workspace())
-        self.bind("<Control-S>", lambda e: self._save_active_workspace())
-
-        # Ctrl+Shift+S - Toggle split view
-        self.bind("<Control-Shift-s>", lambda e: self._toggle_split_view())
-        self.bind("<Control-Shift-S>", lambda e: self._toggle_split_view())
+        ctrl = _CONTROL_MASK
+        ctrl_shift = _CONTROL_MASK | _SHIFT_MASK
+        # (modifiers, lowercase keysym) -> handler
+        self._keymap: Dict[Tuple[int, str], Callable[[], None]] = {
+            (ctrl, "t"): self._on_new_workspace,
+            (ctrl, "w"): self._on_close_active_workspace,
+            (ctrl, "tab"): self._on_next_workspace,
+            (ctrl_shift, "tab"): self._on_previous_workspace,
+            (ctrl_shift, "iso_left_tab"): self._on_previous_workspace,
+            (ctrl, "s"): self._save_active_workspace,
+            (ctrl_shift, "s"): self._toggle_split_view,
+        }
+        self.bind("<Key>", self._dispatch_key)
+
+    def _dispatch_key(self, event: Any) -> None:
+        """Run the shortcut matching a key press, if any."""
+        modifiers = event.state & (_CONTROL_MASK | _SHIFT_MASK)
+        handler = self._keymap.get((modifiers, event.keysym.lower()))
+        if handler is not None:
+            handler()
 
     def _on_workspace_selected(self, workspace_id: str) -> None:
         """Handle workspace selection."""
@@ -392,7 +719,11 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
 
     def _on_workspace_closed(self, workspace_id: str) -> None:
         """Handle workspace close."""
-        # Confirmation
+        # Prompt once the current callback has returned, not from inside it
+        self.after(0, self._confirm_close, workspace_id)
+
+    def _confirm_close(self, workspace_id: str) -> None:
+        """Confirm and close a workspace."""
         workspace = self.workspace_manager.get_workspace(workspace_id)
         if workspace:
             if messagebox.askyesno(
@@ -400,14 +731,16 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
                 f"Close workspace '{workspace.name}'?\nUnsaved changes will be lost."
             ):
                 self.workspace_manager.remove_workspace(workspace_id)
+                self._invalidate_order()
                 self.tabs_container.remove_workspace(workspace_id)
+                self._last_tab_state.pop(workspace_id, None)
                 if workspace_id in self.workspace_views:
                     self.workspace_views[workspace_id].destroy()
                     del self.workspace_views[workspace_id]
 
                 # Show another workspace
                 if self.workspace_manager.workspaces:
-                    first_id = list(self.workspace_manager.workspaces.keys())[0]
+                    first_id = next(iter(self.workspace_manager.workspaces))
                     self._show_workspace(first_id)
 
     def _on_new_workspace(self) -> None:
@@ -419,7 +752,8 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
         )
         if name:
             workspace = self.workspace_manager.create_workspace(name=name)
-            self.tabs_container.add_workspace(workspace)
+            self._invalidate_order()
+            self._add_workspace_tab(workspace)
             self._show_workspace(workspace.workspace_id)
 
     def _on_close_active_workspace(self) -> None:
@@ -429,25 +763,37 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
 
     def _on_next_workspace(self) -> None:
         """Switch to next workspace."""
-        workspaces = self.workspace_manager.get_workspaces_in_order()
-        if len(workspaces) > 1:
-            current_index = next(
-                (i for i, w in enumerate(workspaces) if w.workspace_id == self.active_workspace_id),
-                0
-            )
-            next_index = (current_index + 1) % len(workspaces)
-            self._show_workspace(workspaces[next_index].workspace_id)
+        self._step_workspace(1)
 
     def _on_previous_workspace(self) -> None:
         """Switch to previous workspace."""
-        workspaces = self.workspace_manager.get_workspaces_in_order()
-        if len(workspaces) > 1:
-            current_index = next(
-                (i for i, w in enumerate(workspaces) if w.workspace_id == self.active_workspace_id),
-                0
-            )
-            prev_index = (current_index - 1) % len(workspaces)
-            self._show_workspace(workspaces[prev_index].workspace_id)
+        self._step_workspace(-1)
+
+    def _step_workspace(self, offset: int) -> None:
+        """
+        Switch to the workspace at an offset from the active one.
+        
+        Args:
+            offset: Positions to move in tab order (wraps around)
+        """
+        self._ensure_order()
+        order = self._order_cache
+        if len(order) > 1:
+            current_index = self._order_index.get(self.active_workspace_id, 0)
+            self._show_workspace(order[(current_index + offset) % len(order)])
+
+    def _ensure_order(self) -> None:
+        """Build the workspace order cache if it was invalidated."""
+        if not self._order_cache:
+            self._order_cache = [
+                w.workspace_id for w in self.workspace_manager.get_workspaces_in_order()
+            ]
+            self._order_index = {wid: i for i, wid in enumerate(self._order_cache)}
+
+    def _invalidate_order(self) -> None:
+        """Drop the workspace order cache after workspaces change."""
+        self._order_cache = []
+        self._order_index = {}
 
     def _show_workspace(self, workspace_id: str) -> None:
         """Show workspace view."""
@@ -460,21 +806,48 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
             view.grid_remove()
 
         # Show or create workspace view
-        if workspace_id not in self.workspace_views:
+        view = self.workspace_views.get(workspace_id)
+        if view is None:
             view = WorkspaceView(
                 self.workspace_container,
                 workspace,
                 self.event_bus,
+                io_pool=self._io_pool,
+                ui_queue=self._ui_queue,
             )
             view.grid(row=0, column=0, sticky="nsew")
             self.workspace_views[workspace_id] = view
         else:
-            self.workspace_views[workspace_id].grid(row=0, column=0, sticky="nsew")
-            self.workspace_views[workspace_id].update_workspace(workspace)
+            view.grid(row=0, column=0, sticky="nsew")
+            view.update_workspace(workspace)
+        self.workspace_views.move_to_end(workspace_id)
+        self._evict_views()
 
         self.active_workspace_id = workspace_id
         self.tabs_container.set_active_tab(workspace_id)
 
+    def _evict_views(self) -> None:
+        """Destroy the least recently shown views beyond MAX_LIVE_VIEWS."""
+        while len(self.workspace_views) > MAX_LIVE_VIEWS:
+            workspace_id, view = self.workspace_views.popitem(last=False)
+            workspace = self.workspace_manager.get_workspace(workspace_id)
+            if workspace:
+                self._sync_view_to_state(view, workspace)
+            view.destroy()
+
+    def _sync_view_to_state(self, view: WorkspaceView, workspace: WorkspaceState) -> None:
+        """
+        Copy a view's editable fields back into its workspace state.
+        
+        Args:
+            view: Workspace view
+            workspace: Workspace state to update
+        """
+        workspace.input_file = view.input_file_var.get()
+        workspace.output_file = view.output_file_var.get()
+        # The result box only holds a slice; the view folds edits into the full text
+        workspace.result_text = view.get_result_text()
+
     def _save_active_workspace(self) -> None:
         """Save active workspace."""
         if self.active_workspace_id:
@@ -483,11 +856,55 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
                 view = self.workspace_views[self.active_workspace_id]
                 workspace = self.workspace_manager.get_workspace(self.active_workspace_id)
                 if workspace:
-                    workspace.input_file = view.input_file_var.get()
-                    workspace.output_file = view.output_file_var.get()
-                    workspace.result_text = view.result_text.get("1.0", "end-1c")
+                    self._sync_view_to_state(view, workspace)
+
+            self._queue_save(self.active_workspace_id, report=True)
+            self.status_bar.set_status("Saving workspace...")
+
+    def _queue_save(self, workspace_id: str, report: bool = False) -> None:
+        """
+        Save a workspace in the background.
+        
+        The workspace is copied here, on the Tk thread; only the file write
+        runs in the I/O pool. If a write for it is still queued, that write
+        takes the new copy instead of queueing another.
+        
+        Args:
+            workspace_id: Workspace ID to save
+            report: Show "Workspace saved" once the write succeeds
+        """
+        data = self.workspace_manager.snapshot_workspace(workspace_id)
+        if data is None:
+            return
+
+        with self._save_lock:
+            queued = self._pending_saves.get(workspace_id)
+            if queued is not None:
+                report = report or queued[1]
+            self._pending_saves[workspace_id] = (data, report)
+        if queued is None:
+            future = self._io_pool.submit(self._do_save, workspace_id)
+            future.add_done_callback(
+                lambda f: self._ui_queue.put(partial(self._on_save_done, workspace_id, f))
+            )
 
-            self.workspace_manager.save_workspace(self.active_workspace_id)
+    def _do_save(self, workspace_id: str) -> bool:
+        """Write the newest snapshot of a workspace (runs in the I/O pool)."""
+        # Taken first so changes made during the write queue another save
+        with self._save_lock:
+            data, report = self._pending_saves.pop(workspace_id)
+        self.workspace_manager.write_workspace(workspace_id, data)
+        return report
+
+    def _on_save_done(self, workspace_id: str, future: Future) -> None:
+        """Report the outcome of a background save."""
+        try:
+            report = future.result()
+        except Exception as e:
+            logger.error(f"Failed to save workspace {workspace_id}: {e}")
+            self.status_bar.set_status(f"Failed to save workspace: {e}")
+            return
+        if report:
             self.status_bar.set_status("Workspace saved")
 
     def _toggle_split_view(self) -> None:
@@ -497,6 +914,7 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
             if self.split_view:
                 self.split_view.destroy()
                 self.split_view = None
+            self.comparison_workspaces.clear()
             self.split_view_enabled = False
             self.split_view_button.configure(text="Split")
             
@@ -509,7 +927,9 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
             for view in self.workspace_views.values():
                 view.grid_remove()
 
-            # Create split view
+            # Create split view; imported here since most sessions never use it
+            from gui.components.split_view import SplitView
+
             self.split_view = SplitView(
                 self.workspace_container,
                 on_close=self._toggle_split_view,
@@ -518,9 +938,10 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
 
             # Add workspaces with results to split view
             workspaces = self.workspace_manager.get_workspaces_in_order()
-            for workspace in workspaces[:3]:  # Limit to 3 for comparison
+            for workspace in islice(workspaces, 3):  # Limit to 3 for comparison
                 if workspace.result_text:
                     self.split_view.add_workspace(workspace)
+                    self.comparison_workspaces.add(workspace.workspace_id)
 
             self.split_view_enabled = True
             self.split_view_button.configure(text="Single")
@@ -533,16 +954,26 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
             workspace = self.workspace_manager.get_workspace(workspace_id)
             if workspace:
                 workspace.status = WorkspaceStatus.PROCESSING
-                self.tabs_container.update_workspace_tab(workspace_id)
+                self._refresh_tab(workspace)
 
     def _on_conversion_progress(self, event: Event) -> None:
         """Handle conversion progress."""
         workspace_id = event.get("workspace_id")
         if workspace_id and workspace_id in self.workspace_views:
-            view = self.workspace_views[workspace_id]
-            progress = event.get("progress", 0.0)
-            view.progress_bar.set(progress)
-            view.progress_label.configure(text=f"Converting... {int(progress * 100)}%")
+            self._pending_progress[workspace_id] = event.get("progress", 0.0)
+            if not self._progress_flush_scheduled:
+                self._progress_flush_scheduled = True
+                self.after(PROGRESS_THROTTLE_MS, self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        """Repaint the latest progress of each workspace that reported any."""
+        self._progress_flush_scheduled = False
+        pending, self._pending_progress = self._pending_progress, {}
+        for workspace_id, progress in pending.items():
+            view = self.workspace_views.get(workspace_id)
+            if view is not None:
+                view.progress_bar.set(progress)
+                view.progress_label.configure(text=f"Converting... {int(progress * 100)}%")
 
     def _on_conversion_completed(self, event: Event) -> None:
         """Handle conversion completed."""
@@ -555,12 +986,12 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
                 # Update result text from conversion
                 if workspace.current_conversion and workspace.current_conversion.result_text:
                     workspace.result_text = workspace.current_conversion.result_text
-                self.workspace_manager.save_workspace(workspace_id)
-                self.tabs_container.update_workspace_tab(workspace_id)
+                self._queue_save(workspace_id)
+                self._refresh_tab(workspace)
                 if workspace_id in self.workspace_views:
                     self.workspace_views[workspace_id].update_workspace(workspace)
                 # Update split view if enabled
-                if self.split_view_enabled and self.split_view:
+                if self.split_view and workspace_id in self.comparison_workspaces:
                     self.split_view.update_workspace(workspace)
 
     def _on_conversion_failed(self, event: Event) -> None:
@@ -572,8 +1003,29 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
                 workspace.status = WorkspaceStatus.ERROR
                 workspace.error_message = event.get("error", "Unknown error")
                 workspace.update_status()
-                self.workspace_manager.save_workspace(workspace_id)
-                self.tabs_container.update_workspace_tab(workspace_id)
+                self._queue_save(workspace_id)
+                self._refresh_tab(workspace)
+
+    def _refresh_tab(self, workspace: WorkspaceState) -> None:
+        """
+        Refresh a workspace tab if what it shows has changed.
+        
+        Args:
+            workspace: Workspace whose tab to refresh
+        """
+        tab_state = (
+            workspace.status,
+            workspace.error_message or "",
+            workspace.name,
+            workspace.color,
+        )
+        if self._last_tab_state.get(workspace.workspace_id) != tab_state:
+            self._last_tab_state[workspace.workspace_id] = tab_state
+            self.tabs_container.update_workspace_tab(workspace.workspace_id)
+
+    def _on_state_changed(self, subject: Any, state: AppState) -> None:
+        """Store the state notified by the state manager."""
+        self._current_state = state
 
     def update(self, subject: Any, event: Optional[Any] = None) -> None:
         """Update from Observer pattern."""
@@ -585,6 +1037,7 @@ class AdvancedWorkspaceWindow(Observer, ctk.CTk):
         logger.info("Starting advanced workspace window")
         self.mainloop()
 
-        # Save all workspaces on exit
+        # Let queued saves finish, then save all workspaces on exit
+        self._io_pool.shutdown(wait=True)
         self.workspace_manager.save_all()
 
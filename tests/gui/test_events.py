@@ -2,6 +2,8 @@
 Tests for the event system.
 """
 
+import threading
+
 import pytest
 from gui.core.events import Event, EventType, EventBus
 
@@ -161,3 +163,112 @@ def test_event_bus_duplicate_subscribe() -> None:
     with pytest.raises(ValueError, match="already subscribed"):
         event_bus.subscribe(EventType.CONVERSION_STARTED, handler)
 
+
+
+def test_event_bus_unsubscribe_during_emit() -> None:
+    """Test that a subscriber removing itself doesn't skip the next one."""
+    event_bus = EventBus()
+    calls = []
+
+    def first(event: Event) -> None:
+        """Unsubscribes itself on first call."""
+        calls.append("first")
+        event_bus.unsubscribe(EventType.CONVERSION_STARTED, first)
+
+    def second(event: Event) -> None:
+        """Event handler."""
+        calls.append("second")
+
+    event_bus.subscribe(EventType.CONVERSION_STARTED, first)
+    event_bus.subscribe(EventType.CONVERSION_STARTED, second)
+    event_bus.emit(Event(EventType.CONVERSION_STARTED, {}))
+    event_bus.emit(Event(EventType.CONVERSION_STARTED, {}))
+
+    assert calls == ["first", "second", "second"]
+    assert event_bus.subscriber_count == 1
+
+
+def test_event_bus_scope_subscriber() -> None:
+    """Test subscribing to every event type under a scope."""
+    event_bus = EventBus()
+    received = []
+
+    def handler(event: Event) -> None:
+        """Event handler."""
+        received.append(event.event_type)
+
+    event_bus.subscribe_scope("conversion", handler)
+    event_bus.emit(Event(EventType.CONVERSION_STARTED, {}))
+    event_bus.emit(Event(EventType.CONVERSION_PROGRESS, {}))
+    event_bus.emit(Event(EventType.FILE_SELECTED, {}))
+
+    assert received == [EventType.CONVERSION_STARTED, EventType.CONVERSION_PROGRESS]
+    assert event_bus.subscriber_count == 1
+
+    event_bus.unsubscribe_scope("conversion", handler)
+    event_bus.emit(Event(EventType.CONVERSION_STARTED, {}))
+
+    assert len(received) == 2
+    assert event_bus.subscriber_count == 0
+
+    with pytest.raises(ValueError, match="No event types"):
+        event_bus.subscribe_scope("conv", handler)
+
+
+def test_event_bus_subscribe_after_emit() -> None:
+    """Test that subscribers added after an emit receive later events."""
+    event_bus = EventBus()
+    received = []
+
+    def handler(event: Event) -> None:
+        """Event handler."""
+        received.append("specific")
+
+    def global_handler(event: Event) -> None:
+        """Global event handler."""
+        received.append("global")
+
+    event_bus.emit(Event(EventType.FILE_SELECTED, {}))
+    event_bus.subscribe(EventType.FILE_SELECTED, handler)
+    event_bus.emit(Event(EventType.FILE_SELECTED, {}))
+    event_bus.subscribe(EventType.FILE_SELECTED, global_handler, global_subscriber=True)
+    event_bus.emit(Event(EventType.FILE_SELECTED, {}))
+    event_bus.unsubscribe(EventType.FILE_SELECTED, handler)
+    event_bus.emit(Event(EventType.FILE_SELECTED, {}))
+
+    assert received == ["specific", "specific", "global", "global"]
+
+
+def test_event_bus_unsubscribe_while_building_dispatch() -> None:
+    """Test that an unsubscribe racing an emit does not leave a stale cache entry."""
+    event_bus = EventBus()
+    received = []
+    workers = []
+
+    def handler(event: Event) -> None:
+        """Event handler."""
+        received.append(event)
+
+    class RacingSubscribers(dict):
+        """Unsubscribes on another thread while emit reads the subscribers."""
+
+        def get(self, *args):
+            value = super().get(*args)
+            if not workers:
+                worker = threading.Thread(
+                    target=event_bus.unsubscribe, args=(EventType.FILE_SELECTED, handler)
+                )
+                workers.append(worker)
+                worker.start()
+                worker.join(timeout=0.2)
+            return value
+
+    event_bus.subscribe(EventType.FILE_SELECTED, handler)
+    event_bus._subscribers = RacingSubscribers(event_bus._subscribers)
+
+    # Delivered from the subscribers read before the unsubscribe
+    event_bus.emit(Event(EventType.FILE_SELECTED, {}))
+    workers[0].join()
+    event_bus.emit(Event(EventType.FILE_SELECTED, {}))
+
+    assert len(received) == 1
@@ -0,0 +1,40 @@
+"""
+Tests for the main window.
+"""
+
+import queue
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from gui.core.state import AppState
+from gui.views.main_window import MainWindow
+
+
+def test_main_window_update_off_main_thread():
+    """Test that state notifications from a worker thread only queue UI work."""
+    rendered = []
+    window = SimpleNamespace(
+        _current_state=None,
+        _ui_queue=queue.SimpleQueue(),
+        _update_ui_from_state=lambda state: rendered.append(
+            (state, threading.current_thread())
+        ),
+    )
+    state = AppState()
+
+    worker = threading.Thread(target=MainWindow.update, args=(window, None, state))
+    worker.start()
+    worker.join()
+
+    # Nothing was rendered on the worker thread
+    assert rendered == []
+    assert window._current_state is state
+
+    # Draining the queue renders on the calling (Tk) thread
+    window._ui_queue.get_nowait()()
+    assert rendered == [(state, threading.current_thread())]
+    assert window._ui_queue.empty()
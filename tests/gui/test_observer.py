@@ -130,6 +130,45 @@ def test_observer_duplicate_attach() -> None:
         observable.attach(observer)
 
 
+def test_observer_detach_during_notify() -> None:
+    """Test that an observer detaching itself mid-notify does not skip the next one."""
+    observable = TestObservable()
+    observer2 = TestObserver()
+
+    class OneShotObserver(TestObserver):
+        """Observer that detaches itself after the first update."""
+
+        def update(self, subject: Observable, event=None) -> None:
+            """Record the update and detach."""
+            super().update(subject, event)
+            subject.detach(self)
+
+    observer1 = OneShotObserver()
+    observable.attach(observer1)
+    observable.attach(observer2)
+
+    observable.increment()
+    assert observer1.update_count == 1
+    assert observer2.update_count == 1
+
+    observable.increment()
+    assert observer1.update_count == 1
+    assert observer2.update_count == 2
+
+
+def test_observer_released_when_discarded() -> None:
+    """Test that observers are held weakly."""
+    observable = TestObservable()
+    observer = TestObserver()
+
+    observable.attach(observer)
+    assert observable.observer_count == 1
+
+    del observer
+    assert observable.observer_count == 0
+    observable.increment()
+
+
 def test_event_observer() -> None:
     """Test EventObserver integration."""
     from gui.core.events import EventBus, Event, EventType
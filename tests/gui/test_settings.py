@@ -186,6 +186,42 @@ def test_i18n_strings(temp_config_dir, default_config_file):
     
     assert en_text == "Convert"
     assert pt_text == "Converter"
+    
+    # Missing and partial keys fall back to the key itself
+    assert manager.get_i18n_string("ui.missing", Language.ENGLISH) == "ui.missing"
+    assert manager.get_i18n_string("ui", Language.ENGLISH) == "ui"
+    
+    # Translations are still indexed after reloading from disk
+    reloaded = SettingsManager(config_dir=temp_config_dir)
+    assert reloaded.get_i18n_string("ui.convert_button", Language.PORTUGUESE) == "Converter"
+    
+    # Changes through update() and replaced settings are picked up
+    manager.update(i18n__en__ui__convert_button="Go")
+    assert manager.get_i18n_string("ui.convert_button", Language.ENGLISH) == "Go"
+    
+    replaced = manager.get().to_dict()
+    replaced["i18n"] = {"en": {"ui": {"convert_button": "Run"}}}
+    manager.settings = AppSettings.from_dict(replaced)
+    assert manager.get_i18n_string("ui.convert_button", Language.ENGLISH) == "Run"
+
+
+def test_deferred_save(temp_config_dir, default_config_file):
+    """Test that saves inside deferred_save() are written once on exit."""
+    manager = SettingsManager(config_dir=temp_config_dir)
+    
+    settings = manager.get()
+    
+    with manager.deferred_save():
+        settings.ui.window_width = 1024
+        manager.save(settings)
+        settings.ui.window_height = 768
+        manager.save(settings)
+        assert not manager.user_config_path.exists()
+        assert manager.get().ui.window_width == 1024
+    
+    reloaded = SettingsManager(config_dir=temp_config_dir)
+    assert reloaded.get().ui.window_width == 1024
+    assert reloaded.get().ui.window_height == 768
 
 
 def test_settings_validation(temp_config_dir, default_config_file):
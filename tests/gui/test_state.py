@@ -4,6 +4,7 @@ Tests for state management.
 
 import pytest
 from pathlib import Path
+from typing import Callable
 from gui.core.state import (
     AppState,
     ConversionState,
@@ -135,6 +136,58 @@ def test_state_manager_callback() -> None:
     assert len(updates) == 1
 
 
+def test_state_manager_skips_unchanged_updates() -> None:
+    """Test that updates leaving the state as it was are not notified."""
+    manager = StateManager()
+    updates = []
+    manager.attach_observer(lambda subject, event: updates.append(event))
+
+    def set_dark(state: AppState) -> None:
+        state.theme = "dark"
+
+    def touch_history(state: AppState) -> None:
+        state.conversion_history.sort(key=str)
+
+    manager.update_state(set_dark)
+    manager.update_state(set_dark)
+    manager.update_state(touch_history)
+    assert len(updates) == 1
+
+    manager.update_state(set_dark, force=True)
+    assert len(updates) == 2
+
+    manager.undo()
+    assert manager.state.theme == "dark"
+    manager.undo()
+    assert manager.state.theme == "default"
+    assert not manager.can_undo()
+
+
+def test_state_manager_batch() -> None:
+    """Test that a batch notifies once and undoes as one step."""
+    manager = StateManager()
+    updates = []
+    manager.attach_observer(lambda subject, event: updates.append(event))
+
+    def set_theme(theme: str) -> Callable[[AppState], None]:
+        def updater(state: AppState) -> None:
+            state.theme = theme
+        return updater
+
+    with manager.batch():
+        manager.update_state(set_theme("dark"))
+        with manager.batch():
+            manager.update_state(set_theme("light"))
+        assert updates == []
+
+    assert len(updates) == 1
+    assert manager.state.theme == "light"
+
+    manager.undo()
+    assert manager.state.theme == "default"
+    assert not manager.can_undo()
+
+
 def test_state_manager_undo() -> None:
     """Test state undo functionality."""
     manager = StateManager()
@@ -160,6 +213,28 @@ def test_state_manager_undo() -> None:
     assert not manager.can_undo()
 
 
+def test_state_manager_undo_in_place_changes() -> None:
+    """Test undoing updaters that mutate nested state in place."""
+    manager = StateManager()
+    conversion = manager.state.current_conversion
+
+    def updater(state: AppState) -> None:
+        state.add_recent_file(Path("a.pdf"))
+        state.set_setting("key", "value")
+        state.current_conversion.progress = 0.5
+
+    manager.update_state(updater)
+    assert manager.state.recent_files == [Path("a.pdf")]
+    assert manager.state.get_setting("key") == "value"
+    assert manager.state.current_conversion is conversion
+    assert conversion.progress == 0.5
+
+    manager.undo()
+    assert manager.state.recent_files == []
+    assert manager.state.get_setting("key") is None
+    assert manager.state.current_conversion.progress == 0.0
+
+
 def test_state_manager_conversion_state() -> None:
     """Test conversion state management."""
     manager = StateManager()
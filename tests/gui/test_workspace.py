@@ -0,0 +1,33 @@
+"""
+Tests for the workspace manager.
+"""
+
+import json
+from pathlib import Path
+
+from gui.core.workspace import WorkspaceManager, WorkspaceState
+
+
+def test_workspace_snapshot_is_detached(tmp_path: Path):
+    """Test that a snapshot is not affected by later changes to the workspace."""
+    manager = WorkspaceManager(storage_path=tmp_path)
+    workspace = manager.create_workspace(name="Docs")
+    workspace.result_text = "# Before"
+
+    data = manager.snapshot_workspace(workspace.workspace_id)
+    workspace.result_text = "# After"
+    workspace.name = "Renamed"
+
+    manager.write_workspace(workspace.workspace_id, data)
+
+    saved = json.loads((tmp_path / f"{workspace.workspace_id}.json").read_text())
+    assert saved["result_text"] == "# Before"
+    assert WorkspaceState.from_dict(saved).name == "Docs"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_workspace_snapshot_missing(tmp_path: Path):
+    """Test that unknown workspaces cannot be saved."""
+    manager = WorkspaceManager(storage_path=tmp_path)
+    assert manager.snapshot_workspace("missing") is None
+    assert manager.save_workspace("missing") is False